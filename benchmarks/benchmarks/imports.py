@@ -0,0 +1,14 @@
+"""
+ASV benchmarks for the time to import pvlib and its modules.
+"""
+
+
+class ImportTime:
+    # each timeraw benchmark runs in a fresh interpreter, so nothing is
+    # already in sys.modules
+    params = ['pvlib', 'pvlib.irradiance', 'pvlib.solarposition',
+              'pvlib.pvsystem', 'pvlib.modelchain', 'pvlib.iotools']
+    param_names = ['module']
+
+    def timeraw_import(self, module):
+        return f"import {module}"
@@ -2,8 +2,9 @@
 ASV benchmarks for irradiance.py
 """
 
+import numpy as np
 import pandas as pd
-from pvlib import irradiance, location
+from pvlib import irradiance, location, solarposition
 
 
 class Irradiance:
@@ -24,11 +25,25 @@ class Irradiance:
     def time_get_extra_radiation(self):
         irradiance.get_extra_radiation(self.days)
 
+    def time_get_extra_radiation_1min(self):
+        irradiance.get_extra_radiation(self.times)
+
     def time_aoi(self):
         irradiance.aoi(self.tilt, self.azimuth,
                        self.solar_position.apparent_zenith,
                        self.solar_position.azimuth)
 
+    def time_aoi_solar_vector(self):
+        if not hasattr(irradiance, 'solar_unit_vector'):
+            raise NotImplementedError
+        solar_vector = irradiance.solar_unit_vector(
+            self.solar_position.apparent_zenith, self.solar_position.azimuth)
+        for surface_azimuth in (90, 180, 270):
+            irradiance.aoi(self.tilt, surface_azimuth,
+                           self.solar_position.apparent_zenith,
+                           self.solar_position.azimuth,
+                           solar_vector=solar_vector)
+
     def time_aoi_projection(self):
         irradiance.aoi_projection(self.tilt, self.azimuth,
                                   self.solar_position.apparent_zenith,
@@ -66,3 +81,173 @@ class Irradiance:
         irradiance.erbs(self.clearsky_irradiance.ghi,
                         self.solar_position.apparent_zenith,
                         self.times)
+
+
+class SkyDiffuseEnsemble:
+    models = ['isotropic', 'klucher', 'haydavies', 'reindl', 'king',
+              'perez', 'perez-driesse']
+
+    def setup(self):
+        if not hasattr(irradiance, 'get_sky_diffuse_ensemble'):
+            raise NotImplementedError
+        self.times = pd.date_range(start='20180601', freq='1min',
+                                   periods=14400)
+        self.location = location.Location(40, -80)
+        self.solar_position = self.location.get_solarposition(self.times)
+        self.clearsky_irradiance = self.location.get_clearsky(self.times)
+        self.dni_extra = irradiance.get_extra_radiation(self.times)
+        self.args = (20, 180, self.solar_position.apparent_zenith,
+                     self.solar_position.azimuth,
+                     self.clearsky_irradiance.dni,
+                     self.clearsky_irradiance.ghi,
+                     self.clearsky_irradiance.dhi)
+
+    def time_get_sky_diffuse_ensemble(self):
+        irradiance.get_sky_diffuse_ensemble(*self.args,
+                                            dni_extra=self.dni_extra)
+
+    def time_get_sky_diffuse_loop(self):
+        for model in self.models:
+            irradiance.get_sky_diffuse(*self.args, dni_extra=self.dni_extra,
+                                       model=model)
+
+
+class TotalIrradianceMultiOrientation:
+    params = ([1, 10, 100], ['isotropic', 'perez'])
+    param_names = ['norientations', 'model']
+
+    def setup(self, norientations, model):
+        if not hasattr(irradiance, 'get_total_irradiance_multiorientation'):
+            raise NotImplementedError
+        self.times = pd.date_range(start='20180601', freq='1h',
+                                   periods=8760)
+        self.location = location.Location(40, -80)
+        self.solar_position = self.location.get_solarposition(self.times)
+        self.clearsky_irradiance = self.location.get_clearsky(self.times)
+        self.dni_extra = irradiance.get_extra_radiation(self.times)
+        self.tilt = np.linspace(0, 90, norientations)
+        self.azimuth = np.linspace(90, 270, norientations)
+
+    def time_get_total_irradiance_multiorientation(self, norientations,
+                                                   model):
+        irradiance.get_total_irradiance_multiorientation(
+            self.tilt, self.azimuth,
+            self.solar_position.apparent_zenith,
+            self.solar_position.azimuth,
+            self.clearsky_irradiance.dni,
+            self.clearsky_irradiance.ghi,
+            self.clearsky_irradiance.dhi,
+            dni_extra=self.dni_extra, model=model)
+
+    def time_get_total_irradiance_loop(self, norientations, model):
+        for tilt, azimuth in zip(self.tilt, self.azimuth):
+            irradiance.get_total_irradiance(
+                tilt, azimuth,
+                self.solar_position.apparent_zenith,
+                self.solar_position.azimuth,
+                self.clearsky_irradiance.dni,
+                self.clearsky_irradiance.ghi,
+                self.clearsky_irradiance.dhi,
+                dni_extra=self.dni_extra, model=model)
+
+
+class Perez:
+
+    def setup(self):
+        self.times = pd.date_range(start='20180601', freq='1min',
+                                   periods=14400)
+        self.location = location.Location(40, -80)
+        self.solar_position = self.location.get_solarposition(self.times)
+        self.clearsky_irradiance = self.location.get_clearsky(self.times)
+        self.dni_extra = irradiance.get_extra_radiation(self.times)
+        self.airmass = self.location.get_airmass(
+            solar_position=self.solar_position)['airmass_relative']
+        self.args = (self.clearsky_irradiance.dhi,
+                     self.clearsky_irradiance.dni, self.dni_extra,
+                     self.solar_position.apparent_zenith,
+                     self.solar_position.azimuth, self.airmass)
+        if hasattr(irradiance, 'PerezSkyState'):
+            self.sky_state = irradiance.PerezSkyState(
+                self.clearsky_irradiance.dhi, self.clearsky_irradiance.dni,
+                self.dni_extra, self.solar_position.apparent_zenith,
+                self.airmass)
+
+    def time_perez(self):
+        irradiance.perez(20, 180, *self.args)
+
+    def time_perez_sky_state(self):
+        if not hasattr(self, 'sky_state'):
+            raise NotImplementedError
+        irradiance.perez(20, 180, *self.args, sky_state=self.sky_state)
+
+
+class Dirint:
+    params = [1, 30, 365]  # number of days of 1-minute data
+    param_names = ['ndays']
+
+    def setup(self, ndays):
+        self.times = pd.date_range(start='20180601', freq='1min',
+                                   periods=1440*ndays, tz='Etc/GMT+5')
+        solar_position = solarposition.ephemeris(self.times, 40, -80)
+        self.zenith = solar_position['apparent_zenith']
+        # clear sky with some variability to exercise all of the bins
+        cos_zenith = np.cos(np.radians(self.zenith)).clip(lower=0)
+        variability = 0.7 + 0.3 * np.sin(np.arange(len(self.times)) / 37.)
+        self.ghi = 1000 * cos_zenith * variability
+        self.ghi_clear = 1000 * cos_zenith
+        self.dni_clear = 900 * (cos_zenith > 0)
+        self.temp_dew = pd.Series(10., index=self.times)
+
+    def time_dirint(self, ndays):
+        irradiance.dirint(self.ghi, self.zenith, self.times,
+                          temp_dew=self.temp_dew)
+
+    def time_dirindex(self, ndays):
+        irradiance.dirindex(self.ghi, self.ghi_clear, self.dni_clear,
+                            self.zenith, self.times, temp_dew=self.temp_dew)
+
+    def time_decomposition_ensemble(self, ndays):
+        irradiance.decomposition_ensemble(self.ghi, self.zenith, self.times,
+                                          temp_dew=self.temp_dew)
+
+
+class GTIDirint:
+    params = [1, 30]  # number of days of 1-minute data
+    param_names = ['ndays']
+
+    def setup(self, ndays):
+        self.times = pd.date_range(start='20180601', freq='1min',
+                                   periods=1440*ndays, tz='Etc/GMT+5')
+        solar_position = solarposition.ephemeris(self.times, 40, -80)
+        self.zenith = solar_position['apparent_zenith']
+        self.azimuth = solar_position['azimuth']
+        self.aoi = irradiance.aoi(30, 180, self.zenith, self.azimuth)
+        cos_aoi = np.cos(np.radians(self.aoi)).clip(lower=0)
+        variability = 0.7 + 0.3 * np.sin(np.arange(len(self.times)) / 37.)
+        self.poa_global = 1000 * cos_aoi * variability
+
+    def time_gti_dirint(self, ndays):
+        irradiance.gti_dirint(self.poa_global, self.aoi, self.zenith,
+                              self.azimuth, self.times, 30, 180)
+
+
+class GHIFromPOADriesse:
+    params = [1, 30]  # number of days of 1-minute data
+    param_names = ['ndays']
+
+    def setup(self, ndays):
+        self.times = pd.date_range(start='20180601', freq='1min',
+                                   periods=1440*ndays, tz='Etc/GMT+5')
+        solar_position = solarposition.ephemeris(self.times, 40, -80)
+        self.zenith = solar_position['apparent_zenith']
+        self.azimuth = solar_position['azimuth']
+        self.dni_extra = irradiance.get_extra_radiation(self.times)
+        aoi = irradiance.aoi(30, 180, self.zenith, self.azimuth)
+        cos_aoi = np.cos(np.radians(aoi)).clip(lower=0)
+        variability = 0.7 + 0.3 * np.sin(np.arange(len(self.times)) / 37.)
+        self.poa_global = 1000 * cos_aoi * variability
+
+    def time_ghi_from_poa_driesse_2023(self, ndays):
+        irradiance.ghi_from_poa_driesse_2023(
+            30, 180, self.zenith, self.azimuth, self.poa_global,
+            self.dni_extra)
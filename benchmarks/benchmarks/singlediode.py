@@ -0,0 +1,100 @@
+"""
+ASV benchmarks for singlediode.py
+"""
+
+import numpy as np
+from pvlib import pvsystem, singlediode, tools
+
+
+def set_sde_params(obj, npoints):
+    rng = np.random.default_rng(0)
+    effective_irradiance = rng.uniform(10, 1100, npoints)
+    temp_cell = rng.uniform(-10, 70, npoints)
+    obj.args = pvsystem.calcparams_cec(
+        effective_irradiance, temp_cell, alpha_sc=0.004539, a_ref=2.6373,
+        I_L_ref=5.114, I_o_ref=8.196e-10, R_sh_ref=381.68, R_s=1.065,
+        Adjust=8.7, EgRef=1.121, dEgdT=-0.0002677)
+
+
+class Bishop88:
+    params = ([100, 10000], ['newton', 'brentq'])
+    param_names = ['npoints', 'method']
+
+    def setup(self, npoints, method):
+        set_sde_params(self, npoints)
+
+    def time_bishop88_mpp(self, npoints, method):
+        singlediode.bishop88_mpp(*self.args, method=method)
+
+    def time_bishop88_v_from_i(self, npoints, method):
+        singlediode.bishop88_v_from_i(0., *self.args, method=method)
+
+    def time_bishop88_i_from_v(self, npoints, method):
+        singlediode.bishop88_i_from_v(0., *self.args, method=method)
+
+
+class Bishop88NewtonInitialGuess:
+    params = [100, 10000]
+    param_names = ['npoints']
+
+    def setup(self, npoints):
+        set_sde_params(self, npoints)
+
+    def time_bishop88_mpp_newton(self, npoints):
+        singlediode.bishop88_mpp(*self.args, method='newton')
+
+    def time_bishop88_mpp_newton_batzelis(self, npoints):
+        singlediode.bishop88_mpp(*self.args, method='newton',
+                                 method_kwargs={'x0': 'batzelis'})
+
+    def time_singlediode_newton_batzelis(self, npoints):
+        pvsystem.singlediode(*self.args, method='newton',
+                             method_kwargs={'x0': 'batzelis'})
+
+
+class GoldenSection:
+    params = [100, 10000]
+    param_names = ['npoints']
+
+    def setup(self, npoints):
+        if not hasattr(tools, '_golden_sect'):
+            raise NotImplementedError
+        set_sde_params(self, npoints)
+        self.v_oc = singlediode.estimate_voc(self.args[0], self.args[1],
+                                             self.args[4])
+
+    def time_golden_sect(self, npoints):
+        tools._golden_sect(singlediode._pwr_optfcn, 0., self.v_oc * 1.14,
+                           args=self.args)
+
+
+class MaxPowerPointTable:
+    params = ([100, 10000], ['linear', 'cubic'])
+    param_names = ['npoints', 'interpolation']
+
+    def setup(self, npoints, interpolation):
+        if not hasattr(pvsystem, 'MaxPowerPointTable'):
+            raise NotImplementedError
+        self.module_parameters = {
+            'alpha_sc': 0.004539, 'a_ref': 2.6373, 'I_L_ref': 5.114,
+            'I_o_ref': 8.196e-10, 'R_sh_ref': 381.68, 'R_s': 1.065,
+            'Adjust': 8.7}
+        self.table = pvsystem.MaxPowerPointTable.from_module_parameters(
+            self.module_parameters, 'cec', interpolation=interpolation)
+        rng = np.random.default_rng(0)
+        self.effective_irradiance = rng.uniform(10, 1100, npoints)
+        self.temp_cell = rng.uniform(-10, 70, npoints)
+
+    def time_from_module_parameters(self, npoints, interpolation):
+        pvsystem.MaxPowerPointTable.from_module_parameters(
+            self.module_parameters, 'cec', interpolation=interpolation)
+
+    def time_max_power_point_table(self, npoints, interpolation):
+        self.table.max_power_point(self.effective_irradiance,
+                                   self.temp_cell)
+
+    def time_max_power_point(self, npoints, interpolation):
+        args = pvsystem.calcparams_cec(
+            self.effective_irradiance, self.temp_cell,
+            **self.module_parameters)
+        pvsystem.max_power_point(*args, method='newton')
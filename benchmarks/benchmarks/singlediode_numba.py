@@ -0,0 +1,62 @@
+"""ASV benchmarks for singlediode.py using numba.
+
+We use a separate module so that we can control the pvlib import process
+using an environment variable. This will force pvlib to compile the numba
+code during setup.
+
+Try to keep relevant sections in sync with benchmarks/singlediode.py
+"""
+
+import numpy as np
+
+import os
+os.environ['PVLIB_USE_NUMBA'] = '1'
+
+
+from pvlib import pvsystem, singlediode  # NOQA: E402
+
+
+def set_sde_params(obj, npoints):
+    rng = np.random.default_rng(0)
+    effective_irradiance = rng.uniform(10, 1100, npoints)
+    temp_cell = rng.uniform(-10, 70, npoints)
+    obj.args = pvsystem.calcparams_cec(
+        effective_irradiance, temp_cell, alpha_sc=0.004539, a_ref=2.6373,
+        I_L_ref=5.114, I_o_ref=8.196e-10, R_sh_ref=381.68, R_s=1.065,
+        Adjust=8.7, EgRef=1.121, dEgdT=-0.0002677)
+
+
+class SingleDiodeNumba:
+    params = [100, 10000]
+    param_names = ['npoints']
+
+    def setup(self, npoints):
+        try:
+            from pvlib import _singlediode_numba
+        except ImportError:
+            raise NotImplementedError
+        if not _singlediode_numba.USE_NUMBA:
+            raise NotImplementedError
+        set_sde_params(self, npoints)
+        # compile the kernels outside of the timed functions
+        self.time_lambertw_i_from_v(npoints)
+        self.time_lambertw_v_from_i(npoints)
+        self.time_bishop88_mpp_newton(npoints)
+
+    def time_lambertw_i_from_v(self, npoints):
+        singlediode._lambertw_i_from_v(0., *self.args)
+
+    def time_lambertw_v_from_i(self, npoints):
+        singlediode._lambertw_v_from_i(0., *self.args)
+
+    def time_singlediode_lambertw(self, npoints):
+        pvsystem.singlediode(*self.args, method='lambertw')
+
+    def time_bishop88_mpp_newton(self, npoints):
+        singlediode.bishop88_mpp(*self.args, method='newton')
+
+    def time_bishop88_v_from_i_newton(self, npoints):
+        singlediode.bishop88_v_from_i(0., *self.args, method='newton')
+
+    def time_bishop88_i_from_v_newton(self, npoints):
+        singlediode.bishop88_i_from_v(0., *self.args, method='newton')
@@ -3,6 +3,7 @@ ASV benchmarks for solarposition.py
 """
 
 import datetime
+import numpy as np
 import pandas as pd
 import pvlib
 from pvlib import solarposition
@@ -40,6 +41,14 @@ class SolarPosition:
     def time_spa_python(self, ndays):
         solarposition.spa_python(self.times_localized, self.lat, self.lon)
 
+    def time_spa_python_delta_t_none(self, ndays):
+        solarposition.spa_python(self.times_localized, self.lat, self.lon,
+                                 delta_t=None)
+
+    def time_spa_python_interp(self, ndays):
+        solarposition.spa_python_interp(self.times_localized, self.lat,
+                                        self.lon)
+
     def time_pyephem(self, ndays):
         solarposition.pyephem(self.times_localized, self.lat, self.lon)
 
@@ -62,6 +71,61 @@ class SolarPosition:
         solarposition.nrel_earthsun_distance(self.times_localized)
 
 
+class EphemerisArray:
+    params = [[1, 100], [1, 10]]
+    param_names = ['nsites', 'ndays']
+
+    def setup(self, nsites, ndays):
+        if not hasattr(solarposition, 'ephemeris_array'):
+            raise NotImplementedError
+        times = pd.date_range(start='20180601', freq='1min',
+                              periods=1440*ndays, tz='UTC')
+        self.unixtime = solarposition._datetime_to_unixtime(times)
+        self.lat = np.linspace(-60, 60, nsites)[:, np.newaxis]
+        self.lon = np.linspace(-180, 180, nsites)[:, np.newaxis]
+
+    def time_ephemeris_array(self, nsites, ndays):
+        solarposition.ephemeris_array(self.unixtime, self.lat, self.lon)
+
+    def time_ephemeris_array_float32(self, nsites, ndays):
+        solarposition.ephemeris_array(self.unixtime, self.lat, self.lon,
+                                      dtype=np.float32)
+
+    def peakmem_ephemeris_array_float32(self, nsites, ndays):
+        solarposition.ephemeris_array(self.unixtime, self.lat, self.lon,
+                                      dtype=np.float32)
+
+
+class SunRiseSetTransitMultisite:
+    params = [[1, 100], [1, 365]]
+    param_names = ['nsites', 'ndays']
+
+    def setup(self, nsites, ndays):
+        if not hasattr(solarposition, 'sun_elevation_crossing_spa'):
+            raise NotImplementedError
+        self.times_daily = pd.date_range(
+            start='20180101', freq='24h', periods=ndays, tz='Etc/GMT+7')
+        self.lat = np.linspace(-60, 60, nsites)
+        self.lon = np.linspace(-180, 180, nsites)
+        dayofyear = self.times_daily.dayofyear
+        self.declination = solarposition.declination_spencer71(dayofyear)
+        self.equation_of_time = \
+            solarposition.equation_of_time_spencer71(dayofyear)
+
+    def time_sun_rise_set_transit_spa_multisite(self, nsites, ndays):
+        solarposition.sun_rise_set_transit_spa_multisite(
+            self.times_daily, self.lat, self.lon)
+
+    def time_sun_rise_set_transit_geometric_multisite(self, nsites, ndays):
+        solarposition.sun_rise_set_transit_geometric_multisite(
+            self.times_daily, self.lat, self.lon, self.declination,
+            self.equation_of_time)
+
+    def time_sun_elevation_crossing_spa(self, nsites, ndays):
+        solarposition.sun_elevation_crossing_spa(
+            self.times_daily, self.lat, self.lon, 15.)
+
+
 class SolarPositionCalcTime:
 
     def setup(self):
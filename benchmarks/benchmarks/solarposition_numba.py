@@ -41,6 +41,10 @@ class SolarPositionNumba:
         solarposition.spa_python(
             self.times_localized, self.lat, self.lon, how='numba')
 
+    def time_spa_python_interp(self, ndays):
+        solarposition.spa_python_interp(
+            self.times_localized, self.lat, self.lon, how='numba')
+
     def time_sun_rise_set_transit_spa(self, ndays):
         sun_rise_set_transit_spa(
             self.times_daily, self.lat, self.lon, how='numba')
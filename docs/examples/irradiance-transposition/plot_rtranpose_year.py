@@ -103,10 +103,9 @@ df['aoi'] = aoi(TILT, ORIENT, solpos.apparent_zenith, solpos.azimuth)
 # %%
 #
 # Now estimate ghi from poa_global using reverse transposition.
-# The algorithm uses a simple bisection search, which is quite slow
-# because scipy doesn't offer a vectorized version (yet).
-# For this reason we'll process a random sample of 1000 timestamps
-# rather than the whole year.
+# The algorithm solves all timestamps at once using a vectorized
+# bracketed root search. To keep the plots readable we'll process
+# a random sample of 1000 timestamps rather than the whole year.
 #
 
 df = df[df.ghi > 0].sample(n=1000)
@@ -1,31 +1,44 @@
+import importlib
+
 from pvlib.version import __version__  # noqa: F401
 
-from pvlib import (  # noqa: F401
-    # list spectrum first so it's available for atmosphere & pvsystem (GH 1628)
-    spectrum,
+# submodules are imported on first attribute access (PEP 562) so that
+# ``import pvlib`` does not pay for scipy, h5py, requests, etc. until a
+# module that needs them is used
+_submodules = [
+    'albedo',
+    'atmosphere',
+    'bifacial',
+    'clearsky',
+    'iam',
+    'inverter',
+    'iotools',
+    'irradiance',
+    'ivtools',
+    'location',
+    'modelchain',
+    'pvarray',
+    'pvsystem',
+    'scaling',
+    'shading',
+    'singlediode',
+    'snow',
+    'soiling',
+    'solarposition',
+    'spa',
+    'spectrum',
+    'temperature',
+    'tools',
+    'tracking',
+    'transformer',
+]
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
 
-    albedo,
-    atmosphere,
-    bifacial,
-    clearsky,
-    iam,
-    inverter,
-    iotools,
-    irradiance,
-    ivtools,
-    location,
-    modelchain,
-    pvarray,
-    pvsystem,
-    scaling,
-    shading,
-    singlediode,
-    snow,
-    soiling,
-    solarposition,
-    spa,
-    temperature,
-    tools,
-    tracking,
-    transformer,
-)
+def __dir__():
+    return sorted(list(globals()) + _submodules)
@@ -0,0 +1,306 @@
+"""
+Kernels for the single diode equation that can be compiled with numba.
+
+The kernels evaluate one element at a time in a loop, which avoids the
+temporary arrays of the numpy implementations in :py:mod:`pvlib.singlediode`.
+They are only used when the ``PVLIB_USE_NUMBA`` environment variable is set
+before pvlib is imported and numba is installed.
+"""
+
+import os
+import warnings
+
+import numpy as np
+
+
+# this block is a way to use an environment variable to switch between
+# compiling the functions with numba or just use numpy
+def nocompile(*args, **kwargs):
+    return lambda func: func
+
+
+if os.getenv('PVLIB_USE_NUMBA', '0') != '0':
+    try:
+        from numba import jit, prange
+    except ImportError:
+        warnings.warn('Could not import numba, falling back to numpy ' +
+                      'calculation')
+        jcompile = nocompile
+        prange = range
+        USE_NUMBA = False
+    else:
+        def jcompile(*args, **kwargs):
+            # cache the compiled functions on disk, and return inf and nan
+            # instead of raising ZeroDivisionError like numpy
+            kwargs.setdefault('cache', True)
+            kwargs.setdefault('error_model', 'numpy')
+            return jit(*args, **kwargs)
+        USE_NUMBA = True
+else:
+    jcompile = nocompile
+    prange = range
+    USE_NUMBA = False
+
+
+# options of scipy.optimize.newton that are supported by bishop88_newton
+NEWTON_KWARGS = {'tol', 'rtol', 'maxiter', 'full_output', 'disp'}
+
+# codes of the quantity solved by bishop88_newton
+I_FROM_V, V_FROM_I, MPP = 0, 1, 2
+
+
+# the array arguments have no explicit signature so that numba also accepts
+# the readonly arrays made by broadcasting and by views of the inputs
+@jcompile(nopython=True)
+def _at(values, k):
+    # arrays of size 1 are broadcast to all elements
+    if values.shape[0] == 1:
+        return values[0]
+    return values[k]
+
+
+@jcompile('float64(float64)', nopython=True)
+def log_lambertw(logx):
+    """Lambert's W function from log(x), see
+    :py:func:`pvlib.ivtools.utils._log_lambertw`"""
+    w = logx - np.log(logx)
+    for _ in range(3):
+        w = w * (1. - np.log(w) + logx) / (1. + w)
+    return w
+
+
+@jcompile('float64(float64)', nopython=True)
+def lambertw(x):
+    """Lambert's W function for x >= 0, see
+    :py:func:`pvlib.ivtools.utils._lambertw_pvlib`"""
+    if not x <= 100:
+        return log_lambertw(np.log(x))
+    temp = np.log1p(x)
+    g = temp - np.log1p(temp)
+    for _ in range(3):
+        expg = np.exp(g)
+        g_expg_z = g * expg - x
+        g_p1 = g + 1
+        g = g - g_expg_z * g_p1 / (expg * g_p1**2 - 0.5 * (g + 2) * g_expg_z)
+    return g
+
+
+@jcompile('float64(float64, float64, float64, float64, float64, float64)',
+          nopython=True)
+def lambertw_i_from_v_scalar(V, IL, I0, Rs, Rsh, a):
+    Gsh = 1. / Rsh
+    if Rs == 0.:
+        return IL - I0 * np.expm1(V / a) - Gsh * V
+    if not Rs > 0.:
+        return np.nan
+    RsGsh1 = Rs * Gsh + 1.
+    argW = Rs * I0 / (a * RsGsh1) * np.exp((Rs * (IL + I0) + V) / (a * RsGsh1))
+    return (IL + I0 - V * Gsh) / RsGsh1 - (a / Rs) * lambertw(argW)
+
+
+@jcompile('float64(float64, float64, float64, float64, float64, float64)',
+          nopython=True)
+def lambertw_v_from_i_scalar(I, IL, I0, Rs, Rsh, a):  # noqa: E741
+    Gsh = 1. / Rsh
+    if Gsh == 0.:
+        return a * np.log1p((IL - I) / I0) - I * Rs
+    if not Gsh > 0.:
+        return np.nan
+    argW = I0 / (Gsh * a) * np.exp((-I + IL + I0) / (Gsh * a))
+    if np.isinf(argW):
+        # calculate using log(argW) if argW overflows
+        logargW = (np.log(I0) - np.log(Gsh) - np.log(a)
+                   + (-I + IL + I0) / (Gsh * a))
+        lambertwterm = log_lambertw(logargW)
+    else:
+        lambertwterm = lambertw(argW)
+    return (IL + I0 - I) / Gsh - I * Rs - a * lambertwterm
+
+
+@jcompile(nopython=True, nogil=True, parallel=True)
+def lambertw_i_from_v_loop(V, IL, I0, Rs, Rsh, a, out):
+    for k in prange(out.shape[0]):
+        out[k] = lambertw_i_from_v_scalar(_at(V, k), _at(IL, k), _at(I0, k),
+                                          _at(Rs, k), _at(Rsh, k), _at(a, k))
+
+
+@jcompile(nopython=True, nogil=True, parallel=True)
+def lambertw_v_from_i_loop(I, IL, I0, Rs, Rsh, a, out):  # noqa: E741
+    for k in prange(out.shape[0]):
+        out[k] = lambertw_v_from_i_scalar(_at(I, k), _at(IL, k), _at(I0, k),
+                                          _at(Rs, k), _at(Rsh, k), _at(a, k))
+
+
+@jcompile(nopython=True)
+def bishop88_scalar(vd, IL, I0, Rs, Rsh, a, d2mutau, NsVbi, brk_factor,
+                    brk_voltage, brk_exp):
+    """:py:func:`pvlib.singlediode.bishop88` for one element, returning
+    ``(i, v, di/dvd, dv/dvd, dp/dv, d2p/dv/dvd)``"""
+    if d2mutau > 0:
+        v_recomb = NsVbi - vd
+        i_recomb = IL * d2mutau / v_recomb
+        grad_i_recomb = i_recomb / v_recomb
+        grad_2i_recomb = 2 * grad_i_recomb / v_recomb
+    else:
+        i_recomb = grad_i_recomb = grad_2i_recomb = 0.
+    v_star = vd / a
+    g_sh = 1.0 / Rsh
+    # the breakdown terms are evaluated even if brk_factor is 0, so that
+    # vd > brk_voltage gives nan like the numpy implementation
+    brk_term = 1 - vd / brk_voltage
+    brk_pwr = np.power(brk_term, -brk_exp)
+    brk_pwr_1 = np.power(brk_term, -brk_exp - 1)
+    brk_pwr_2 = np.power(brk_term, -brk_exp - 2)
+    brk_fctr = brk_factor * g_sh
+    i_breakdown = brk_fctr * vd * brk_pwr
+    grad_i_brk = brk_fctr * (brk_pwr + vd * -brk_exp * brk_pwr_1)
+    grad2i_brk = (brk_fctr * -brk_exp
+                  * (2 * brk_pwr_1 + vd * (-brk_exp - 1) * brk_pwr_2))
+    exp_v_star = np.exp(v_star)
+    i = IL - I0 * np.expm1(v_star) - vd * g_sh - i_recomb - i_breakdown
+    v = vd - i * Rs
+    g_diode = I0 * exp_v_star / a
+    grad_i = -g_diode - g_sh - grad_i_recomb - grad_i_brk
+    grad_v = 1.0 - grad_i * Rs
+    grad = grad_i / grad_v
+    grad_p = v * grad + i
+    grad2i = -g_diode / a - grad_2i_recomb - grad2i_brk
+    grad2v = -grad2i * Rs
+    grad2p = (grad_v * grad
+              + v * (grad2i / grad_v - grad_i * grad2v / grad_v**2) + grad_i)
+    return i, v, grad_i, grad_v, grad_p, grad2p
+
+
+@jcompile(nopython=True, nogil=True, parallel=True)
+def bishop88_newton_loop(mode, x0, target, IL, I0, Rs, Rsh, a, d2mutau, NsVbi,
+                         brk_factor, brk_voltage, brk_exp, tol, maxiter,
+                         root, converged, zero_der, iterations):
+    """Newton's method for the diode voltage of each element, with the
+    convergence criteria of :py:func:`scipy.optimize.newton` for arrays"""
+    for k in prange(root.shape[0]):
+        args = (_at(IL, k), _at(I0, k), _at(Rs, k), _at(Rsh, k), _at(a, k),
+                _at(d2mutau, k), _at(NsVbi, k), _at(brk_factor, k),
+                _at(brk_voltage, k), _at(brk_exp, k))
+        x = _at(x0, k)
+        y = _at(target, k)
+        failure = True
+        nz_der = True
+        n = 0
+        while n < maxiter:
+            n += 1
+            i, v, grad_i, grad_v, grad_p, grad2p = bishop88_scalar(x, *args)
+            if mode == I_FROM_V:
+                f, df = v - y, grad_v
+            elif mode == V_FROM_I:
+                f, df = i - y, grad_i
+            else:
+                f, df = grad_p, grad2p
+            # an element with a zero derivative is not updated, and would
+            # not be updated in the following iterations either
+            nz_der = df != 0
+            if not nz_der:
+                break
+            dx = f / df
+            x = x - dx
+            # nan is not a failure, like in scipy.optimize.newton
+            failure = np.abs(dx) >= tol
+            if not failure:
+                break
+        root[k] = x
+        converged[k] = not failure
+        # converged elements with a zero derivative are not reported
+        zero_der[k] = failure and not nz_der
+        iterations[k] = n
+
+
+def _flat_inputs(*args):
+    # 1d float arrays of the broadcast shape, or of size 1, so that inputs
+    # of the same shape and scalars are not copied
+    args = [np.asarray(arg, dtype=np.float64) for arg in args]
+    shape = np.broadcast_shapes(*(arg.shape for arg in args))
+    flat = tuple(arg.reshape(1) if arg.size == 1
+                 else np.broadcast_to(arg, shape).ravel() for arg in args)
+    return shape, flat
+
+
+def lambertw_i_from_v(voltage, photocurrent, saturation_current,
+                      resistance_series, resistance_shunt, nNsVth):
+    """Compiled version of :py:func:`pvlib.singlediode._lambertw_i_from_v`"""
+    shape, args = _flat_inputs(voltage, photocurrent, saturation_current,
+                               resistance_series, resistance_shunt, nNsVth)
+    out = np.empty(int(np.prod(shape)))
+    lambertw_i_from_v_loop(*args, out)
+    return out.reshape(shape)
+
+
+def lambertw_v_from_i(current, photocurrent, saturation_current,
+                      resistance_series, resistance_shunt, nNsVth):
+    """Compiled version of :py:func:`pvlib.singlediode._lambertw_v_from_i`"""
+    shape, args = _flat_inputs(current, photocurrent, saturation_current,
+                               resistance_series, resistance_shunt, nNsVth)
+    out = np.empty(int(np.prod(shape)))
+    lambertw_v_from_i_loop(*args, out)
+    return out.reshape(shape)
+
+
+def bishop88_newton(mode, x0, target, args, method_kwargs):
+    """
+    Solve for the diode voltage with Newton's method.
+
+    Parameters
+    ----------
+    mode : int
+        ``I_FROM_V``, ``V_FROM_I`` or ``MPP``.
+    x0 : array-like
+        Initial guess of the diode voltage. [V]
+    target : numeric
+        Voltage for ``I_FROM_V`` or current for ``V_FROM_I``, ignored for
+        ``MPP``.
+    args : tuple
+        Arguments of :py:func:`pvlib.singlediode.bishop88` after the diode
+        voltage.
+    method_kwargs : dict
+        ``'tol'``, ``'maxiter'``, and optionally ``'rtol'``,
+        ``'full_output'`` and ``'disp'``, as for
+        :py:func:`scipy.optimize.newton`. Like scipy's newton for arrays,
+        ``'rtol'`` and ``'disp'`` are ignored.
+
+    Returns
+    -------
+    root : numpy.ndarray
+        Diode voltage. [V]
+    converged, zero_der : numpy.ndarray
+        Boolean arrays of the elements that converged and of the elements
+        with a zero derivative.
+    iterations : int
+        Number of iterations of the slowest element.
+    """
+    shape, flat = _flat_inputs(x0, target, *args)
+    size = int(np.prod(shape))
+    root = np.empty(size)
+    converged = np.empty(size, dtype=bool)
+    zero_der = np.empty(size, dtype=bool)
+    iterations = np.empty(size, dtype=np.int64)
+    maxiter = int(method_kwargs['maxiter'])
+    bishop88_newton_loop(mode, *flat, float(method_kwargs['tol']), maxiter,
+                         root, converged, zero_der, iterations)
+    root = root.reshape(shape)
+    converged = converged.reshape(shape)
+    zero_der = zero_der.reshape(shape)
+
+    # the same warnings and errors as scipy's newton for arrays
+    failures = ~converged
+    if zero_der.any():
+        all_or_some = 'all' if zero_der.all() else 'some'
+        warnings.warn(f'{all_or_some} derivatives were zero',
+                      RuntimeWarning)
+    elif failures.any():
+        all_or_some = 'all' if failures.all() else 'some'
+        msg = f'{all_or_some} failed to converge after {maxiter} ' \
+              'iterations'
+        if all_or_some == 'all':
+            raise RuntimeError(msg)
+        warnings.warn(msg, RuntimeWarning)
+
+    niter = int(iterations.max()) if size else 0
+    return root, converged, zero_der, niter
@@ -9,8 +9,6 @@ import calendar
 
 import numpy as np
 import pandas as pd
-from scipy.linalg import hankel
-import h5py
 
 from pvlib import atmosphere, tools
 from pvlib.tools import _degrees_to_index
@@ -201,6 +199,8 @@ def lookup_linke_turbidity(time, latitude, longitude, filepath=None,
     latitude_index = _degrees_to_index(latitude, coordinate='latitude')
     longitude_index = _degrees_to_index(longitude, coordinate='longitude')
 
+    import h5py
+
     with h5py.File(filepath, 'r') as lt_h5_file:
         lts = lt_h5_file['LinkeTurbidity'][latitude_index, longitude_index]
 
@@ -850,6 +850,8 @@ def detect_clearsky(measured, clearsky, times=None, infer_limits=False,
                            have at least {samples_per_window} entries")
 
     # generate matrix of integers for creating windows with indexing
+    from scipy.linalg import hankel
+
     H = hankel(np.arange(samples_per_window),
                np.arange(samples_per_window-1, len(times)))
 
@@ -6,12 +6,10 @@ irradiance, and total irradiance under various conditions.
 
 import datetime
 from collections import OrderedDict
-from functools import partial
+from functools import lru_cache, partial
 
 import numpy as np
 import pandas as pd
-from scipy.interpolate import splev
-from scipy.optimize import bisect
 
 from pvlib import atmosphere, solarposition, tools
 import pvlib  # used to avoid dni name collision in complete_irradiance
@@ -96,16 +94,10 @@ def get_extra_radiation(datetime_or_doy, solar_constant=1366.1,
     to_doy, to_datetimeindex, to_output = \
         _handle_extra_radiation_types(datetime_or_doy, epoch_year)
 
-    # consider putting asce and spencer methods in their own functions
     method = method.lower()
-    if method == 'asce':
-        B = solarposition._calculate_simple_day_angle(to_doy(datetime_or_doy),
-                                                      offset=0)
-        RoverR0sqrd = 1 + 0.033 * np.cos(B)
-    elif method == 'spencer':
-        B = solarposition._calculate_simple_day_angle(to_doy(datetime_or_doy))
-        RoverR0sqrd = (1.00011 + 0.034221 * np.cos(B) + 0.00128 * np.sin(B) +
-                       0.000719 * np.cos(2 * B) + 7.7e-05 * np.sin(2 * B))
+    if method in ('asce', 'spencer'):
+        RoverR0sqrd = _earthsun_distance_factor(to_doy(datetime_or_doy),
+                                                method)
     elif method == 'pyephem':
         times = to_datetimeindex(datetime_or_doy)
         RoverR0sqrd = solarposition.pyephem_earthsun_distance(times) ** (-2)
@@ -123,6 +115,49 @@ def get_extra_radiation(datetime_or_doy, solar_constant=1366.1,
     return Ea
 
 
+def _earthsun_distance_factor_series(dayofyear, method):
+    """
+    Evaluate (R0/R)**2 with the Spencer or ASCE series.
+
+    Supports :py:func:`get_extra_radiation`.
+    """
+    if method == 'asce':
+        B = solarposition._calculate_simple_day_angle(dayofyear, offset=0)
+        RoverR0sqrd = 1 + 0.033 * np.cos(B)
+    else:
+        B = solarposition._calculate_simple_day_angle(dayofyear)
+        RoverR0sqrd = (1.00011 + 0.034221 * np.cos(B) + 0.00128 * np.sin(B) +
+                       0.000719 * np.cos(2 * B) + 7.7e-05 * np.sin(2 * B))
+    return RoverR0sqrd
+
+
+@lru_cache(maxsize=None)
+def _earthsun_distance_factor_table(method):
+    """
+    Read-only table of (R0/R)**2 for the integer days of year 0 to 366.
+    """
+    table = _earthsun_distance_factor_series(np.arange(367), method)
+    table.flags.writeable = False
+    return table
+
+
+def _earthsun_distance_factor(dayofyear, method):
+    """
+    Calculate (R0/R)**2 with the Spencer or ASCE series.
+
+    Integer days of year, e.g. from a DatetimeIndex, are looked up in a
+    table instead of evaluating the series for every element. The result
+    is the same.
+
+    Supports :py:func:`get_extra_radiation`.
+    """
+    doy = np.asarray(dayofyear)
+    if np.issubdtype(doy.dtype, np.integer) and doy.size and \
+            doy.min() >= 0 and doy.max() <= 366:
+        return _earthsun_distance_factor_table(method)[doy]
+    return _earthsun_distance_factor_series(dayofyear, method)
+
+
 def _handle_extra_radiation_types(datetime_or_doy, epoch_year):
     # This block will set the functions that can be used to convert the
     # inputs to either day of year or pandas DatetimeIndex, and the
@@ -159,7 +194,64 @@ def _handle_extra_radiation_types(datetime_or_doy, epoch_year):
     return to_doy, to_datetimeindex, to_output
 
 
-def aoi_projection(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth):
+def solar_unit_vector(solar_zenith, solar_azimuth):
+    """
+    Calculates the unit vector pointing from the observer to the sun.
+
+    The vector depends only on the solar position, so it can be calculated
+    once and reused with :py:func:`aoi_projection` and :py:func:`aoi` for any
+    number of surfaces.
+
+    Parameters
+    ----------
+    solar_zenith : numeric
+        Solar zenith angle. See :term:`solar_zenith`. [°]
+    solar_azimuth : numeric
+        Solar azimuth angle. See :term:`solar_azimuth`. [°]
+
+    Returns
+    -------
+    solar_vector : tuple of numeric
+        East, north and up components of the unit vector. [unitless]
+
+    See also
+    --------
+    surface_normal, aoi_projection
+    """
+    sin_zenith = tools.sind(solar_zenith)
+    return (sin_zenith * tools.sind(solar_azimuth),
+            sin_zenith * tools.cosd(solar_azimuth),
+            tools.cosd(solar_zenith))
+
+
+def surface_normal(surface_tilt, surface_azimuth):
+    """
+    Calculates the unit normal vector of a surface.
+
+    Parameters
+    ----------
+    surface_tilt : numeric
+        Panel tilt from horizontal. See :term:`surface_tilt`. [°]
+    surface_azimuth : numeric
+        Panel azimuth. See :term:`surface_azimuth`. [°]
+
+    Returns
+    -------
+    normal : tuple of numeric
+        East, north and up components of the unit normal vector. [unitless]
+
+    See also
+    --------
+    solar_unit_vector, aoi_projection
+    """
+    sin_tilt = tools.sind(surface_tilt)
+    return (sin_tilt * tools.sind(surface_azimuth),
+            sin_tilt * tools.cosd(surface_azimuth),
+            tools.cosd(surface_tilt))
+
+
+def aoi_projection(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth,
+                   solar_vector=None):
     """
     Calculates the dot product of the sun position unit vector and the surface
     normal unit vector; in other words, the cosine of the angle of incidence.
@@ -183,6 +275,13 @@ def aoi_projection(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth):
     solar_azimuth : numeric
         Solar azimuth angle. See :term:`solar_azimuth`. [°]
 
+    solar_vector : tuple of numeric, optional
+        Sun position unit vector calculated by :py:func:`solar_unit_vector`
+        for ``solar_zenith`` and ``solar_azimuth``. If provided, the
+        projection is the dot product of this vector and the surface normal,
+        which avoids evaluating trigonometric functions of the solar position
+        again when the same solar position is used for several surfaces.
+
     Returns
     -------
     projection : numeric
@@ -190,10 +289,15 @@ def aoi_projection(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth):
         See :term:`aoi_projection`.
     """
 
-    projection = (
-        tools.cosd(surface_tilt) * tools.cosd(solar_zenith) +
-        tools.sind(surface_tilt) * tools.sind(solar_zenith) *
-        tools.cosd(solar_azimuth - surface_azimuth))
+    if solar_vector is None:
+        projection = (
+            tools.cosd(surface_tilt) * tools.cosd(solar_zenith) +
+            tools.sind(surface_tilt) * tools.sind(solar_zenith) *
+            tools.cosd(solar_azimuth - surface_azimuth))
+    else:
+        east, north, up = surface_normal(surface_tilt, surface_azimuth)
+        projection = (east * solar_vector[0] + north * solar_vector[1] +
+                      up * solar_vector[2])
 
     # GH 1185
     projection = np.clip(projection, -1, 1)
@@ -206,7 +310,8 @@ def aoi_projection(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth):
     return projection
 
 
-def aoi(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth):
+def aoi(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth,
+        solar_vector=None):
     """
     Calculates the angle of incidence of the solar vector on a surface.
     This is the angle between the solar vector and the surface normal.
@@ -223,6 +328,9 @@ def aoi(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth):
         Solar zenith angle. See :term:`solar_zenith`. [°]
     solar_azimuth : numeric
         Solar azimuth angle. See :term:`solar_azimuth`. [°]
+    solar_vector : tuple of numeric, optional
+        Sun position unit vector calculated by :py:func:`solar_unit_vector`.
+        See :py:func:`aoi_projection`.
 
     Returns
     -------
@@ -231,7 +339,8 @@ def aoi(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth):
     """
 
     projection = aoi_projection(surface_tilt, surface_azimuth,
-                                solar_zenith, solar_azimuth)
+                                solar_zenith, solar_azimuth,
+                                solar_vector=solar_vector)
     aoi_value = np.rad2deg(np.arccos(projection))
 
     try:
@@ -335,6 +444,10 @@ def get_total_irradiance(surface_tilt, surface_azimuth,
         Contains keys/columns ``'poa_global', 'poa_direct', 'poa_diffuse',
         'poa_sky_diffuse', 'poa_ground_diffuse'``. [Wm⁻²]
 
+    See also
+    --------
+    get_total_irradiance_multiorientation
+
     Notes
     -----
     Models ``'haydavies'``, ``'reindl'``, ``'perez'`` and ``'perez-driesse'``
@@ -358,6 +471,157 @@ def get_total_irradiance(surface_tilt, surface_azimuth,
     return irrads
 
 
+def get_total_irradiance_multiorientation(
+        surface_tilt, surface_azimuth, solar_zenith, solar_azimuth,
+        dni, ghi, dhi, dni_extra=None, airmass=None, albedo=0.25,
+        surface_type=None, model='isotropic',
+        model_perez='allsitescomposite1990'):
+    r"""
+    Determine total in-plane irradiance and its components for many
+    surface orientations at once.
+
+    Equivalent to calling :py:func:`~pvlib.irradiance.get_total_irradiance`
+    for each of the M pairs of ``surface_tilt`` and ``surface_azimuth``
+    with the same weather and solar position. The quantities that do not
+    depend on the orientation, such as the relative airmass and the
+    Perez brightening coefficients, are calculated only once and broadcast
+    across the orientations.
+
+    Parameters
+    ----------
+    surface_tilt : numeric
+        Scalar or 1-D array of panel tilts from horizontal.
+        See :term:`surface_tilt`. [°]
+    surface_azimuth : numeric
+        Scalar or 1-D array of panel azimuths, broadcast with
+        ``surface_tilt``. See :term:`surface_azimuth`. [°]
+    solar_zenith : numeric
+        Solar zenith angle. See :term:`solar_zenith`. [°]
+    solar_azimuth : numeric
+        Solar azimuth angle. See :term:`solar_azimuth`. [°]
+    dni : numeric
+        Direct normal irradiance. See :term:`dni`. [Wm⁻²]
+    ghi : numeric
+        Global horizontal irradiance. See :term:`ghi`. [Wm⁻²]
+    dhi : numeric
+        Diffuse horizontal irradiance. See :term:`dhi`. [Wm⁻²]
+    dni_extra : numeric, optional
+        Extraterrestrial direct normal irradiance. See :term:`dni_extra`.
+        [Wm⁻²]
+    airmass : numeric, optional
+        Relative airmass, not adjusted for pressure.
+        See :term:`airmass_relative`. [unitless]
+    albedo : numeric, default 0.25
+        Ground surface albedo. See :term:`albedo`. [unitless]
+    surface_type : str, optional
+        Surface type. See :py:func:`~pvlib.irradiance.get_ground_diffuse` for
+        the list of accepted values.
+    model : str, default 'isotropic'
+        Irradiance model. Can be one of ``'isotropic'``, ``'klucher'``,
+        ``'haydavies'``, ``'reindl'``, ``'king'``, ``'perez'``,
+        ``'perez-driesse'``.
+    model_perez : str, default 'allsitescomposite1990'
+        Used only if ``model='perez'``. See :py:func:`~pvlib.irradiance.perez`.
+
+    Returns
+    -------
+    total_irrad : dict
+        Dictionary of arrays with shape (M, T), where M is the number of
+        orientations and T is the length of the time series inputs, with
+        keys ``'poa_global', 'poa_direct', 'poa_diffuse', 'poa_sky_diffuse',
+        'poa_ground_diffuse'``. [Wm⁻²]
+
+    Raises
+    ------
+    ValueError
+        If ``surface_tilt`` or ``surface_azimuth`` has more than one
+        dimension, or if ``dni_extra`` is not specified for a model that
+        requires it.
+
+    Notes
+    -----
+    The time series inputs ``solar_zenith``, ``solar_azimuth``, ``dni``,
+    ``ghi``, ``dhi``, ``dni_extra``, ``airmass`` and ``albedo`` may be
+    scalars, 1-D arrays or Series of length T. Series are converted to
+    arrays, so the index is not retained.
+
+    See :py:func:`~pvlib.irradiance.get_total_irradiance` for the inputs
+    required by each model.
+
+    See also
+    --------
+    get_total_irradiance
+    """
+
+    model = model.lower()
+
+    if dni_extra is None and model in {'haydavies', 'reindl',
+                                       'perez', 'perez-driesse'}:
+        raise ValueError(f'dni_extra is required for model {model}')
+
+    surface_tilt, surface_azimuth = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(surface_tilt, dtype=float)),
+        np.atleast_1d(np.asarray(surface_azimuth, dtype=float)))
+    if surface_tilt.ndim > 1:
+        raise ValueError('surface_tilt and surface_azimuth must be scalars '
+                         'or 1-D arrays')
+    # orientations along the first axis, times along the second
+    surface_tilt = surface_tilt[:, np.newaxis]
+    surface_azimuth = surface_azimuth[:, np.newaxis]
+
+    solar_zenith, solar_azimuth, dni, ghi, dhi = (
+        np.atleast_1d(np.asarray(x, dtype=float))
+        for x in (solar_zenith, solar_azimuth, dni, ghi, dhi))
+    if dni_extra is not None:
+        dni_extra = np.asarray(dni_extra, dtype=float)
+    albedo = np.asarray(albedo, dtype=float)
+
+    projection = aoi_projection(
+        surface_tilt, surface_azimuth, solar_zenith, solar_azimuth,
+        solar_vector=solar_unit_vector(solar_zenith, solar_azimuth))
+
+    if model in ('perez', 'perez-driesse'):
+        if model == 'perez':
+            if airmass is None:
+                airmass = atmosphere.get_relative_airmass(solar_zenith)
+            airmass = np.asarray(airmass, dtype=float)
+            sky_state = PerezSkyState(dhi, dni, dni_extra, solar_zenith,
+                                      airmass, model=model_perez)
+            F1, F2 = sky_state.F1, sky_state.F2
+        else:
+            if airmass is not None:
+                airmass = np.asarray(airmass, dtype=float)
+            F1, F2 = _perez_driesse_brightness_coefficients(
+                dhi, dni, dni_extra, solar_zenith, airmass)
+        term1, term2, term3 = _perez_diffuse_terms(
+            surface_tilt, projection, solar_zenith, F1, F2)
+        poa_sky_diffuse = np.maximum(dhi * (term1 + term2 + term3), 0)
+        if model == 'perez':
+            poa_sky_diffuse = np.where(np.isnan(airmass), 0, poa_sky_diffuse)
+    else:
+        poa_sky_diffuse = get_sky_diffuse(
+            surface_tilt, surface_azimuth, solar_zenith, solar_azimuth,
+            dni, ghi, dhi, dni_extra=dni_extra, airmass=airmass, model=model)
+
+    poa_ground_diffuse = get_ground_diffuse(surface_tilt, ghi, albedo,
+                                            surface_type)
+    poa_direct = np.maximum(dni * projection, 0)
+    poa_diffuse = poa_sky_diffuse + poa_ground_diffuse
+    poa_global = poa_direct + poa_diffuse
+
+    irrads = {
+        'poa_global': poa_global,
+        'poa_direct': poa_direct,
+        'poa_diffuse': poa_diffuse,
+        'poa_sky_diffuse': poa_sky_diffuse,
+        'poa_ground_diffuse': poa_ground_diffuse,
+    }
+    # the sky diffuse of some models and the ground diffuse only vary with
+    # time or with orientation, so broadcast everything to (M, T)
+    shape = np.broadcast_shapes(*(np.shape(v) for v in irrads.values()))
+    return {k: np.broadcast_to(v, shape).copy() for k, v in irrads.items()}
+
+
 def get_sky_diffuse(surface_tilt, surface_azimuth,
                     solar_zenith, solar_azimuth,
                     dni, ghi, dhi, dni_extra=None, airmass=None,
@@ -467,6 +731,153 @@ def get_sky_diffuse(surface_tilt, surface_azimuth,
     return sky
 
 
+def get_sky_diffuse_ensemble(surface_tilt, surface_azimuth,
+                             solar_zenith, solar_azimuth,
+                             dni, ghi, dhi, dni_extra=None, airmass=None,
+                             models=('isotropic', 'klucher', 'haydavies',
+                                     'reindl', 'king', 'perez',
+                                     'perez-driesse'),
+                             model_perez='allsitescomposite1990'):
+    r"""
+    Determine in-plane sky diffuse irradiance with several sky diffuse
+    models at once.
+
+    The terms that the models have in common, such as the projection of
+    the beam irradiance on the surface, the trigonometric functions of
+    ``surface_tilt``, the ratio of tilted to horizontal beam irradiance and
+    the airmass, are calculated only once. The results are the same as
+    calling :py:func:`get_sky_diffuse` for each model.
+
+    Parameters
+    ----------
+    surface_tilt : numeric
+        Panel tilt from horizontal. See :term:`surface_tilt`. [°]
+    surface_azimuth : numeric
+        Panel azimuth. See :term:`surface_azimuth`. [°]
+    solar_zenith : numeric
+        Solar zenith angle. See :term:`solar_zenith`. [°]
+    solar_azimuth : numeric
+        Solar azimuth angle. See :term:`solar_azimuth`. [°]
+    dni : numeric
+        Direct normal irradiance. See :term:`dni`. [Wm⁻²]
+    ghi : numeric
+        Global horizontal irradiance. See :term:`ghi`. [Wm⁻²]
+    dhi : numeric
+        Diffuse horizontal irradiance. See :term:`dhi`. [Wm⁻²]
+    dni_extra : numeric, optional
+        Extraterrestrial direct normal irradiance. See :term:`dni_extra`.
+        [Wm⁻²]
+    airmass : numeric, optional
+        Relative airmass, not adjusted for pressure.
+        See :term:`airmass_relative`. [unitless]
+    models : list of str, default all models
+        Sky diffuse models to evaluate. Any of ``'isotropic'``,
+        ``'klucher'``, ``'haydavies'``, ``'reindl'``, ``'king'``,
+        ``'perez'``, ``'perez-driesse'``.
+    model_perez : str, default 'allsitescomposite1990'
+        Used only for ``'perez'``. See :py:func:`~pvlib.irradiance.perez`.
+
+    Returns
+    -------
+    poa_sky_diffuse : OrderedDict or DataFrame
+        Sky diffuse irradiance in the plane of array with a key/column for
+        each model. A DataFrame is returned if any of the inputs is a
+        Series. [Wm⁻²]
+
+    Raises
+    ------
+    ValueError
+        If ``models`` contains one of ``'haydavies'``, ``'reindl'``,
+        ``'perez'`` or ``'perez-driesse'`` and ``dni_extra`` is not
+        specified.
+
+    Notes
+    -----
+    If ``airmass`` is not provided, it is calculated using the defaults in
+    :py:func:`~pvlib.atmosphere.get_relative_airmass`, as in
+    :py:func:`get_sky_diffuse`.
+
+    See also
+    --------
+    get_sky_diffuse
+    get_total_irradiance_multiorientation
+    """
+    models = [model.lower() for model in models]
+    invalid = set(models) - {'isotropic', 'klucher', 'haydavies', 'reindl',
+                             'king', 'perez', 'perez-driesse'}
+    if invalid:
+        raise ValueError(f'invalid model selection {invalid.pop()}')
+    if dni_extra is None:
+        for model in models:
+            if model in {'haydavies', 'reindl', 'perez', 'perez-driesse'}:
+                raise ValueError(f'dni_extra is required for model {model}')
+
+    index = None
+    for x in (solar_zenith, solar_azimuth, dni, ghi, dhi, dni_extra,
+              airmass, surface_tilt, surface_azimuth):
+        if isinstance(x, pd.Series):
+            index = x.index
+            break
+
+    surface_tilt, surface_azimuth, solar_zenith, solar_azimuth, dni, ghi, \
+        dhi = (np.asarray(x, dtype=float) for x in (
+            surface_tilt, surface_azimuth, solar_zenith, solar_azimuth, dni,
+            ghi, dhi))
+    if dni_extra is not None:
+        dni_extra = np.asarray(dni_extra, dtype=float)
+
+    # terms shared by the models
+    cos_tilt = tools.cosd(surface_tilt)
+    sin_half_tilt_cubed = tools.sind(0.5 * surface_tilt) ** 3
+    projection = aoi_projection(surface_tilt, surface_azimuth,
+                                solar_zenith, solar_azimuth)
+    cos_tt = np.maximum(projection, 0)  # GH 526
+    cos_solar_zenith = tools.cosd(solar_zenith)
+    # ratio of titled and horizontal beam irradiance
+    Rb = cos_tt / np.maximum(cos_solar_zenith, 0.01745)  # GH 432
+    if dni_extra is not None:
+        # Anisotropy Index
+        AI = dni / dni_extra
+    if ('perez' in models or 'perez-driesse' in models) and airmass is None:
+        airmass = atmosphere.get_relative_airmass(solar_zenith)
+    if airmass is not None:
+        airmass = np.asarray(airmass, dtype=float)
+
+    sky = OrderedDict()
+    for model in models:
+        if model == 'isotropic':
+            sky[model] = _isotropic(dhi, cos_tilt)
+        elif model == 'klucher':
+            sky[model] = _klucher(dhi, ghi, solar_zenith, cos_tt, cos_tilt,
+                                  sin_half_tilt_cubed)
+        elif model == 'haydavies':
+            poa_isotropic, poa_circumsolar = _haydavies(dhi, AI, Rb, cos_tilt)
+            sky[model] = poa_isotropic + poa_circumsolar
+        elif model == 'reindl':
+            sky[model] = _reindl(dhi, dni, ghi, cos_solar_zenith, AI, Rb,
+                                 cos_tilt, sin_half_tilt_cubed)
+        elif model == 'king':
+            sky[model] = _king(dhi, ghi, solar_zenith, cos_tilt)
+        elif model == 'perez':
+            sky_state = PerezSkyState(dhi, dni, dni_extra, solar_zenith,
+                                      airmass, model=model_perez)
+            term1, term2, term3 = _perez_diffuse_terms(
+                surface_tilt, projection, solar_zenith, sky_state.F1,
+                sky_state.F2)
+            sky_diffuse = np.maximum(dhi * (term1 + term2 + term3), 0)
+            sky[model] = np.where(np.isnan(airmass), 0, sky_diffuse)
+        elif model == 'perez-driesse':
+            F1, F2 = _perez_driesse_brightness_coefficients(
+                dhi, dni, dni_extra, solar_zenith, airmass)
+            term1, term2, term3 = _perez_diffuse_terms(
+                surface_tilt, projection, solar_zenith, F1, F2)
+            sky[model] = np.maximum(dhi * (term1 + term2 + term3), 0)
+
+    if index is not None:
+        sky = pd.DataFrame(sky, index=index)
+    return sky
+
+
 def poa_components(aoi, dni, poa_sky_diffuse, poa_ground_diffuse):
     r'''
     Determine in-plane irradiance components.
@@ -636,11 +1047,20 @@ def isotropic(surface_tilt, dhi):
        Energy vol. 201. pp. 8-12
        :doi:`10.1016/j.solener.2020.02.067`
     '''
-    sky_diffuse = dhi * (1 + tools.cosd(surface_tilt)) * 0.5
+    sky_diffuse = _isotropic(dhi, tools.cosd(surface_tilt))
 
     return sky_diffuse
 
 
+def _isotropic(dhi, cos_tilt):
+    '''
+    Isotropic sky diffuse irradiance from the cosine of the surface tilt.
+
+    Helper function for isotropic and get_sky_diffuse_ensemble.
+    '''
+    return dhi * (1 + cos_tilt) * 0.5
+
+
 def klucher(surface_tilt, surface_azimuth, dhi, ghi, solar_zenith,
             solar_azimuth):
     r'''
@@ -713,23 +1133,36 @@ def klucher(surface_tilt, surface_azimuth, dhi, ghi, solar_zenith,
                             solar_zenith, solar_azimuth)
     cos_tt = np.maximum(cos_tt, 0)  # GH 526
 
+    sky_diffuse = _klucher(dhi, ghi, solar_zenith, cos_tt,
+                           tools.cosd(surface_tilt),
+                           tools.sind(0.5 * surface_tilt) ** 3)
+
+    return sky_diffuse
+
+
+def _klucher(dhi, ghi, solar_zenith, cos_tt, cos_tilt, sin_half_tilt_cubed):
+    '''
+    Klucher sky diffuse irradiance from the cosine of the angle of
+    incidence ``cos_tt`` (limited to positive values) and the
+    trigonometric functions of the surface tilt.
+
+    Helper function for klucher and get_sky_diffuse_ensemble.
+    '''
     # silence warning from 0 / 0
     with np.errstate(invalid='ignore'):
         F = 1 - ((dhi / ghi) ** 2)
 
     try:
         # fails with single point input
-        F.fillna(0, inplace=True)
+        F = F.fillna(0)
     except AttributeError:
         F = np.where(np.isnan(F), 0, F)
 
-    term1 = 0.5 * (1 + tools.cosd(surface_tilt))
-    term2 = 1 + F * (tools.sind(0.5 * surface_tilt) ** 3)
+    term1 = 0.5 * (1 + cos_tilt)
+    term2 = 1 + F * sin_half_tilt_cubed
     term3 = 1 + F * (cos_tt ** 2) * (tools.sind(solar_zenith) ** 3)
 
-    sky_diffuse = dhi * term1 * term2 * term3
-
-    return sky_diffuse
+    return dhi * term1 * term2 * term3
 
 
 def haydavies(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
@@ -847,12 +1280,8 @@ def haydavies(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
     # Anisotropy Index
     AI = dni / dni_extra
 
-    # these are the () and [] sub-terms of the second term of eqn 7
-    term1 = 1 - AI
-    term2 = 0.5 * (1 + tools.cosd(surface_tilt))
-
-    poa_isotropic = np.maximum(dhi * term1 * term2, 0)
-    poa_circumsolar = np.maximum(dhi * (AI * Rb), 0)
+    poa_isotropic, poa_circumsolar = _haydavies(dhi, AI, Rb,
+                                                tools.cosd(surface_tilt))
     sky_diffuse = poa_isotropic + poa_circumsolar
 
     if return_components:
@@ -872,6 +1301,23 @@ def haydavies(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
         return sky_diffuse
 
 
+def _haydavies(dhi, AI, Rb, cos_tilt):
+    '''
+    Isotropic and circumsolar sky diffuse irradiance of the Hay and Davies
+    model from the anisotropy index ``AI`` and the ratio of tilted and
+    horizontal beam irradiance ``Rb``.
+
+    Helper function for haydavies and get_sky_diffuse_ensemble.
+    '''
+    # these are the () and [] sub-terms of the second term of eqn 7
+    term1 = 1 - AI
+    term2 = 0.5 * (1 + cos_tilt)
+
+    poa_isotropic = np.maximum(dhi * term1 * term2, 0)
+    poa_circumsolar = np.maximum(dhi * (AI * Rb), 0)
+    return poa_isotropic, poa_circumsolar
+
+
 def reindl(surface_tilt, surface_azimuth, dhi, dni, ghi, dni_extra,
            solar_zenith, solar_azimuth):
     r'''
@@ -969,20 +1415,34 @@ def reindl(surface_tilt, surface_azimuth, dhi, dni, ghi, dni_extra,
     # Anisotropy Index
     AI = dni / dni_extra
 
+    sky_diffuse = _reindl(dhi, dni, ghi, cos_solar_zenith, AI, Rb,
+                          tools.cosd(surface_tilt),
+                          tools.sind(0.5 * surface_tilt) ** 3)
+
+    return sky_diffuse
+
+
+def _reindl(dhi, dni, ghi, cos_solar_zenith, AI, Rb, cos_tilt,
+            sin_half_tilt_cubed):
+    '''
+    Reindl sky diffuse irradiance from the anisotropy index ``AI``, the
+    ratio of tilted and horizontal beam irradiance ``Rb`` and the
+    trigonometric functions of the surface tilt.
+
+    Helper function for reindl and get_sky_diffuse_ensemble.
+    '''
     # DNI projected onto horizontal
     HB = dni * cos_solar_zenith
     HB = np.maximum(HB, 0)
 
     # these are the () and [] sub-terms of the second term of eqn 8
     term1 = 1 - AI
-    term2 = 0.5 * (1 + tools.cosd(surface_tilt))
+    term2 = 0.5 * (1 + cos_tilt)
     with np.errstate(invalid='ignore', divide='ignore'):
         hb_to_ghi = np.where(ghi == 0, 0, np.divide(HB, ghi))
-    term3 = 1 + np.sqrt(hb_to_ghi) * (tools.sind(0.5 * surface_tilt)**3)
+    term3 = 1 + np.sqrt(hb_to_ghi) * sin_half_tilt_cubed
     sky_diffuse = dhi * (AI * Rb + term1 * term2 * term3)
-    sky_diffuse = np.maximum(sky_diffuse, 0)
-
-    return sky_diffuse
+    return np.maximum(sky_diffuse, 0)
 
 
 def king(surface_tilt, dhi, ghi, solar_zenith):
@@ -1017,17 +1477,27 @@ def king(surface_tilt, dhi, ghi, solar_zenith):
         The diffuse component of the solar radiation.
     '''
 
-    sky_diffuse = (dhi * (1 + tools.cosd(surface_tilt)) / 2 + ghi *
-                   (0.012 * solar_zenith - 0.04) *
-                   (1 - tools.cosd(surface_tilt)) / 2)
-    sky_diffuse = np.maximum(sky_diffuse, 0)
+    sky_diffuse = _king(dhi, ghi, solar_zenith, tools.cosd(surface_tilt))
 
     return sky_diffuse
 
 
+def _king(dhi, ghi, solar_zenith, cos_tilt):
+    '''
+    King sky diffuse irradiance from the cosine of the surface tilt.
+
+    Helper function for king and get_sky_diffuse_ensemble.
+    '''
+    sky_diffuse = (dhi * (1 + cos_tilt) / 2 + ghi *
+                   (0.012 * solar_zenith - 0.04) *
+                   (1 - cos_tilt) / 2)
+    return np.maximum(sky_diffuse, 0)
+
+
 def perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
           solar_zenith, solar_azimuth, airmass,
-          model='allsitescomposite1990', return_components=False):
+          model='allsitescomposite1990', return_components=False,
+          sky_state=None):
     '''
     Determine diffuse irradiance from the sky on a tilted surface using
     one of the Perez models.
@@ -1100,6 +1570,14 @@ def perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
         Flag used to decide whether to return the calculated diffuse components
         or not.
 
+    sky_state : PerezSkyState, optional
+        Precalculated orientation independent terms. If provided, ``model``
+        is ignored and F1 and F2 are taken from ``sky_state`` instead of
+        being calculated from ``dhi``, ``dni``, ``dni_extra``,
+        ``solar_zenith`` and ``airmass``, which must be the same inputs
+        used to create ``sky_state``.
+        See :py:class:`~pvlib.irradiance.PerezSkyState`.
+
     Returns
     --------
     numeric, OrderedDict, or DataFrame
@@ -1137,57 +1615,16 @@ def perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
        Perez Diffuse Radiation Model". SAND88-7030
     '''
 
-    kappa = 1.041  # for solar_zenith in radians
-    z = np.radians(solar_zenith)  # convert to radians
-
-    # delta is the sky's "brightness"
-    delta = dhi * airmass / dni_extra
-
-    # epsilon is the sky's "clearness"
-    with np.errstate(invalid='ignore'):
-        eps = ((dhi + dni) / dhi + kappa * (z ** 3)) / (1 + kappa * (z ** 3))
-
-    # numpy indexing below will not work with a Series
-    if isinstance(eps, pd.Series):
-        eps = eps.values
-
-    # Perez et al define clearness bins according to the following
-    # rules. 1 = overcast ... 8 = clear (these names really only make
-    # sense for small zenith angles, but...) these values will
-    # eventually be used as indicies for coeffecient look ups
-    ebin = np.digitize(eps, (0., 1.065, 1.23, 1.5, 1.95, 2.8, 4.5, 6.2))
-    ebin = np.array(ebin)  # GH 642
-    ebin[np.isnan(eps)] = 0
-
-    # correct for 0 indexing in coeffecient lookup
-    # later, ebin = -1 will yield nan coefficients
-    ebin -= 1
-
-    # The various possible sets of Perez coefficients are contained
-    # in a subfunction to clean up the code.
-    F1c, F2c = _get_perez_coefficients(model)
-
-    # results in invalid eps (ebin = -1) being mapped to nans
-    nans = np.array([np.nan, np.nan, np.nan])
-    F1c = np.vstack((F1c, nans))
-    F2c = np.vstack((F2c, nans))
-
-    F1 = (F1c[ebin, 0] + F1c[ebin, 1] * delta + F1c[ebin, 2] * z)
-    F1 = np.maximum(F1, 0)
-
-    F2 = (F2c[ebin, 0] + F2c[ebin, 1] * delta + F2c[ebin, 2] * z)
+    if sky_state is None:
+        sky_state = PerezSkyState(dhi, dni, dni_extra, solar_zenith, airmass,
+                                  model=model)
+    F1, F2 = sky_state.F1, sky_state.F2
 
     A = aoi_projection(surface_tilt, surface_azimuth,
                        solar_zenith, solar_azimuth)
-    A = np.maximum(A, 0)
 
-    B = tools.cosd(solar_zenith)
-    B = np.maximum(B, tools.cosd(85))
-
-    # Calculate Diffuse POA from sky dome
-    term1 = 0.5 * (1 - F1) * (1 + tools.cosd(surface_tilt))
-    term2 = F1 * A / B
-    term3 = F2 * tools.sind(surface_tilt)
+    term1, term2, term3 = _perez_diffuse_terms(surface_tilt, A, solar_zenith,
+                                               F1, F2)
 
     sky_diffuse = np.maximum(dhi * (term1 + term2 + term3), 0)
 
@@ -1219,6 +1656,127 @@ def perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
         return sky_diffuse
 
 
+class PerezSkyState:
+    """
+    Orientation independent terms of the Perez sky diffuse model.
+
+    The sky clearness bins, the sky brightness and the circumsolar and
+    horizon brightening coefficients F1 and F2 of :py:func:`perez` depend
+    only on the weather and the solar position. A ``PerezSkyState``
+    calculates them once so that they can be reused with
+    ``perez(..., sky_state=state)`` for any number of surface orientations.
+
+    Parameters
+    ----------
+    dhi : numeric
+        Diffuse horizontal irradiance, must be >=0. [Wm⁻²]
+    dni : numeric
+        Direct normal irradiance, must be >=0. [Wm⁻²]
+    dni_extra : numeric
+        Extraterrestrial normal irradiance. [Wm⁻²]
+    solar_zenith : numeric
+        apparent (refraction-corrected) zenith angle. [°]
+    airmass : numeric
+        Relative (not pressure-corrected) airmass values. [unitless]
+    model : string, default 'allsitescomposite1990'
+        A string which selects the desired set of Perez coefficients. See
+        :py:func:`perez` for the possible selections.
+
+    Attributes
+    ----------
+    ebin : numpy.ndarray
+        Sky clearness bin, from 1 (overcast) to 8 (clear). Invalid
+        clearness values are assigned bin 0 and give NaN coefficients.
+    delta : numeric
+        Sky brightness. [unitless]
+    F1 : numeric
+        Circumsolar brightening coefficient. [unitless]
+    F2 : numeric
+        Horizon brightening coefficient. [unitless]
+    airmass : numeric
+        Relative airmass used to calculate ``delta``. [unitless]
+    model : str
+        Name of the set of Perez coefficients.
+
+    Examples
+    --------
+    >>> state = PerezSkyState(dhi, dni, dni_extra, solar_zenith, airmass)
+    >>> south = perez(30, 180, dhi, dni, dni_extra, solar_zenith,
+    ...               solar_azimuth, airmass, sky_state=state)
+    >>> west = perez(30, 270, dhi, dni, dni_extra, solar_zenith,
+    ...              solar_azimuth, airmass, sky_state=state)
+
+    See also
+    --------
+    perez, get_total_irradiance_multiorientation
+    """
+
+    def __init__(self, dhi, dni, dni_extra, solar_zenith, airmass,
+                 model='allsitescomposite1990'):
+        kappa = 1.041  # for solar_zenith in radians
+        z = np.radians(solar_zenith)  # convert to radians
+
+        # delta is the sky's "brightness"
+        delta = dhi * airmass / dni_extra
+
+        # epsilon is the sky's "clearness"
+        with np.errstate(invalid='ignore'):
+            eps = (((dhi + dni) / dhi + kappa * (z ** 3)) /
+                   (1 + kappa * (z ** 3)))
+
+        # numpy indexing below will not work with a Series
+        if isinstance(eps, pd.Series):
+            eps = eps.values
+
+        # Perez et al define clearness bins according to the following
+        # rules. 1 = overcast ... 8 = clear (these names really only make
+        # sense for small zenith angles, but...) these values are used
+        # as indices into the coefficient tables, whose row 0 is nan.
+        # nan sorts after the last bin edge so that invalid eps falls in
+        # bin 9, which wraps around to row 0 along with eps < 0.
+        ebin = np.digitize(eps, _PEREZ_EPSILON_BINS) % 9
+        ebin = np.asarray(ebin)  # GH 642
+
+        F1c, F2c = _perez_coefficient_table(model)
+
+        F1 = (F1c[ebin, 0] + F1c[ebin, 1] * delta + F1c[ebin, 2] * z)
+        F1 = np.maximum(F1, 0)
+
+        F2 = (F2c[ebin, 0] + F2c[ebin, 1] * delta + F2c[ebin, 2] * z)
+
+        self.ebin = ebin
+        self.delta = delta
+        self.F1 = F1
+        self.F2 = F2
+        self.airmass = airmass
+        self.model = model
+
+    def __repr__(self):
+        return (f'{type(self).__name__}(model={self.model!r}, '
+                f'size={np.size(self.ebin)})')
+
+
+def _perez_diffuse_terms(surface_tilt, projection, solar_zenith, F1, F2):
+    '''
+    Compute the isotropic, circumsolar and horizon terms of the Perez sky
+    diffuse model from the brightening coefficients F1 and F2 and the
+    cosine of the angle of incidence ``projection``.
+
+    Helper function for perez and perez_driesse transposition.
+    '''
+    A = np.maximum(projection, 0)
+
+    B = tools.cosd(solar_zenith)
+    B = np.maximum(B, tools.cosd(85))
+
+    # Calculate Diffuse POA from sky dome
+    term1 = 0.5 * (1 - F1) * (1 + tools.cosd(surface_tilt))
+    term2 = F1 * A / B
+    term3 = F2 * tools.sind(surface_tilt)
+
+    return term1, term2, term3
+
+
 def _calc_delta(dhi, dni_extra, solar_zenith, airmass=None):
     '''
     Compute the delta parameter, which represents sky dome "brightness"
@@ -1291,6 +1849,8 @@ def _f(i, j, zeta):
 
     coefs = coefs.T.reshape((2, 3, 13))
 
+    from scipy.interpolate import splev
+
     tck = (knots, coefs[i-1, j-1], 2)
 
     return splev(zeta, tck)
@@ -1389,31 +1949,14 @@ def perez_driesse(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
     '''
     # Contributed by Anton Driesse (@adriesse), PV Performance Labs. Oct., 2023
 
-    delta = _calc_delta(dhi, dni_extra, solar_zenith, airmass)
-    zeta = _calc_zeta(dhi, dni, solar_zenith)
-
-    z = np.radians(solar_zenith)
-
-    F1 = _f(1, 1, zeta) + _f(1, 2, zeta) * delta + _f(1, 3, zeta) * z
-    F2 = _f(2, 1, zeta) + _f(2, 2, zeta) * delta + _f(2, 3, zeta) * z
-
-    # note the newly recommended upper limit on F1
-    F1 = np.clip(F1, 0, 0.9)
-
-    # lines after this point are identical to the original perez function
-    # with some checks removed
+    F1, F2 = _perez_driesse_brightness_coefficients(dhi, dni, dni_extra,
+                                                    solar_zenith, airmass)
 
     A = aoi_projection(surface_tilt, surface_azimuth,
                        solar_zenith, solar_azimuth)
-    A = np.maximum(A, 0)
 
-    B = tools.cosd(solar_zenith)
-    B = np.maximum(B, tools.cosd(85))
-
-    # Calculate Diffuse POA from sky dome
-    term1 = 0.5 * (1 - F1) * (1 + tools.cosd(surface_tilt))
-    term2 = F1 * A / B
-    term3 = F2 * tools.sind(surface_tilt)
+    term1, term2, term3 = _perez_diffuse_terms(surface_tilt, A, solar_zenith,
+                                               F1, F2)
 
     sky_diffuse = np.maximum(dhi * (term1 + term2 + term3), 0)
 
@@ -1434,6 +1977,30 @@ def perez_driesse(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
         return sky_diffuse
 
 
+def _perez_driesse_brightness_coefficients(dhi, dni, dni_extra,
+                                           solar_zenith, airmass=None):
+    '''
+    Compute the Perez-Driesse circumsolar and horizon brightening
+    coefficients F1 and F2.
+
+    The coefficients do not depend on the surface orientation.
+
+    Helper function for perez_driesse transposition.
+    '''
+    delta = _calc_delta(dhi, dni_extra, solar_zenith, airmass)
+    zeta = _calc_zeta(dhi, dni, solar_zenith)
+
+    z = np.radians(solar_zenith)
+
+    F1 = _f(1, 1, zeta) + _f(1, 2, zeta) * delta + _f(1, 3, zeta) * z
+    F2 = _f(2, 1, zeta) + _f(2, 2, zeta) * delta + _f(2, 3, zeta) * z
+
+    # note the newly recommended upper limit on F1
+    F1 = np.clip(F1, 0, 0.9)
+
+    return F1, F2
+
+
 def _poa_from_ghi(surface_tilt, surface_azimuth,
                   solar_zenith, solar_azimuth,
                   ghi,
@@ -1466,20 +2033,32 @@ def _ghi_from_poa(surface_tilt, surface_azimuth,
                   dni_extra, airmass, albedo,
                   xtol=0.01):
     '''
-    Reverse transposition function that uses the scalar bisection from scipy.
+    Reverse transposition function that solves all elements at once with
+    a vectorized bracketed root finder.
 
     Helper function for ghi_from_poa_driesse_2023.
     '''
     # Contributed by Anton Driesse (@adriesse), PV Performance Labs. Nov., 2023
 
+    poa_global, surface_tilt, surface_azimuth, solar_zenith, solar_azimuth, \
+        dni_extra, airmass, albedo = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (
+                poa_global, surface_tilt, surface_azimuth, solar_zenith,
+                solar_azimuth, dni_extra, airmass, albedo)))
+
+    ghi = np.full(poa_global.shape, np.nan)
+    conv = np.zeros(poa_global.shape, dtype=bool)
+    niter = np.zeros(poa_global.shape, dtype=int)
+
     # propagate nans and zeros quickly
-    if np.isnan(poa_global):
-        return np.nan, False, 0
-    if poa_global <= 0:
-        return 0.0, True, 0
+    zero = poa_global <= 0
+    ghi[zero] = 0.0
+    conv[zero] = True
+    solve = ~zero & ~np.isnan(poa_global)
 
     # function whose root needs to be found
-    def poa_error(ghi):
+    def poa_error(ghi, poa_global, surface_tilt, surface_azimuth,
+                  solar_zenith, solar_azimuth, dni_extra, airmass, albedo):
         poa_hat = _poa_from_ghi(surface_tilt, surface_azimuth,
                                 solar_zenith, solar_azimuth,
                                 ghi,
@@ -1490,24 +2069,15 @@ def _ghi_from_poa(surface_tilt, surface_azimuth,
     ghi_clear = dni_extra * tools.cosd(solar_zenith)
     ghi_high = np.maximum(10, 1.25 * ghi_clear)
 
-    try:
-        result = bisect(poa_error,
-                        a=0,
-                        b=ghi_high,
-                        xtol=xtol,
-                        maxiter=25,
-                        full_output=True,
-                        disp=False,
-                        )
-    except ValueError:
-        # this occurs when poa_error has the same sign at both end points
-        ghi = np.nan
-        conv = False
-        niter = -1
-    else:
-        ghi = result[0]
-        conv = result[1].converged
-        niter = result[1].iterations
+    args = tuple(x[solve] for x in (
+        poa_global, surface_tilt, surface_azimuth, solar_zenith,
+        solar_azimuth, dni_extra, airmass, albedo))
+    ghi[solve], conv[solve], niter_solve = tools._chandrupatla(
+        poa_error, 0, ghi_high[solve], args=args, xtol=xtol, maxiter=25,
+        full_output=True)
+    # poa_error has the same sign at both end points
+    not_bracketed = np.isnan(ghi[solve]) & (niter_solve == 0)
+    niter[solve] = np.where(not_bracketed, -1, niter_solve)
 
     return ghi, conv, niter
 
@@ -1520,8 +2090,8 @@ def ghi_from_poa_driesse_2023(surface_tilt, surface_azimuth,
                               full_output=False):
     '''
     Estimate global horizontal irradiance (GHI) from global plane-of-array
-    (POA) irradiance.  This reverse transposition algorithm uses a bisection
-    search together with the continuous Perez-Driesse transposition and
+    (POA) irradiance.  This reverse transposition algorithm uses a bracketed
+    root search together with the continuous Perez-Driesse transposition and
     continuous Erbs-Driesse decomposition models, as described in [1]_.
 
     Parameters
@@ -1570,13 +2140,15 @@ def ghi_from_poa_driesse_2023(surface_tilt, surface_azimuth,
         Present if full_output=True. Indicates which elements converged
         successfully.
     niter : integer, optional
-        Present if full_output=True. Indicates how many bisection iterations
-        were done.
+        Present if full_output=True. Indicates how many iterations
+        were done. -1 if the root could not be bracketed.
 
     Notes
     -----
-    Since :py:func:`scipy.optimize.bisect` is not vectorized, high-resolution
-    time series can be quite slow to process.
+    All elements are solved together using Chandrupatla's method [2]_, a
+    vectorized combination of bisection and inverse quadratic
+    interpolation. Each iteration only evaluates the elements that have
+    not converged yet.
 
     References
     ----------
@@ -1584,6 +2156,11 @@ def ghi_from_poa_driesse_2023(surface_tilt, surface_azimuth,
         Perez diffuse sky model for forward and reverse transposition.
         Solar Energy vol. 267. :doi:`10.1016/j.solener.2023.112093`
 
+    .. [2] T. R. Chandrupatla, "A new hybrid quadratic/bisection algorithm
+       for finding the zero of a nonlinear function without using
+       derivatives", Advances in Engineering Software, vol. 28, no. 3,
+       pp. 145-149, 1997. :doi:`10.1016/S0965-9978(96)00051-8`
+
     See also
     --------
     perez_driesse
@@ -1595,13 +2172,16 @@ def ghi_from_poa_driesse_2023(surface_tilt, surface_azimuth,
     if xtol <= 0:
         raise ValueError(f"xtol too small ({xtol:g} <= 0)")
 
-    ghi_from_poa_array = np.vectorize(_ghi_from_poa)
+    if airmass is None:
+        # same airmass model that perez_driesse uses by default
+        airmass = atmosphere.get_relative_airmass(solar_zenith,
+                                                  'kastenyoung1989')
 
-    ghi, conv, niter = ghi_from_poa_array(surface_tilt, surface_azimuth,
-                                          solar_zenith, solar_azimuth,
-                                          poa_global,
-                                          dni_extra, airmass, albedo,
-                                          xtol=xtol)
+    ghi, conv, niter = _ghi_from_poa(surface_tilt, surface_azimuth,
+                                     solar_zenith, solar_azimuth,
+                                     poa_global,
+                                     dni_extra, airmass, albedo,
+                                     xtol=xtol)
 
     if isinstance(poa_global, pd.Series):
         ghi = pd.Series(ghi, poa_global.index)
@@ -1995,7 +2575,7 @@ def dirint(ghi, solar_zenith, times, pressure=101325., use_delta_kt_prime=True,
                                             times)
     w = _temp_dew_dirint(temp_dew, times)
 
-    dirint_coeffs = _dirint_coeffs(times, kt_prime, solar_zenith, w,
+    dirint_coeffs = _dirint_coeffs(kt_prime, solar_zenith, w,
                                    delta_kt_prime)
 
     # Perez eqn 5
@@ -2015,7 +2595,7 @@ def _dirint_from_dni_ktprime(dni, kt_prime, solar_zenith, use_delta_kt_prime,
     delta_kt_prime = _delta_kt_prime_dirint(kt_prime, use_delta_kt_prime,
                                             times)
     w = _temp_dew_dirint(temp_dew, times)
-    dirint_coeffs = _dirint_coeffs(times, kt_prime, solar_zenith, w,
+    dirint_coeffs = _dirint_coeffs(kt_prime, solar_zenith, w,
                                    delta_kt_prime)
     dni_dirint = dni * dirint_coeffs
     return dni_dirint
@@ -2027,22 +2607,41 @@ def _delta_kt_prime_dirint(kt_prime, use_delta_kt_prime, times):
     for use with :py:func:`_dirint_bins`.
     """
     if use_delta_kt_prime:
-        # Perez eqn 2
-        kt_next = kt_prime.shift(-1)
-        kt_previous = kt_prime.shift(1)
-        # replace nan with values that implement Perez Eq 3 for first and last
-        # positions. Use kt_previous and kt_next to handle series of length 1
-        kt_next.iloc[-1] = kt_previous.iloc[-1]
-        kt_previous.iloc[0] = kt_next.iloc[0]
-        delta_kt_prime = 0.5 * ((kt_prime - kt_next).abs().add(
-                                (kt_prime - kt_previous).abs(),
-                                fill_value=0))
+        kt_prime = np.asarray(kt_prime, dtype=float)
+        delta_kt_prime = _delta_kt_prime(kt_prime, np.arange(len(kt_prime)))
+        delta_kt_prime = pd.Series(delta_kt_prime, index=times)
     else:
         # do not change unless also modifying _dirint_bins
         delta_kt_prime = pd.Series(-1, index=times)
     return delta_kt_prime
 
 
+def _delta_kt_prime(kt_prime, index):
+    """
+    Calculate delta_kt_prime (Perez eqn 2 and eqn 3) of the elements
+    ``index`` of the array ``kt_prime``.
+    """
+    n = len(kt_prime)
+    # position n is nan and stands in for missing neighbors. Perez eqn 3
+    # uses the only available neighbor at the first and last positions.
+    kt_prime_ext = np.append(kt_prime, np.nan)
+    has_next = index + 1 < n
+    has_previous = index >= 1
+    index_next = np.where(has_next, index + 1,
+                          np.where(has_previous, index - 1, n))
+    index_previous = np.where(has_previous, index - 1,
+                              np.where(has_next, index + 1, n))
+
+    kt = kt_prime_ext[index]
+    diff_next = np.abs(kt - kt_prime_ext[index_next])
+    diff_previous = np.abs(kt - kt_prime_ext[index_previous])
+    # Perez eqn 2, a nan difference only counts as 0 if the other is valid
+    delta_kt_prime = 0.5 * np.where(
+        np.isnan(diff_next) & np.isnan(diff_previous), np.nan,
+        np.nan_to_num(diff_next) + np.nan_to_num(diff_previous))
+    return delta_kt_prime
+
+
 def _temp_dew_dirint(temp_dew, times):
     """
     Calculate precipitable water from surface dew point temp (Perez eqn 4),
@@ -2057,7 +2656,7 @@ def _temp_dew_dirint(temp_dew, times):
     return w
 
 
-def _dirint_coeffs(times, kt_prime, solar_zenith, w, delta_kt_prime):
+def _dirint_coeffs(kt_prime, solar_zenith, w, delta_kt_prime):
     """
     Determine the DISC to DIRINT multiplier `dirint_coeffs`.
 
@@ -2065,7 +2664,6 @@ def _dirint_coeffs(times, kt_prime, solar_zenith, w, delta_kt_prime):
 
     Parameters
     ----------
-    times : pd.DatetimeIndex
     kt_prime : Zenith-independent clearness index. [unitless]
     solar_zenith : Solar zenith angle. [°]
     w : precipitable water estimated from surface dew-point temperature. [cm]
@@ -2073,33 +2671,38 @@ def _dirint_coeffs(times, kt_prime, solar_zenith, w, delta_kt_prime):
 
     Returns
     -------
-    dirint_coeffs : array-like
+    dirint_coeffs : np.ndarray
     """
     kt_prime_bin, zenith_bin, w_bin, delta_kt_prime_bin = \
-        _dirint_bins(times, kt_prime, solar_zenith, w, delta_kt_prime)
-
-    # get the coefficients
-    coeffs = _get_dirint_coeffs()
+        _dirint_bins(kt_prime, solar_zenith, w, delta_kt_prime)
 
-    # subtract 1 to account for difference between MATLAB-style bin
-    # assignment and Python-style array lookup.
-    dirint_coeffs = coeffs[kt_prime_bin-1, zenith_bin-1,
-                           delta_kt_prime_bin-1, w_bin-1]
+    # get the coefficients. the table is padded with nan at index 0 of
+    # each axis so that unassigned bins are converted to nan.
+    coeffs = _dirint_coefficient_table()
 
-    # convert unassigned bins to nan
-    dirint_coeffs = np.where((kt_prime_bin == 0) | (zenith_bin == 0) |
-                             (w_bin == 0) | (delta_kt_prime_bin == 0),
-                             np.nan, dirint_coeffs)
+    dirint_coeffs = coeffs[kt_prime_bin, zenith_bin,
+                           delta_kt_prime_bin, w_bin]
     return dirint_coeffs
 
 
-def _dirint_bins(times, kt_prime, zenith, w, delta_kt_prime):
+# Upper edges of the DIRINT bins. The kt_prime and delta_kt_prime bins are
+# closed at 1, and values above 1 fall into an extra bin. Appending nan as
+# the last edge of the zenith and w bins puts nan values in an extra bin.
+# The extra bins are wrapped around to the unassigned bin 0 with a modulo.
+_DIRINT_KT_PRIME_BINS = np.array([0, 0.24, 0.4, 0.56, 0.7, 0.8,
+                                  np.nextafter(1, 2)])
+_DIRINT_ZENITH_BINS = np.array([0, 25, 40, 55, 70, 80, np.nan])
+_DIRINT_W_BINS = np.array([0, 1, 2, 3, np.nan])
+_DIRINT_DELTA_KT_PRIME_BINS = np.array([0, 0.015, 0.035, 0.07, 0.15, 0.3,
+                                        np.nextafter(1, 2)])
+
+
+def _dirint_bins(kt_prime, zenith, w, delta_kt_prime):
     """
     Determine the bins for the DIRINT coefficients.
 
     Parameters
     ----------
-    times : pd.DatetimeIndex
     kt_prime : Zenith-independent clearness index
     zenith : Solar zenith angle
     w : precipitable water estimated from surface dew-point temperature
@@ -2108,46 +2711,29 @@ def _dirint_bins(times, kt_prime, zenith, w, delta_kt_prime):
     Returns
     -------
     tuple of kt_prime_bin, zenith_bin, w_bin, delta_kt_prime_bin
+        Bins use MATLAB's 1-indexing. Values that do not fall in any bin
+        are assigned bin 0.
     """
-    # @wholmgren: the following bin assignments use MATLAB's 1-indexing.
-    # Later, we'll subtract 1 to conform to Python's 0-indexing.
-
-    # Create kt_prime bins
-    kt_prime_bin = pd.Series(0, index=times, dtype=np.int64)
-    kt_prime_bin[(kt_prime >= 0) & (kt_prime < 0.24)] = 1
-    kt_prime_bin[(kt_prime >= 0.24) & (kt_prime < 0.4)] = 2
-    kt_prime_bin[(kt_prime >= 0.4) & (kt_prime < 0.56)] = 3
-    kt_prime_bin[(kt_prime >= 0.56) & (kt_prime < 0.7)] = 4
-    kt_prime_bin[(kt_prime >= 0.7) & (kt_prime < 0.8)] = 5
-    kt_prime_bin[(kt_prime >= 0.8) & (kt_prime <= 1)] = 6
-
-    # Create zenith angle bins
-    zenith_bin = pd.Series(0, index=times, dtype=np.int64)
-    zenith_bin[(zenith >= 0) & (zenith < 25)] = 1
-    zenith_bin[(zenith >= 25) & (zenith < 40)] = 2
-    zenith_bin[(zenith >= 40) & (zenith < 55)] = 3
-    zenith_bin[(zenith >= 55) & (zenith < 70)] = 4
-    zenith_bin[(zenith >= 70) & (zenith < 80)] = 5
-    zenith_bin[(zenith >= 80)] = 6
-
-    # Create the bins for w based on dew point temperature
-    w_bin = pd.Series(0, index=times, dtype=np.int64)
-    w_bin[(w >= 0) & (w < 1)] = 1
-    w_bin[(w >= 1) & (w < 2)] = 2
-    w_bin[(w >= 2) & (w < 3)] = 3
-    w_bin[(w >= 3)] = 4
-    w_bin[(w == -1)] = 5
-
-    # Create delta_kt_prime binning.
-    delta_kt_prime_bin = pd.Series(0, index=times, dtype=np.int64)
-    delta_kt_prime_bin[(delta_kt_prime >= 0) & (delta_kt_prime < 0.015)] = 1
-    delta_kt_prime_bin[(delta_kt_prime >= 0.015) &
-                       (delta_kt_prime < 0.035)] = 2
-    delta_kt_prime_bin[(delta_kt_prime >= 0.035) & (delta_kt_prime < 0.07)] = 3
-    delta_kt_prime_bin[(delta_kt_prime >= 0.07) & (delta_kt_prime < 0.15)] = 4
-    delta_kt_prime_bin[(delta_kt_prime >= 0.15) & (delta_kt_prime < 0.3)] = 5
-    delta_kt_prime_bin[(delta_kt_prime >= 0.3) & (delta_kt_prime <= 1)] = 6
-    delta_kt_prime_bin[delta_kt_prime == -1] = 7
+    kt_prime = np.asarray(kt_prime, dtype=float)
+    zenith = np.asarray(zenith, dtype=float)
+    w = np.asarray(w, dtype=float)
+    delta_kt_prime = np.asarray(delta_kt_prime, dtype=float)
+
+    # kt_prime < 0 gives 0, kt_prime > 1 and nan give 7
+    kt_prime_bin = np.digitize(kt_prime, _DIRINT_KT_PRIME_BINS) % 7
+
+    # zenith < 0 gives 0, nan gives 7
+    zenith_bin = np.digitize(zenith, _DIRINT_ZENITH_BINS) % 7
+
+    # the bins for w based on dew point temperature. w = -1 means that
+    # no dew point temperature is available.
+    w_bin = np.digitize(w, _DIRINT_W_BINS) % 5
+    w_bin = np.where(w == -1, 5, w_bin)
+
+    # delta_kt_prime = -1 means that delta_kt_prime is not used
+    delta_kt_prime_bin = np.digitize(delta_kt_prime,
+                                     _DIRINT_DELTA_KT_PRIME_BINS) % 7
+    delta_kt_prime_bin = np.where(delta_kt_prime == -1, 7, delta_kt_prime_bin)
 
     return kt_prime_bin, zenith_bin, w_bin, delta_kt_prime_bin
 
@@ -2258,7 +2844,7 @@ def gti_dirint(poa_global, aoi, solar_zenith, solar_azimuth, times,
                surface_tilt, surface_azimuth, pressure=101325.,
                use_delta_kt_prime=True, temp_dew=None, albedo=.25,
                model='perez', model_perez='allsitescomposite1990',
-               calculate_gt_90=True, max_iterations=30):
+               calculate_gt_90=True, max_iterations=30, full_output=False):
     """
     Determine GHI, DNI, DHI from POA global using the GTI DIRINT model.
 
@@ -2330,6 +2916,10 @@ def gti_dirint(poa_global, aoi, solar_zenith, solar_azimuth, times,
     max_iterations : int, default 30
         Maximum number of iterations for the aoi < 90 deg algorithm.
 
+    full_output : bool, default False
+        If full_output is False, only ``data`` is returned, otherwise the
+        return value is (``data``, ``converged``, ``niter``).
+
     Returns
     -------
     data : DataFrame
@@ -2339,6 +2929,16 @@ def gti_dirint(poa_global, aoi, solar_zenith, solar_azimuth, times,
         * ``dni``: the modeled direct normal irradiance. [Wm⁻²]
         * ``dhi``: the modeled diffuse horizontal irradiance. [Wm⁻²]
 
+    converged : Series, optional
+        Present if full_output=True. True where the modeled POA global
+        irradiance of the aoi < 90 deg algorithm is within 1 Wm⁻² of
+        ``poa_global``.
+
+    niter : Series, optional
+        Present if full_output=True. Number of iterations of the
+        aoi < 90 deg algorithm evaluated at each time. Times are removed
+        from the iteration once they have converged.
+
     References
     ----------
     .. [1] B. Marion, A model for deriving the direct normal and
@@ -2353,7 +2953,7 @@ def gti_dirint(poa_global, aoi, solar_zenith, solar_azimuth, times,
     aoi_lt_90 = aoi < 90
 
     # for AOI less than 90 degrees
-    ghi, dni, dhi, kt_prime = _gti_dirint_lt_90(
+    ghi, dni, dhi, kt_prime, converged, niter = _gti_dirint_lt_90(
         poa_global, aoi, aoi_lt_90, solar_zenith, solar_azimuth, times,
         surface_tilt, surface_azimuth, pressure=pressure,
         use_delta_kt_prime=use_delta_kt_prime, temp_dew=temp_dew,
@@ -2377,7 +2977,12 @@ def gti_dirint(poa_global, aoi, solar_zenith, solar_azimuth, times,
 
     output = pd.DataFrame(output, index=times)
 
-    return output
+    if full_output:
+        converged = pd.Series(converged & aoi_lt_90, index=times)
+        niter = pd.Series(niter, index=times)
+        return output, converged, niter
+    else:
+        return output
 
 
 def _gti_dirint_check_input(aoi):
@@ -2399,15 +3004,46 @@ def _gti_dirint_lt_90(poa_global, aoi, aoi_lt_90, solar_zenith, solar_azimuth,
     """
     GTI-DIRINT model for AOI < 90 degrees. See Marion 2015 Section 2.1.
 
+    Points are removed from the calculation once the modeled GTI is within
+    1 Wm⁻² of ``poa_global``. Each iteration only evaluates the points that
+    have not converged yet.
+
     See gti_dirint signature for parameter details.
+
+    Returns
+    -------
+    ghi, dni, dhi, kt_prime : Series
+        Best values for all times. Index is ``times``.
+    converged : np.ndarray of bool
+        True where the modeled GTI is within 1 Wm⁻² of ``poa_global``.
+    niter : np.ndarray of int
+        Number of iterations evaluated at each time.
     """
-    I0 = get_extra_radiation(times, 1370, 'spencer')
+    n = len(times)
+
+    def _as_array(x):
+        # full length arrays so that the working set can be indexed
+        return np.broadcast_to(np.asarray(x, dtype=float), (n,))
+
+    I0 = _as_array(get_extra_radiation(times, 1370, 'spencer'))
+    poa_global = _as_array(poa_global)
+    aoi = _as_array(aoi)
+    aoi_lt_90 = np.broadcast_to(np.asarray(aoi_lt_90, dtype=bool), (n,))
+    solar_zenith = _as_array(solar_zenith)
+    solar_azimuth = _as_array(solar_azimuth)
+    surface_tilt = _as_array(surface_tilt)
+    surface_azimuth = _as_array(surface_azimuth)
+    albedo = _as_array(albedo)
+
     cos_zenith = tools.cosd(solar_zenith)
     # I0h as in Marion 2015 eqns 1, 3
     I0h = I0 * np.maximum(0.065, cos_zenith)
 
     airmass = atmosphere.get_relative_airmass(solar_zenith, model='kasten1966')
-    airmass = atmosphere.get_absolute_airmass(airmass, pressure)
+    airmass = _as_array(atmosphere.get_absolute_airmass(airmass, pressure))
+
+    # precipitable water does not change between iterations
+    w = np.asarray(_temp_dew_dirint(temp_dew, times), dtype=float)
 
     # these coeffs and diff variables and the loop below
     # implement figure 1 of Marion 2015
@@ -2422,36 +3058,56 @@ def _gti_dirint_lt_90(poa_global, aoi, aoi_lt_90, solar_zenith, solar_azimuth,
     coeffs[20:] = 0.125
     coeffs = coeffs[:max_iterations]  # covers case where max_iterations < 30
 
-    # initialize diff
-    diff = pd.Series(9999, index=times)
-    best_diff = diff
+    best_diff = np.full(n, 9999.)
+    best_ghi = np.full(n, np.nan)
+    best_dni = np.full(n, np.nan)
+    best_dhi = np.full(n, np.nan)
+    best_kt_prime = np.full(n, np.nan)
+    niter = np.zeros(n, dtype=int)
 
-    # initialize poa_global_i
-    poa_global_i = poa_global
+    # poa_global_i and kt_prime hold the latest values for every time.
+    # converged times keep their last kt_prime, which is still needed by
+    # their neighbors to calculate delta_kt_prime.
+    poa_global_i = poa_global.copy()
+    kt_prime = np.full(n, np.nan)
+
+    # the working set of times that have not converged. all times are
+    # evaluated on the first iteration.
+    idx = np.arange(n)
 
     for iteration, coeff in enumerate(coeffs):
 
         # test if difference between modeled GTI and
         # measured GTI (poa_global) is less than 1 Wm⁻²
         # only test for aoi less than 90 deg
-        best_diff_lte_1 = best_diff <= 1
-        best_diff_lte_1_lt_90 = best_diff_lte_1[aoi_lt_90]
-        if best_diff_lte_1_lt_90.all():
-            # all aoi < 90 points have a difference <= 1, so break loop
-            break
+        if iteration > 0:
+            idx = idx[~(best_diff[idx] <= 1)]
+            if not aoi_lt_90[idx].any():
+                # all aoi < 90 points have a difference <= 1, so break loop
+                break
+
+        niter[idx] += 1
+        zenith_i = solar_zenith[idx]
+        I0_i = I0[idx]
+        airmass_i = airmass[idx]
 
         # calculate kt and DNI from GTI
-        kt = clearness_index(poa_global_i, aoi, I0)  # kt from Marion eqn 2
-        disc_dni = np.maximum(_disc_kn(kt, airmass)[0] * I0, 0)
-        kt_prime = clearness_index_zenith_independent(kt, airmass)
+        kt = clearness_index(poa_global_i[idx], aoi[idx], I0_i)  # Marion eqn 2
+        disc_dni = np.maximum(_disc_kn(kt, airmass_i)[0] * I0_i, 0)
+        kt_prime[idx] = clearness_index_zenith_independent(kt, airmass_i)
+        if use_delta_kt_prime:
+            delta_kt_prime = _delta_kt_prime(kt_prime, idx)
+        else:
+            # do not change unless also modifying _dirint_bins
+            delta_kt_prime = np.full(len(idx), -1.)
         # dirint DNI in Marion eqn 3
-        dni = _dirint_from_dni_ktprime(disc_dni, kt_prime, solar_zenith,
-                                       use_delta_kt_prime, temp_dew)
+        dni = disc_dni * _dirint_coeffs(kt_prime[idx], zenith_i, w[idx],
+                                        delta_kt_prime)
 
         # calculate DHI using Marion eqn 3 (identify 1st term on RHS as GHI)
         # I0h has a minimum zenith projection, but multiplier of DNI does not
-        ghi = kt * I0h                  # Kt * I0 * max(0.065, cos(zen))
-        dhi = ghi - dni * cos_zenith    # no cos(zen) restriction here
+        ghi = kt * I0h[idx]                  # Kt * I0 * max(0.065, cos(zen))
+        dhi = ghi - dni * cos_zenith[idx]    # no cos(zen) restriction here
 
         # following SSC code
         dni = np.maximum(dni, 0)
@@ -2462,50 +3118,50 @@ def _gti_dirint_lt_90(poa_global, aoi, aoi_lt_90, solar_zenith, solar_azimuth,
         # GTI-DIRINT uses perez transposition model, but we allow for
         # any model here
         all_irrad = get_total_irradiance(
-            surface_tilt, surface_azimuth, solar_zenith, solar_azimuth,
-            dni, ghi, dhi, dni_extra=I0, airmass=airmass,
-            albedo=albedo, model=model, model_perez=model_perez)
+            surface_tilt[idx], surface_azimuth[idx], zenith_i,
+            solar_azimuth[idx], dni, ghi, dhi, dni_extra=I0_i,
+            airmass=airmass_i, albedo=albedo[idx], model=model,
+            model_perez=model_perez)
 
         gti_model = all_irrad['poa_global']
 
         # calculate new diff
-        diff = gti_model - poa_global
+        diff = gti_model - poa_global[idx]
 
         # determine if the new diff is smaller in magnitude
-        # than the old diff
-        diff_abs = diff.abs()
-        smallest_diff = diff_abs < best_diff
-
-        # save the best differences
-        best_diff = diff_abs.where(smallest_diff, best_diff)
-
-        # on first iteration, the best values are the only values
-        if iteration == 0:
-            best_ghi = ghi
-            best_dni = dni
-            best_dhi = dhi
-            best_kt_prime = kt_prime
-        else:
-            # save new DNI, DHI, DHI if they provide the best consistency
-            # otherwise use the older values.
-            best_ghi = ghi.where(smallest_diff, best_ghi)
-            best_dni = dni.where(smallest_diff, best_dni)
-            best_dhi = dhi.where(smallest_diff, best_dhi)
-            best_kt_prime = kt_prime.where(smallest_diff, best_kt_prime)
+        # than the old diff. on first iteration, the best values are
+        # the only values
+        diff_abs = np.abs(diff)
+        smallest_diff = (diff_abs < best_diff[idx]) | (iteration == 0)
+        best = idx[smallest_diff]
+
+        # save the best differences, and save new DNI, DHI, DHI if they
+        # provide the best consistency. otherwise keep the older values.
+        best_diff[best] = diff_abs[smallest_diff]
+        best_ghi[best] = ghi[smallest_diff]
+        best_dni[best] = dni[smallest_diff]
+        best_dhi[best] = dhi[smallest_diff]
+        best_kt_prime[best] = kt_prime[best]
 
         # calculate adjusted inputs for next iteration. Marion eqn 4
-        poa_global_i = np.maximum(1.0, poa_global_i - coeff * diff)
+        poa_global_i[idx] = np.maximum(1.0, poa_global_i[idx] - coeff * diff)
     else:
         # we are here because we ran out of coeffs to loop over and
         # therefore we have exceeded max_iterations
-        failed_points = best_diff[aoi_lt_90][~best_diff_lte_1_lt_90]
+        failed = aoi_lt_90 & ~(best_diff <= 1)
+        failed_points = pd.Series(best_diff, index=times)[failed]
         warnings.warn(
             ('%s points failed to converge after %s iterations. best_diff:\n%s'
              % (len(failed_points), max_iterations, failed_points)),
             RuntimeWarning)
 
     # return the best data, whether or not the solution converged
-    return best_ghi, best_dni, best_dhi, best_kt_prime
+    best_ghi = pd.Series(best_ghi, index=times)
+    best_dni = pd.Series(best_dni, index=times)
+    best_dhi = pd.Series(best_dhi, index=times)
+    best_kt_prime = pd.Series(best_kt_prime, index=times)
+    converged = best_diff <= 1
+    return best_ghi, best_dni, best_dhi, best_kt_prime, converged, niter
 
 
 def _gti_dirint_gte_90(poa_global, aoi, solar_zenith, solar_azimuth,
@@ -2656,25 +3312,8 @@ def erbs(ghi, zenith, datetime_or_doy, min_cos_zenith=0.065, max_zenith=87):
     kt = clearness_index(ghi, zenith, dni_extra, min_cos_zenith=min_cos_zenith,
                          max_clearness_index=1)
 
-    # For Kt <= 0.22, set the diffuse fraction
-    df = 1 - 0.09*kt
-
-    # For Kt > 0.22 and Kt <= 0.8, set the diffuse fraction
-    df = np.where((kt > 0.22) & (kt <= 0.8),
-                  0.9511 - 0.1604*kt + 4.388*kt**2 -
-                  16.638*kt**3 + 12.336*kt**4,
-                  df)
-
-    # For Kt > 0.8, set the diffuse fraction
-    df = np.where(kt > 0.8, 0.165, df)
-
-    dhi = df * ghi
-
-    dni = (ghi - dhi) / tools.cosd(zenith)
-    bad_values = (zenith > max_zenith) | (ghi < 0) | (dni < 0)
-    dni = np.where(bad_values, 0, dni)
-    # ensure that closure relationship remains valid
-    dhi = np.where(bad_values, ghi, dhi)
+    df = _erbs_diffuse_fraction(kt)
+    dni, dhi = _diffuse_fraction_components(ghi, zenith, df, max_zenith)
 
     data = OrderedDict()
     data['dni'] = dni
@@ -2769,19 +3408,12 @@ def erbs_driesse(ghi, zenith, datetime_or_doy=None, dni_extra=None,
     See also
     --------
     erbs
-    dirint
-    disc
-    orgill_hollands
-    boland
-    """
-    # Contributed by Anton Driesse (@adriesse), PV Performance Labs. Aug., 2023
-
-    # central polynomial coefficients with float64 precision
-    p = [+12.26911439571261000,
-         -16.47050842469730700,
-         +04.24692671521831700,
-         -00.11390583806313881,
-         +00.94629663357100100]
+    dirint
+    disc
+    orgill_hollands
+    boland
+    """
+    # Contributed by Anton Driesse (@adriesse), PV Performance Labs. Aug., 2023
 
     if datetime_or_doy is None and dni_extra is None:
         raise ValueError('Either datetime_or_doy or dni_extra '
@@ -2796,22 +3428,8 @@ def erbs_driesse(ghi, zenith, datetime_or_doy=None, dni_extra=None,
     kt = clearness_index(ghi, zenith, dni_extra, min_cos_zenith=min_cos_zenith,
                          max_clearness_index=1)
 
-    # For all Kt, set the default diffuse fraction
-    df = 1 - 0.09 * kt
-
-    # For Kt > 0.216, update the diffuse fraction
-    df = np.where(kt > 0.216, np.polyval(p, kt), df)
-
-    # For Kt > 0.792, update the diffuse fraction again
-    df = np.where(kt > 0.792, 0.165, df)
-
-    dhi = df * ghi
-
-    dni = (ghi - dhi) / tools.cosd(zenith)
-    bad_values = (zenith > max_zenith) | (ghi < 0) | (dni < 0)
-    dni = np.where(bad_values, 0, dni)
-    # ensure that closure relationship remains valid
-    dhi = np.where(bad_values, ghi, dhi)
+    df = _erbs_driesse_diffuse_fraction(kt)
+    dni, dhi = _diffuse_fraction_components(ghi, zenith, df, max_zenith)
 
     data = OrderedDict()
     data['dni'] = dni
@@ -2893,23 +3511,8 @@ def orgill_hollands(ghi, zenith, datetime_or_doy, dni_extra=None,
     kt = clearness_index(ghi, zenith, dni_extra, min_cos_zenith=min_cos_zenith,
                          max_clearness_index=1)
 
-    # For Kt < 0.35, set the diffuse fraction
-    df = 1 - 0.249*kt
-
-    # For Kt >= 0.35 and Kt <= 0.75, set the diffuse fraction
-    df = np.where((kt >= 0.35) & (kt <= 0.75),
-                  1.557 - 1.84*kt, df)
-
-    # For Kt > 0.75, set the diffuse fraction
-    df = np.where(kt > 0.75, 0.177, df)
-
-    dhi = df * ghi
-
-    dni = (ghi - dhi) / tools.cosd(zenith)
-    bad_values = (zenith > max_zenith) | (ghi < 0) | (dni < 0)
-    dni = np.where(bad_values, 0, dni)
-    # ensure that closure relationship remains valid
-    dhi = np.where(bad_values, ghi, dhi)
+    df = _orgill_hollands_diffuse_fraction(kt)
+    dni, dhi = _diffuse_fraction_components(ghi, zenith, df, max_zenith)
 
     data = OrderedDict()
     data['dni'] = dni
@@ -3008,29 +3611,115 @@ def boland(ghi, solar_zenith, datetime_or_doy, a_coeff=8.645, b_coeff=0.613,
         ghi, solar_zenith, dni_extra, min_cos_zenith=min_cos_zenith,
         max_clearness_index=1)
 
+    df = _boland_diffuse_fraction(kt, a_coeff, b_coeff)
+    dni, dhi = _diffuse_fraction_components(ghi, solar_zenith, df,
+                                            max_zenith)
+
+    data = OrderedDict()
+    data['dni'] = dni
+    data['dhi'] = dhi
+    data['kt'] = kt
+
+    if isinstance(datetime_or_doy, pd.DatetimeIndex):
+        data = pd.DataFrame(data, index=datetime_or_doy)
+
+    return data
+
+
+def _diffuse_fraction_components(ghi, zenith, df, max_zenith):
+    """
+    Calculate DNI and DHI from the diffuse fraction ``df`` of GHI.
+
+    Supports :py:func:`erbs`, :py:func:`erbs_driesse`,
+    :py:func:`orgill_hollands`, :py:func:`boland` and
+    :py:func:`decomposition_ensemble`.
+    """
+    dhi = df * ghi
+
+    dni = (ghi - dhi) / tools.cosd(zenith)
+    bad_values = (zenith > max_zenith) | (ghi < 0) | (dni < 0)
+    dni = np.where(bad_values, 0, dni)
+    # ensure that closure relationship remains valid
+    dhi = np.where(bad_values, ghi, dhi)
+    return dni, dhi
+
+
+def _erbs_diffuse_fraction(kt):
+    """Diffuse fraction of the Erbs model."""
+    # For Kt <= 0.22, set the diffuse fraction
+    df = 1 - 0.09*kt
+
+    # For Kt > 0.22 and Kt <= 0.8, set the diffuse fraction
+    df = np.where((kt > 0.22) & (kt <= 0.8),
+                  0.9511 - 0.1604*kt + 4.388*kt**2 -
+                  16.638*kt**3 + 12.336*kt**4,
+                  df)
+
+    # For Kt > 0.8, set the diffuse fraction
+    df = np.where(kt > 0.8, 0.165, df)
+    return df
+
+
+def _erbs_driesse_diffuse_fraction(kt):
+    """Diffuse fraction of the continuous Erbs-Driesse model."""
+    # central polynomial coefficients with float64 precision
+    p = [+12.26911439571261000,
+         -16.47050842469730700,
+         +04.24692671521831700,
+         -00.11390583806313881,
+         +00.94629663357100100]
+
+    # For all Kt, set the default diffuse fraction
+    df = 1 - 0.09 * kt
+
+    # For Kt > 0.216, update the diffuse fraction
+    df = np.where(kt > 0.216, np.polyval(p, kt), df)
+
+    # For Kt > 0.792, update the diffuse fraction again
+    df = np.where(kt > 0.792, 0.165, df)
+    return df
+
+
+def _orgill_hollands_diffuse_fraction(kt):
+    """Diffuse fraction of the Orgill and Hollands model."""
+    # For Kt < 0.35, set the diffuse fraction
+    df = 1 - 0.249*kt
+
+    # For Kt >= 0.35 and Kt <= 0.75, set the diffuse fraction
+    df = np.where((kt >= 0.35) & (kt <= 0.75),
+                  1.557 - 1.84*kt, df)
+
+    # For Kt > 0.75, set the diffuse fraction
+    df = np.where(kt > 0.75, 0.177, df)
+    return df
+
+
+def _boland_diffuse_fraction(kt, a_coeff=8.645, b_coeff=0.613):
+    """Diffuse fraction of the Boland model."""
     # Boland equation
     df = 1.0 / (1.0 + np.exp(a_coeff * (kt - b_coeff)))
     # NOTE: [2] has different coefficients, for different time intervals
     # 15-min: df = 1 / (1 + exp(8.645 * (kt - 0.613)))
     # 1-hour: df = 1 / (1 + exp(7.997 * (kt - 0.586)))
+    return df
 
-    dhi = df * ghi
 
-    dni = (ghi - dhi) / tools.cosd(solar_zenith)
+def _louche_components(ghi, solar_zenith, kt, dni_extra, max_zenith):
+    """
+    Calculate DNI and DHI with the Louche model.
+
+    Supports :py:func:`louche` and :py:func:`decomposition_ensemble`.
+    """
+    kb = -10.627*kt**5 + 15.307*kt**4 - 5.205 * \
+        kt**3 + 0.994*kt**2 - 0.059*kt + 0.002
+    dni = kb*dni_extra
+    dhi = ghi - dni*tools.cosd(solar_zenith)
+
     bad_values = (solar_zenith > max_zenith) | (ghi < 0) | (dni < 0)
     dni = np.where(bad_values, 0, dni)
     # ensure that closure relationship remains valid
     dhi = np.where(bad_values, ghi, dhi)
-
-    data = OrderedDict()
-    data['dni'] = dni
-    data['dhi'] = dhi
-    data['kt'] = kt
-
-    if isinstance(datetime_or_doy, pd.DatetimeIndex):
-        data = pd.DataFrame(data, index=datetime_or_doy)
-
-    return data
+    return dni, dhi
 
 
 def campbell_norman(zenith, transmittance, pressure=101325.0,
@@ -3305,6 +3994,38 @@ def _get_perez_coefficients(perezmodel):
     return F1coeffs, F2coeffs
 
 
+_PEREZ_EPSILON_BINS = np.array([0., 1.065, 1.23, 1.5, 1.95, 2.8, 4.5, 6.2,
+                                np.nan])
+
+
+@lru_cache
+def _perez_coefficient_table(perezmodel):
+    '''
+    Perez F1 and F2 coefficients as read-only arrays with shape (9, 3),
+    indexed by the clearness bin. Row 0 is nan for invalid clearness.
+    '''
+    nans = np.full((1, 3), np.nan)
+    F1c, F2c = _get_perez_coefficients(perezmodel)
+    F1c = np.vstack((nans, F1c))
+    F2c = np.vstack((nans, F2c))
+    F1c.flags.writeable = False
+    F2c.flags.writeable = False
+    return F1c, F2c
+
+
+@lru_cache
+def _dirint_coefficient_table():
+    """
+    DIRINT coefficients as a read-only array with shape ``(7, 7, 8, 6)``,
+    indexed by the 1-indexed bins from :py:func:`_dirint_bins`. Index 0 of
+    each axis is nan for unassigned bins.
+    """
+    coeffs = np.full((7, 7, 8, 6), np.nan)
+    coeffs[1:, 1:, 1:, 1:] = _get_dirint_coeffs()
+    coeffs.flags.writeable = False
+    return coeffs
+
+
 def _get_dirint_coeffs():
     """
     A place to stash the dirint coefficients.
@@ -3835,15 +4556,7 @@ def louche(ghi, solar_zenith, datetime_or_doy, max_zenith=90):
 
     Kt = clearness_index(ghi, solar_zenith, I0)
 
-    kb = -10.627*Kt**5 + 15.307*Kt**4 - 5.205 * \
-        Kt**3 + 0.994*Kt**2 - 0.059*Kt + 0.002
-    dni = kb*I0
-    dhi = ghi - dni*tools.cosd(solar_zenith)
-
-    bad_values = (solar_zenith > max_zenith) | (ghi < 0) | (dni < 0)
-    dni = np.where(bad_values, 0, dni)
-    # ensure that closure relationship remains valid
-    dhi = np.where(bad_values, ghi, dhi)
+    dni, dhi = _louche_components(ghi, solar_zenith, Kt, I0, max_zenith)
 
     data = OrderedDict()
     data['dni'] = dni
@@ -3856,6 +4569,165 @@ def louche(ghi, solar_zenith, datetime_or_doy, max_zenith=90):
     return data
 
 
+def decomposition_ensemble(ghi, solar_zenith, times,
+                           models=('erbs', 'erbs_driesse', 'orgill_hollands',
+                                   'boland', 'louche', 'disc', 'dirint'),
+                           pressure=101325., temp_dew=None,
+                           use_delta_kt_prime=True, min_cos_zenith=0.065,
+                           max_zenith=None):
+    """
+    Estimate DNI and DHI from GHI with several decomposition models at once.
+
+    The intermediate values that the models have in common, the
+    extraterrestrial irradiance, the clearness index and the airmass, are
+    calculated only once. The results are the same as calling each model
+    separately with the same inputs.
+
+    Parameters
+    ----------
+    ghi : array-like
+        Global horizontal irradiance. See :term:`ghi`. [Wm⁻²]
+
+    solar_zenith : array-like
+        True (not refraction-corrected) solar zenith angles. See
+        :term:`solar_zenith`. [°]
+
+    times : DatetimeIndex
+        Time indices for the input array-like data.
+
+    models : list of str, default all models
+        Decomposition models to evaluate. Any of ``'erbs'``,
+        ``'erbs_driesse'``, ``'orgill_hollands'``, ``'boland'``,
+        ``'louche'``, ``'disc'``, ``'dirint'``.
+
+    pressure : numeric, default 101325.0
+        Air pressure, used by ``'disc'`` and ``'dirint'``. See
+        :term:`pressure`. [Pa]
+
+    temp_dew : numeric, optional
+        Surface dew point temperature, used by ``'dirint'``. See
+        :py:func:`dirint`. [°C]
+
+    use_delta_kt_prime : bool, default True
+        Used by ``'dirint'``. See :py:func:`dirint`.
+
+    min_cos_zenith : numeric, default 0.065
+        Minimum value of cos(zenith) to allow when calculating global
+        clearness index Kt. Equivalent to zenith = 86.273°.
+
+    max_zenith : numeric, optional
+        Maximum value of zenith to allow in DNI calculation. DNI will be
+        set to 0 for times with zenith values greater than ``max_zenith``.
+        If not provided, the default of each model is used. [°]
+
+    Returns
+    -------
+    data : DataFrame
+        Columns are a MultiIndex of ``'dni'`` and ``'dhi'`` and the names in
+        ``models``, so that ``data['dni']`` has a column for each model.
+        [Wm⁻²]
+
+    Notes
+    -----
+    For ``'disc'`` and ``'dirint'``, DHI is calculated from GHI and DNI.
+
+    See also
+    --------
+    erbs
+    erbs_driesse
+    orgill_hollands
+    boland
+    louche
+    disc
+    dirint
+    """
+    models = list(models)
+    invalid = set(models) - {'erbs', 'erbs_driesse', 'orgill_hollands',
+                             'boland', 'louche', 'disc', 'dirint'}
+    if invalid:
+        raise ValueError(f'invalid decomposition model {invalid.pop()}')
+
+    ghi = np.asarray(ghi, dtype=float)
+    solar_zenith = np.asarray(solar_zenith, dtype=float)
+    cos_zenith = tools.cosd(solar_zenith)
+
+    # extraterrestrial irradiance for a solar constant of 1. disc and
+    # dirint use 1370 Wm⁻², the other models 1366.1 Wm⁻²
+    extra_radiation = get_extra_radiation(times, 1, 'spencer')
+    extra_radiation = np.asarray(extra_radiation, dtype=float)
+    dni_extra = 1366.1 * extra_radiation
+
+    # clearness index without the upper limit of 1, which louche does not use
+    kt_louche = clearness_index(ghi, solar_zenith, dni_extra,
+                                min_cos_zenith=min_cos_zenith)
+    kt = np.minimum(kt_louche, 1)
+    # erbs_driesse limits negative ghi. kt is 0 either way
+    ghi_positive = np.maximum(0, ghi)
+
+    def _max_zenith(default):
+        return default if max_zenith is None else max_zenith
+
+    dni = OrderedDict()
+    dhi = OrderedDict()
+    for model in models:
+        if model == 'erbs':
+            df = _erbs_diffuse_fraction(kt)
+            dni[model], dhi[model] = _diffuse_fraction_components(
+                ghi, solar_zenith, df, _max_zenith(87))
+        elif model == 'erbs_driesse':
+            df = _erbs_driesse_diffuse_fraction(kt)
+            dni[model], dhi[model] = _diffuse_fraction_components(
+                ghi_positive, solar_zenith, df, _max_zenith(87))
+        elif model == 'orgill_hollands':
+            df = _orgill_hollands_diffuse_fraction(kt)
+            dni[model], dhi[model] = _diffuse_fraction_components(
+                ghi, solar_zenith, df, _max_zenith(87))
+        elif model == 'boland':
+            df = _boland_diffuse_fraction(kt)
+            dni[model], dhi[model] = _diffuse_fraction_components(
+                ghi, solar_zenith, df, _max_zenith(87))
+        elif model == 'louche':
+            dni[model], dhi[model] = _louche_components(
+                ghi, solar_zenith, kt_louche, dni_extra, _max_zenith(90))
+
+    if 'disc' in models or 'dirint' in models:
+        I0 = 1370. * extra_radiation
+        kt_disc = clearness_index(ghi, solar_zenith, I0,
+                                  min_cos_zenith=min_cos_zenith,
+                                  max_clearness_index=1)
+        airmass = atmosphere.get_relative_airmass(solar_zenith,
+                                                  model='kasten1966')
+        if pressure is not None:
+            airmass = atmosphere.get_absolute_airmass(airmass, pressure)
+        Kn, airmass = _disc_kn(kt_disc, airmass)
+        disc_dni = Kn * I0
+        bad_values = (solar_zenith > _max_zenith(87)) | (ghi < 0) | \
+            (disc_dni < 0)
+        disc_dni = np.where(bad_values, 0, disc_dni)
+
+        if 'disc' in models:
+            dni['disc'] = disc_dni
+            dhi['disc'] = ghi - disc_dni * cos_zenith
+
+        if 'dirint' in models:
+            kt_prime = clearness_index_zenith_independent(
+                kt_disc, airmass, max_clearness_index=1)
+            delta_kt_prime = _delta_kt_prime_dirint(
+                kt_prime, use_delta_kt_prime, times)
+            w = _temp_dew_dirint(temp_dew, times)
+            dirint_dni = disc_dni * _dirint_coeffs(kt_prime, solar_zenith, w,
+                                                   delta_kt_prime)
+            dni['dirint'] = dirint_dni
+            dhi['dirint'] = ghi - dirint_dni * cos_zenith
+
+    # keep the order of models
+    data = OrderedDict()
+    for component, values in (('dni', dni), ('dhi', dhi)):
+        for model in models:
+            data[(component, model)] = values[model]
+    return pd.DataFrame(data, index=times)
+
+
 def diffuse_par_spitters(daily_solar_zenith, global_diffuse_fraction):
     r"""
     Derive daily diffuse fraction of Photosynthetically Active Radiation (PAR)
@@ -3927,3 +4799,222 @@ def diffuse_par_spitters(daily_solar_zenith, global_diffuse_fraction):
         )
     )
     return par_diffuse_fraction
+
+
+def _iter_with_neighbors(chunks, overlap):
+    """
+    Iterate over chunks of a time series together with ``overlap`` rows
+    of the previous and the next chunk.
+
+    Yields tuples of ``(before, chunk, after)``. ``before`` and ``after``
+    are None at the beginning and end of the series, and when ``overlap``
+    is 0. Each chunk is held back until the next chunk is read.
+
+    Supports :py:func:`iter_decomposition`.
+    """
+    before = None
+    current = None
+    for chunk in chunks:
+        if len(chunk) == 0:
+            continue
+        if not overlap:
+            yield None, chunk, None
+            continue
+        if current is not None:
+            yield before, current, chunk.iloc[:overlap]
+            before = current.iloc[-overlap:]
+        current = chunk
+    if current is not None:
+        yield before, current, None
+
+
+def _decompose(data, model, **kwargs):
+    """
+    Calculate ``'dni'`` and ``'dhi'`` from the ``'ghi'`` and
+    ``'solar_zenith'`` columns of ``data`` with a decomposition model.
+
+    Supports :py:func:`iter_decomposition`.
+    """
+    ghi = data['ghi']
+    solar_zenith = data['solar_zenith']
+    times = data.index
+    if 'pressure' in data and model in ('disc', 'dirint'):
+        kwargs.setdefault('pressure', data['pressure'])
+
+    if model == 'erbs':
+        out = erbs(ghi, solar_zenith, times, **kwargs)
+    elif model == 'erbs_driesse':
+        out = erbs_driesse(ghi, solar_zenith, times, **kwargs)
+    elif model == 'orgill_hollands':
+        out = orgill_hollands(ghi, solar_zenith, times, **kwargs)
+    elif model == 'boland':
+        out = boland(ghi, solar_zenith, times, **kwargs)
+    elif model == 'louche':
+        out = louche(ghi, solar_zenith, times, **kwargs)
+    elif model == 'disc':
+        dni = disc(ghi, solar_zenith, times, **kwargs)['dni']
+        out = {'dni': dni, 'dhi': ghi - dni * tools.cosd(solar_zenith)}
+    elif model == 'dirint':
+        if 'temp_dew' in data:
+            kwargs.setdefault('temp_dew', data['temp_dew'])
+        dni = dirint(ghi, solar_zenith, times, **kwargs)
+        out = {'dni': dni, 'dhi': ghi - dni * tools.cosd(solar_zenith)}
+    else:
+        raise ValueError(f'invalid decomposition model {model}')
+
+    return pd.DataFrame({'ghi': ghi, 'dni': out['dni'], 'dhi': out['dhi']},
+                        index=times)
+
+
+def iter_decomposition(weather, model='erbs', **kwargs):
+    """
+    Estimate DNI and DHI from GHI for a time series that is read in chunks.
+
+    ``weather`` is consumed lazily and one result is yielded for each
+    chunk, so that time series that do not fit in memory can be processed.
+    Models that use neighboring timestamps, such as
+    :py:func:`dirint` with ``use_delta_kt_prime=True``, are given the
+    rows on either side of each chunk boundary. The results are therefore
+    the same as for the whole time series at once.
+
+    Parameters
+    ----------
+    weather : iterable of DataFrame
+        Consecutive chunks of a time series with a DatetimeIndex and
+        columns ``'ghi'`` and ``'solar_zenith'``. Columns ``'pressure'``
+        and ``'temp_dew'`` are used by the models that accept them, if
+        present. Empty chunks are skipped.
+
+    model : str, default 'erbs'
+        Decomposition model. Can be one of ``'erbs'``, ``'erbs_driesse'``,
+        ``'orgill_hollands'``, ``'boland'``, ``'louche'``, ``'disc'``,
+        ``'dirint'``.
+
+    **kwargs
+        Passed to the decomposition model function.
+
+    Yields
+    ------
+    DataFrame
+        Columns ``'ghi'``, ``'dni'`` and ``'dhi'`` with the index of the
+        corresponding chunk of ``weather``. [Wm⁻²]
+
+    Notes
+    -----
+    When ``model='dirint'`` each chunk is yielded after the following
+    chunk has been read. For ``'disc'`` and ``'dirint'``, DHI is calculated
+    from GHI and DNI.
+
+    See also
+    --------
+    iter_total_irradiance
+    """
+    for _, irrad in _iter_decomposition(weather, model, **kwargs):
+        yield irrad
+
+
+def _iter_decomposition(weather, model, **kwargs):
+    """
+    Yield tuples of each chunk of ``weather`` and its decomposition.
+
+    Supports :py:func:`iter_decomposition` and
+    :py:func:`iter_total_irradiance`.
+    """
+    if model not in {'erbs', 'erbs_driesse', 'orgill_hollands', 'boland',
+                     'louche', 'disc', 'dirint'}:
+        raise ValueError(f'invalid decomposition model {model}')
+
+    # delta_kt_prime (Perez eqn 2) uses the previous and next timestamps
+    if model == 'dirint' and kwargs.get('use_delta_kt_prime', True):
+        overlap = 1
+    else:
+        overlap = 0
+
+    for before, chunk, after in _iter_with_neighbors(weather, overlap):
+        data = pd.concat([x for x in (before, chunk, after) if x is not None])
+        out = _decompose(data, model, **kwargs)
+        start = 0 if before is None else len(before)
+        yield chunk, out.iloc[start:start + len(chunk)]
+
+
+def iter_total_irradiance(weather, surface_tilt, surface_azimuth,
+                          decomposition_model='erbs', model='isotropic',
+                          model_perez='allsitescomposite1990', albedo=0.25,
+                          surface_type=None, decomposition_kwargs=None):
+    """
+    Determine total in-plane irradiance from GHI for a time series that
+    is read in chunks.
+
+    Each chunk of ``weather`` is decomposed with :py:func:`iter_decomposition`
+    and transposed with :py:func:`get_total_irradiance`. Only a chunk or two
+    is held in memory at a time.
+
+    Parameters
+    ----------
+    weather : iterable of DataFrame
+        Consecutive chunks of a time series with a DatetimeIndex and
+        columns ``'ghi'``, ``'solar_zenith'`` and ``'solar_azimuth'``.
+        Optional columns ``'pressure'``, ``'temp_dew'``, ``'dni_extra'``,
+        ``'airmass'`` and ``'albedo'`` are used if present.
+
+    surface_tilt : numeric
+        Panel tilt from horizontal. See :term:`surface_tilt`. [°]
+
+    surface_azimuth : numeric
+        Panel azimuth. See :term:`surface_azimuth`. [°]
+
+    decomposition_model : str, default 'erbs'
+        Decomposition model, see :py:func:`iter_decomposition`.
+
+    model : str, default 'isotropic'
+        Sky diffuse irradiance model, see :py:func:`get_total_irradiance`.
+
+    model_perez : str, default 'allsitescomposite1990'
+        Used only if ``model='perez'``. See :py:func:`perez`.
+
+    albedo : numeric, default 0.25
+        Ground surface albedo, used if ``weather`` has no ``'albedo'``
+        column. See :term:`albedo`. [unitless]
+
+    surface_type : str, optional
+        Surface type. See :py:func:`get_ground_diffuse`.
+
+    decomposition_kwargs : dict, optional
+        Passed to the decomposition model function.
+
+    Yields
+    ------
+    DataFrame
+        Columns ``'ghi'``, ``'dni'``, ``'dhi'``, ``'poa_global'``,
+        ``'poa_direct'``, ``'poa_diffuse'``, ``'poa_sky_diffuse'`` and
+        ``'poa_ground_diffuse'`` with the index of the corresponding chunk
+        of ``weather``. [Wm⁻²]
+
+    Notes
+    -----
+    If ``weather`` has no ``'dni_extra'`` column it is calculated with
+    :py:func:`get_extra_radiation`. If it has no ``'airmass'`` column,
+    :py:func:`get_total_irradiance` calculates it when the model needs it.
+
+    See also
+    --------
+    iter_decomposition
+    get_total_irradiance
+    """
+    if decomposition_kwargs is None:
+        decomposition_kwargs = {}
+
+    components = _iter_decomposition(weather, decomposition_model,
+                                     **decomposition_kwargs)
+    for chunk, irrad in components:
+        if 'dni_extra' in chunk:
+            dni_extra = chunk['dni_extra']
+        else:
+            dni_extra = get_extra_radiation(chunk.index)
+        poa = get_total_irradiance(
+            surface_tilt, surface_azimuth, chunk['solar_zenith'],
+            chunk['solar_azimuth'], irrad['dni'], irrad['ghi'], irrad['dhi'],
+            dni_extra=dni_extra, airmass=chunk.get('airmass'),
+            albedo=chunk.get('albedo', albedo), surface_type=surface_type,
+            model=model, model_perez=model_perez)
+        yield pd.concat([irrad, poa], axis=1)
@@ -4,4 +4,18 @@ and diode models.
 
 """
 
-from pvlib.ivtools import sde, sdm, utils  # noqa: F401
+import importlib
+
+# imported on first use like the pvlib submodules, which also avoids a
+# circular import of pvlib.pvsystem via pvlib.singlediode
+_submodules = ['sde', 'sdm', 'utils']
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(list(globals()) + _submodules)
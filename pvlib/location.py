@@ -10,7 +10,6 @@ import zoneinfo
 
 import pandas as pd
 import pytz
-import h5py
 
 from pvlib import solarposition, clearsky, atmosphere, irradiance
 from pvlib.tools import _degrees_to_index
@@ -62,6 +61,11 @@ class Location:
     name : string, optional
         Sets the name attribute of the Location object.
 
+    solar_position_cache : pvlib.solarposition.SolarPositionCache, optional
+        If given, :py:meth:`get_solarposition` returns cached results
+        from, and stores new results in, this cache. The cache can be
+        shared between Location objects.
+
     Raises
     ------
     ValueError
@@ -78,11 +82,13 @@ class Location:
     """
 
     def __init__(
-        self, latitude, longitude, tz='UTC', altitude=None, name=None
+        self, latitude, longitude, tz='UTC', altitude=None, name=None,
+        solar_position_cache=None
     ):
         self.latitude = latitude
         self.longitude = longitude
         self.tz = tz
+        self.solar_position_cache = solar_position_cache
 
         if altitude is None:
             altitude = lookup_altitude(latitude, longitude)
@@ -217,6 +223,9 @@ class Location:
         Uses the :py:func:`pvlib.solarposition.get_solarposition` function
         to calculate the solar zenith, azimuth, etc. at this location.
 
+        If the Location has a ``solar_position_cache``, results are looked
+        up in and stored in the cache.
+
         Parameters
         ----------
         times : pandas.DatetimeIndex
@@ -238,12 +247,17 @@ class Location:
         if pressure is None:
             pressure = atmosphere.alt2pres(self.altitude)
 
-        return solarposition.get_solarposition(times, latitude=self.latitude,
-                                               longitude=self.longitude,
-                                               altitude=self.altitude,
-                                               pressure=pressure,
-                                               temperature=temperature,
-                                               **kwargs)
+        if self.solar_position_cache is None:
+            get_solarposition = solarposition.get_solarposition
+        else:
+            get_solarposition = self.solar_position_cache.get_solarposition
+
+        return get_solarposition(times, latitude=self.latitude,
+                                 longitude=self.longitude,
+                                 altitude=self.altitude,
+                                 pressure=pressure,
+                                 temperature=temperature,
+                                 **kwargs)
 
     def get_clearsky(self, times, model='ineichen', solar_position=None,
                      dni_extra=None, **kwargs):
@@ -481,6 +495,8 @@ def lookup_altitude(latitude, longitude):
     latitude_index = _degrees_to_index(latitude, coordinate='latitude')
     longitude_index = _degrees_to_index(longitude, coordinate='longitude')
 
+    import h5py
+
     with h5py.File(filepath, 'r') as alt_h5_file:
         alt = alt_h5_file['Altitude'][latitude_index, longitude_index]
 
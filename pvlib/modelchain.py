@@ -321,9 +321,9 @@ class ModelChain:
     dc_model : str, or function, optional
         If not specified, the model will be inferred from the parameters that
         are common to all of system.arrays[i].module_parameters.
-        Valid strings are 'sapm', 'desoto', 'cec', 'pvsyst', 'pvwatts'.
-        The ModelChain instance will be passed as the first argument
-        to a user-defined function.
+        Valid strings are 'sapm', 'desoto', 'cec', 'pvsyst', 'pvwatts' and
+        'mpp_table'. The ModelChain instance will be passed as the first
+        argument to a user-defined function.
 
     ac_model : str, or function, optional
         If not specified, the model will be inferred from the parameters that
@@ -611,6 +611,8 @@ class ModelChain:
                     self._dc_model = self.pvsyst
                 elif model == 'pvwatts':
                     self._dc_model = self.pvwatts_dc
+                elif model == 'mpp_table':
+                    self._dc_model = self.mpp_table
             else:
                 raise ValueError(model + ' is not a valid DC power model')
         else:
@@ -620,7 +622,9 @@ class ModelChain:
         """Infer DC power model from Array module parameters."""
         params = _common_keys(
             tuple(array.module_parameters for array in self.system.arrays))
-        if {'A0', 'A1', 'C3'} <= params:
+        if {'mpp_table'} <= params:
+            return self.mpp_table, 'mpp_table'
+        elif {'A0', 'A1', 'C3'} <= params:
             return self.sapm, 'sapm'
         elif {'a_ref', 'I_L_ref', 'I_o_ref', 'R_sh_ref', 'R_s',
               'Adjust'} <= params:
@@ -682,6 +686,35 @@ class ModelChain:
     def pvsyst(self):
         return self._singlediode(self.system.calcparams_pvsyst)
 
+    def mpp_table(self):
+        """Calculate DC power by interpolating a precomputed table of the
+        maximum power point.
+
+        Results are stored in ModelChain.results.dc. The maximum power point
+        is interpolated from the :py:class:`pvlib.pvsystem.MaxPowerPointTable`
+        in PVSystem.arrays[i].module_parameters['mpp_table'] and then scaled
+        by PVSystem.modules_per_string and PVSystem.strings_per_inverter.
+        As for the single diode models, values outside of the table are set
+        to 0.
+
+        Returns
+        -------
+        self
+
+        See also
+        --------
+        pvlib.pvsystem.MaxPowerPointTable
+        pvlib.pvsystem.PVSystem.mpp_table
+        """
+        dc = self.system.mpp_table(self.results.effective_irradiance,
+                                   self.results.cell_temperature,
+                                   unwrap=False)
+        dc = self.system.scale_voltage_current_power(dc, unwrap=False)
+        self.results.dc = tuple(df.fillna(0) for df in dc)
+        if self.system.num_arrays == 1:
+            self.results.dc = self.results.dc[0]
+        return self
+
     def pvwatts_dc(self):
         """Calculate DC power using the PVWatts model.
 
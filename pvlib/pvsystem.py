@@ -44,7 +44,8 @@ _DC_MODEL_PARAMS = {
     'singlediode': {
         'alpha_sc', 'a_ref', 'I_L_ref', 'I_o_ref',
         'R_sh_ref', 'R_s'},
-    'pvwatts': {'pdc0', 'gamma_pdc'}
+    'pvwatts': {'pdc0', 'gamma_pdc'},
+    'mpp_table': {'mpp_table'}
 }
 
 
@@ -301,9 +302,18 @@ class PVSystem:
         aoi : Series or tuple of Series
             The angle of incidence
         """
-
-        return tuple(array.get_aoi(solar_zenith, solar_azimuth)
-                     for array in self.arrays)
+        # the sun position vector is the same for all Arrays. It only saves
+        # time if it is shared by several Arrays with a fixed orientation,
+        # trackers would need the surface normal at each time.
+        fixed = [isinstance(array.mount, FixedMount) for array in self.arrays]
+        solar_vector = None
+        if sum(fixed) > 1:
+            solar_vector = irradiance.solar_unit_vector(solar_zenith,
+                                                        solar_azimuth)
+        return tuple(array.get_aoi(solar_zenith, solar_azimuth,
+                                   solar_vector=solar_vector if is_fixed
+                                   else None)
+                     for array, is_fixed in zip(self.arrays, fixed))
 
     @_unwrap_single_value
     def get_irradiance(self, solar_zenith, solar_azimuth, dni, ghi, dhi,
@@ -623,6 +633,35 @@ class PVSystem:
             in zip(self.arrays, effective_irradiance, temp_cell)
         )
 
+    @_unwrap_single_value
+    def mpp_table(self, effective_irradiance, temp_cell):
+        """
+        Use the :py:class:`MaxPowerPointTable` in
+        ``self.module_parameters['mpp_table']`` to interpolate the maximum
+        power point.
+
+        Parameters
+        ----------
+        effective_irradiance : numeric or tuple of numeric
+            The irradiance (W/m2) that is converted to photocurrent.
+
+        temp_cell : float or Series or tuple of float or Series
+            The average cell temperature of cells within a module in C.
+
+        Returns
+        -------
+        See pvsystem.MaxPowerPointTable.max_power_point for details
+        """
+        effective_irradiance = self._validate_per_array(effective_irradiance)
+        temp_cell = self._validate_per_array(temp_cell)
+
+        return tuple(
+            array.module_parameters['mpp_table'].max_power_point(
+                effective_irradiance, temp_cell)
+            for array, effective_irradiance, temp_cell
+            in zip(self.arrays, effective_irradiance, temp_cell)
+        )
+
     @_unwrap_single_value
     def sapm_spectral_loss(self, airmass_absolute):
         """
@@ -1073,7 +1112,7 @@ class Array:
 
         return cell_type
 
-    def get_aoi(self, solar_zenith, solar_azimuth):
+    def get_aoi(self, solar_zenith, solar_azimuth, solar_vector=None):
         """
         Get the angle of incidence on the array.
 
@@ -1083,6 +1122,10 @@ class Array:
             Solar zenith angle.
         solar_azimuth : float or Series
             Solar azimuth angle
+        solar_vector : tuple of numeric, optional
+            Sun position unit vector from
+            :py:func:`pvlib.irradiance.solar_unit_vector`. Calculated from
+            ``solar_zenith`` and ``solar_azimuth`` if not provided.
 
         Returns
         -------
@@ -1092,7 +1135,8 @@ class Array:
         orientation = self.mount.get_orientation(solar_zenith, solar_azimuth)
         return irradiance.aoi(orientation['surface_tilt'],
                               orientation['surface_azimuth'],
-                              solar_zenith, solar_azimuth)
+                              solar_zenith, solar_azimuth,
+                              solar_vector=solar_vector)
 
     def get_irradiance(self, solar_zenith, solar_azimuth, dni, ghi, dhi,
                        dni_extra=None, airmass=None, albedo=None,
@@ -2481,7 +2525,8 @@ def sapm_effective_irradiance(poa_direct, poa_diffuse, airmass_absolute, aoi,
 
 
 def singlediode(photocurrent, saturation_current, resistance_series,
-                resistance_shunt, nNsVth, method='lambertw'):
+                resistance_shunt, nNsVth, method='lambertw',
+                method_kwargs=None):
     r"""
     Solve the single diode equation to obtain a photovoltaic IV curve.
 
@@ -2541,6 +2586,14 @@ def singlediode(photocurrent, saturation_current, resistance_series,
         .. note::
            ``'chandrupatla'`` requires scipy 1.15 or greater.
 
+    method_kwargs : dict, optional
+        Keyword arguments passed to the root finder of the
+        ``pvlib.singlediode.bishop88_*`` functions, e.g.
+        ``{'x0': 'batzelis'}`` to start ``method='newton'`` from an
+        explicit estimate of each point. Numeric values of ``'x0'`` and
+        ``'full_output'`` are not supported. Not used with
+        ``method='lambertw'``.
+
     Returns
     -------
     dict or pandas.DataFrame
@@ -2576,7 +2629,8 @@ def singlediode(photocurrent, saturation_current, resistance_series,
 
     If the method is ``'brentq'`` then Brent's bisection search method is used
     that guarantees convergence by bounding the voltage between zero and
-    open-circuit. ``'brentq'`` is generally slower than the other options.
+    open-circuit. Array inputs are solved at once with an equivalent
+    vectorized bracketed method.
 
     If the method is ``'chandrupatla'`` then Chandrupatla's method is used
     that guarantees convergence.
@@ -2609,24 +2663,27 @@ def singlediode(photocurrent, saturation_current, resistance_series,
         out = _singlediode._lambertw(*args)
         points = out[:7]
     else:
+        _check_bishop88_method_kwargs(method_kwargs)
         # Calculate points on the IV curve using Bishop's algorithm and solving
         # with 'newton', 'brentq' or 'chandrupatla' method.
         # Voltages are determined by first solving the single diode
         # equation for the diode voltage V_d then backing out voltage
         v_oc = _singlediode.bishop88_v_from_i(
-            0.0, *args, method=method.lower()
+            0.0, *args, method=method.lower(), method_kwargs=method_kwargs
         )
         i_mp, v_mp, p_mp = _singlediode.bishop88_mpp(
-            *args, method=method.lower()
+            *args, method=method.lower(), method_kwargs=method_kwargs
         )
         i_sc = _singlediode.bishop88_i_from_v(
-            0.0, *args, method=method.lower()
+            0.0, *args, method=method.lower(), method_kwargs=method_kwargs
         )
         i_x = _singlediode.bishop88_i_from_v(
-            v_oc / 2.0, *args, method=method.lower()
+            v_oc / 2.0, *args, method=method.lower(),
+            method_kwargs=method_kwargs
         )
         i_xx = _singlediode.bishop88_i_from_v(
-            (v_oc + v_mp) / 2.0, *args, method=method.lower()
+            (v_oc + v_mp) / 2.0, *args, method=method.lower(),
+            method_kwargs=method_kwargs
         )
         points = i_sc, v_oc, i_mp, v_mp, p_mp, i_x, i_xx
 
@@ -2647,9 +2704,24 @@ def singlediode(photocurrent, saturation_current, resistance_series,
     return out
 
 
+def _check_bishop88_method_kwargs(method_kwargs):
+    if not method_kwargs:
+        return
+    if method_kwargs.get('full_output'):
+        raise ValueError("'full_output' is not supported, use the "
+                         "pvlib.singlediode.bishop88_* functions instead")
+    # the points of the IV curve have different diode voltages, so only the
+    # explicit estimate of each point is a useful initial guess
+    x0 = method_kwargs.get('x0', 'batzelis')
+    if not (isinstance(x0, str) and x0 == 'batzelis'):
+        raise ValueError("'x0' must be 'batzelis', use the "
+                         "pvlib.singlediode.bishop88_* functions to set the "
+                         "initial guess of each point")
+
+
 def max_power_point(photocurrent, saturation_current, resistance_series,
                     resistance_shunt, nNsVth, d2mutau=0, NsVbi=np.inf,
-                    method='brentq'):
+                    method='brentq', method_kwargs=None):
     """
     Given the single diode equation coefficients, calculates the maximum power
     point (MPP).
@@ -2684,6 +2756,10 @@ def max_power_point(photocurrent, saturation_current, resistance_series,
         .. note::
            ``'chandrupatla'`` requires scipy 1.15 or greater.
 
+    method_kwargs : dict, optional
+        Keyword arguments passed to the root finder, see
+        :py:func:`pvlib.singlediode.bishop88_mpp`. Numeric values of
+        ``'x0'`` and ``'full_output'`` are not supported.
 
     Returns
     -------
@@ -2697,9 +2773,11 @@ def max_power_point(photocurrent, saturation_current, resistance_series,
     curve. This function uses Brent's method by default because it is
     guaranteed to converge.
     """
+    _check_bishop88_method_kwargs(method_kwargs)
     i_mp, v_mp, p_mp = _singlediode.bishop88_mpp(
         photocurrent, saturation_current, resistance_series,
-        resistance_shunt, nNsVth, d2mutau, NsVbi, method=method.lower()
+        resistance_shunt, nNsVth, d2mutau, NsVbi, method=method.lower(),
+        method_kwargs=method_kwargs
     )
     if isinstance(photocurrent, pd.Series):
         ivp = {'i_mp': i_mp, 'v_mp': v_mp, 'p_mp': p_mp}
@@ -2712,6 +2790,265 @@ def max_power_point(photocurrent, saturation_current, resistance_series,
     return out
 
 
+class MaxPowerPointTable:
+    """
+    Maximum power point of a module tabulated on a grid of effective
+    irradiance and cell temperature.
+
+    The table is evaluated by interpolation, which is much faster than
+    solving the single diode equation at every point. It is typically
+    created once per module with :py:meth:`from_module_parameters`, saved
+    with :py:meth:`save` and shared by all systems using the module. To
+    use it with :py:class:`pvlib.modelchain.ModelChain`, add it to the
+    ``module_parameters`` of each Array with the key ``'mpp_table'`` and
+    use ``dc_model='mpp_table'``.
+
+    Parameters
+    ----------
+    effective_irradiance : array-like
+        Strictly increasing effective irradiance of the grid. [W/m^2]
+    temp_cell : array-like
+        Strictly increasing cell temperature of the grid. [C]
+    i_mp, v_mp, p_mp : array-like
+        Current [A], voltage [V] and power [W] at the maximum power point,
+        with shape ``(len(effective_irradiance), len(temp_cell))``.
+    interpolation : str, default 'cubic'
+        Either ``'linear'`` for bilinear or ``'cubic'`` for bicubic spline
+        interpolation.
+    error : dict, optional
+        Estimated maximum absolute interpolation error of ``'i_mp'``,
+        ``'v_mp'`` and ``'p_mp'``.
+
+    Attributes
+    ----------
+    error : dict or None
+        Estimated maximum absolute interpolation error of ``'i_mp'``,
+        ``'v_mp'`` and ``'p_mp'`` within the grid. See
+        :py:meth:`from_module_parameters`.
+
+    See also
+    --------
+    max_power_point
+    pvlib.modelchain.ModelChain.mpp_table
+
+    Examples
+    --------
+    >>> module = {'alpha_sc': 0.004539, 'a_ref': 2.6373, 'I_L_ref': 5.114,
+    ...           'I_o_ref': 8.196e-10, 'R_sh_ref': 381.68, 'R_s': 1.065,
+    ...           'Adjust': 8.7}
+    >>> table = MaxPowerPointTable.from_module_parameters(module, 'cec')
+    >>> mpp = table.max_power_point(800., 45.)
+    """
+    _keys = ('i_mp', 'v_mp', 'p_mp')
+
+    def __init__(self, effective_irradiance, temp_cell, i_mp, v_mp, p_mp,
+                 interpolation='cubic', error=None):
+        self.effective_irradiance = np.asarray(effective_irradiance,
+                                               dtype=float)
+        self.temp_cell = np.asarray(temp_cell, dtype=float)
+        self.values = {k: np.asarray(v, dtype=float)
+                       for k, v in zip(self._keys, (i_mp, v_mp, p_mp))}
+        self.interpolation = interpolation.lower()
+        self.error = error
+
+        shape = (len(self.effective_irradiance), len(self.temp_cell))
+        for key, value in self.values.items():
+            if value.shape != shape:
+                raise ValueError(f'{key} must have shape {shape}, '
+                                 f'got {value.shape}')
+            if np.isnan(value).any():
+                raise ValueError(f'{key} must not contain NaN')
+        if self.interpolation == 'cubic':
+            from scipy.interpolate import RectBivariateSpline
+            self._splines = {
+                key: RectBivariateSpline(self.effective_irradiance,
+                                         self.temp_cell, value, s=0)
+                for key, value in self.values.items()}
+        elif self.interpolation != 'linear':
+            raise ValueError(f'{interpolation} is not a valid interpolation,'
+                             " must be 'linear' or 'cubic'")
+
+    def __repr__(self):
+        return (f'MaxPowerPointTable(shape={self.values["p_mp"].shape}, '
+                f'interpolation={self.interpolation!r}, '
+                f'error={self.error})')
+
+    @classmethod
+    def from_module_parameters(cls, module_parameters, model,
+                               effective_irradiance=None, temp_cell=None,
+                               interpolation='cubic', method='brentq'):
+        """
+        Calculate the table from single diode model parameters.
+
+        The maximum power point is calculated with
+        :py:func:`max_power_point` at each point of the grid. The error
+        of the interpolation is estimated from the largest difference
+        between the interpolated and the calculated values at the centres
+        of the grid cells.
+
+        Parameters
+        ----------
+        module_parameters : dict or Series
+            Module parameters for ``model``, as for
+            :py:class:`PVSystem`.
+        model : str
+            One of ``'cec'``, ``'desoto'`` or ``'pvsyst'``, the model used
+            to calculate the single diode equation parameters, see
+            :py:func:`calcparams_cec`, :py:func:`calcparams_desoto` and
+            :py:func:`calcparams_pvsyst`.
+        effective_irradiance : array-like, optional
+            Effective irradiance of the grid. The default is 150 points
+            spaced logarithmically between 1 and 1500 W/m^2, which resolves
+            the rapid change of ``v_mp`` at low irradiance. [W/m^2]
+        temp_cell : array-like, optional
+            Cell temperature of the grid. The default is -40 to 100 C in
+            steps of 2 C. [C]
+        interpolation : str, default 'cubic'
+            Either ``'linear'`` or ``'cubic'``.
+        method : str, default 'brentq'
+            Method of :py:func:`max_power_point`.
+
+        Returns
+        -------
+        MaxPowerPointTable
+        """
+        model = model.lower()
+        if model not in ('cec', 'desoto', 'pvsyst'):
+            raise ValueError(f'{model} is not a valid model, must be one of '
+                             "'cec', 'desoto' or 'pvsyst'")
+        missing_params = _DC_MODEL_PARAMS[model] - set(module_parameters)
+        if missing_params:
+            raise ValueError(f'module_parameters are missing parameters for '
+                             f'{model}: {missing_params}')
+        if effective_irradiance is None:
+            effective_irradiance = np.geomspace(1., 1500., 150)
+        if temp_cell is None:
+            temp_cell = np.arange(-40., 101., 2.)
+        effective_irradiance = np.asarray(effective_irradiance, dtype=float)
+        temp_cell = np.asarray(temp_cell, dtype=float)
+
+        calcparams = getattr(PVSystem(module_parameters=module_parameters),
+                             'calcparams_' + model)
+
+        def calc_mpp(effective_irradiance, temp_cell):
+            effective_irradiance, temp_cell = np.meshgrid(
+                effective_irradiance, temp_cell, indexing='ij')
+            return max_power_point(
+                *calcparams(effective_irradiance, temp_cell), method=method)
+
+        mpp = calc_mpp(effective_irradiance, temp_cell)
+        table = cls(effective_irradiance, temp_cell, mpp['i_mp'],
+                    mpp['v_mp'], mpp['p_mp'], interpolation=interpolation)
+
+        # interpolation errors are largest between the grid points
+        centres = (
+            (effective_irradiance[1:] + effective_irradiance[:-1]) / 2,
+            (temp_cell[1:] + temp_cell[:-1]) / 2)
+        expected = calc_mpp(*centres)
+        interpolated = table.max_power_point(
+            *np.meshgrid(*centres, indexing='ij'))
+        table.error = {
+            key: float(np.max(np.abs(interpolated[key] - expected[key])))
+            for key in cls._keys}
+        return table
+
+    def max_power_point(self, effective_irradiance, temp_cell):
+        """
+        Interpolate the maximum power point.
+
+        Parameters
+        ----------
+        effective_irradiance : numeric
+            Effective irradiance. [W/m^2]
+        temp_cell : numeric
+            Cell temperature. [C]
+
+        Returns
+        -------
+        OrderedDict or pandas.DataFrame
+            ``(i_mp, v_mp, p_mp)``. Values are NaN where the inputs are
+            outside of the grid.
+        """
+        x, y = np.broadcast_arrays(effective_irradiance, temp_cell)
+        shape = x.shape
+        x = x.ravel()
+        y = y.ravel()
+        outside = ~((x >= self.effective_irradiance[0])
+                    & (x <= self.effective_irradiance[-1])
+                    & (y >= self.temp_cell[0])
+                    & (y <= self.temp_cell[-1]))
+
+        if self.interpolation == 'linear':
+            values = self._bilinear(x, y)
+        else:
+            values = [self._splines[key].ev(x, y) for key in self._keys]
+
+        out = OrderedDict()
+        for key, value in zip(self._keys, values):
+            value[outside] = np.nan
+            out[key] = value.reshape(shape)[()]
+
+        index = next((a.index for a in (effective_irradiance, temp_cell)
+                      if isinstance(a, pd.Series)), None)
+        if index is not None:
+            out = pd.DataFrame(out, index=index)
+        return out
+
+    def _bilinear(self, x, y):
+        # the cell and the weights are shared by all quantities
+        grid_x = self.effective_irradiance
+        grid_y = self.temp_cell
+        i = np.clip(np.searchsorted(grid_x, x) - 1, 0, len(grid_x) - 2)
+        j = np.clip(np.searchsorted(grid_y, y) - 1, 0, len(grid_y) - 2)
+        wx = (x - grid_x[i]) / (grid_x[i + 1] - grid_x[i])
+        wy = (y - grid_y[j]) / (grid_y[j + 1] - grid_y[j])
+        return [
+            ((v[i, j] * (1 - wx) + v[i + 1, j] * wx) * (1 - wy)
+             + (v[i, j + 1] * (1 - wx) + v[i + 1, j + 1] * wx) * wy)
+            for v in (self.values[key] for key in self._keys)]
+
+    def save(self, path):
+        """
+        Save the table to a ``.npz`` file.
+
+        Parameters
+        ----------
+        path : str or path-like
+            File name. ``.npz`` is appended if it is missing.
+
+        See also
+        --------
+        load
+        """
+        error = {} if self.error is None else {
+            'error_' + key: value for key, value in self.error.items()}
+        np.savez(path, effective_irradiance=self.effective_irradiance,
+                 temp_cell=self.temp_cell,
+                 interpolation=np.array(self.interpolation), **self.values,
+                 **error)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a table saved with :py:meth:`save`.
+
+        Parameters
+        ----------
+        path : str or path-like
+            File name.
+
+        Returns
+        -------
+        MaxPowerPointTable
+        """
+        with np.load(path) as data:
+            error = {key: float(data['error_' + key]) for key in cls._keys
+                     if 'error_' + key in data.files} or None
+            return cls(data['effective_irradiance'], data['temp_cell'],
+                       *(data[key] for key in cls._keys),
+                       interpolation=str(data['interpolation']), error=error)
+
+
 def v_from_i(current, photocurrent, saturation_current, resistance_series,
              resistance_shunt, nNsVth, method='lambertw'):
     '''
@@ -2,9 +2,12 @@
 Low-level functions for solving the single diode equation.
 """
 
+from collections import namedtuple
+
 import numpy as np
 import pandas as pd
-from pvlib.tools import _golden_sect_DataFrame
+from pvlib.tools import _golden_sect, _chandrupatla
+from pvlib import _singlediode_numba
 from pvlib.ivtools.utils import _lambertw_pvlib, _log_lambertw
 
 from scipy.optimize import brentq, newton
@@ -255,13 +258,22 @@ def bishop88_i_from_v(voltage, photocurrent, saturation_current,
     method_kwargs : dict, optional
         Keyword arguments passed to the root finder. For options, see:
 
-        * ``method='brentq'``: :py:func:`scipy:scipy.optimize.brentq`
+        * ``method='brentq'``: :py:func:`scipy:scipy.optimize.brentq`.
+          Array inputs are solved at once with a vectorized bracketed
+          method that accepts the same options.
         * ``method='newton'``: :py:func:`scipy:scipy.optimize.newton`
         * ``method='chandrupatla'``: :py:func:`scipy:scipy.optimize.elementwise.find_root`
 
         ``'full_output': True`` is allowed, and ``optimizer_output`` would be
         returned. See examples section.
 
+        With ``method='newton'``, ``'x0'`` sets the initial guess of the
+        diode voltage, e.g. the solution of the previous time step from
+        ``optimizer_output``. ``'x0': 'batzelis'`` starts from an explicit
+        estimate based on :py:func:`batzelis`, which usually needs fewer
+        iterations than the default guess. For array inputs,
+        ``optimizer_output`` includes the number of iterations.
+
     Returns
     -------
     current : numeric
@@ -319,26 +331,21 @@ def bishop88_i_from_v(voltage, photocurrent, saturation_current,
         # start iteration slightly less than NsVbi when voc_est > NsVbi, to
         # avoid the asymptote at NsVbi
         xp = np.where(voc_est < NsVbi, voc_est, 0.9999*NsVbi)
-
-        # brentq only works with scalar inputs, so we need a set up function
-        # and np.vectorize to repeatedly call the optimizer with the right
-        # arguments for possible array input
-        def vd_from_brent(voc, v, iph, isat, rs, rsh, gamma, d2mutau, NsVbi,
-                          breakdown_factor, breakdown_voltage, breakdown_exp):
-            return brentq(fv, 0.0, voc,
-                          args=(v, iph, isat, rs, rsh, gamma, d2mutau, NsVbi,
-                                breakdown_factor, breakdown_voltage,
-                                breakdown_exp),
-                          **method_kwargs)
-
-        vd_from_brent_vectorized = np.vectorize(vd_from_brent)
-        vd = vd_from_brent_vectorized(xp, voltage, *args)
+        vd = _brentq(fv, xp, (voltage, *args), method_kwargs)
     elif method == 'newton':
+        x0, method_kwargs = _newton_initial_guess(voltage, args,
+                                                  method_kwargs,
+                                                  voltage=voltage)
         x0, (voltage, *args), method_kwargs = \
-            _prepare_newton_inputs(voltage, (voltage, *args), method_kwargs)
-        vd = newton(func=lambda x, *a: fv(x, voltage, *a), x0=x0,
-                    fprime=lambda x, *a: bishop88(x, *a, gradients=True)[4],
-                    args=args, **method_kwargs)
+            _prepare_newton_inputs(x0, (voltage, *args), method_kwargs)
+        if _use_numba_newton(x0, method_kwargs):
+            vd = _newton_numba(_singlediode_numba.I_FROM_V, x0, voltage, args,
+                               method_kwargs)
+        else:
+            vd = _newton(
+                func=lambda x, *a: fv(x, voltage, *a), x0=x0,
+                fprime=lambda x, *a: bishop88(x, *a, gradients=True)[4],
+                args=args, method_kwargs=method_kwargs)
     elif method == 'chandrupatla':
         try:
             from scipy.optimize.elementwise import find_root
@@ -427,13 +434,22 @@ def bishop88_v_from_i(current, photocurrent, saturation_current,
     method_kwargs : dict, optional
         Keyword arguments passed to the root finder. For options, see:
 
-        * ``method='brentq'``: :py:func:`scipy:scipy.optimize.brentq`
+        * ``method='brentq'``: :py:func:`scipy:scipy.optimize.brentq`.
+          Array inputs are solved at once with a vectorized bracketed
+          method that accepts the same options.
         * ``method='newton'``: :py:func:`scipy:scipy.optimize.newton`
         * ``method='chandrupatla'``: :py:func:`scipy:scipy.optimize.elementwise.find_root`
 
         ``'full_output': True`` is allowed, and ``optimizer_output`` would be
         returned. See examples section.
 
+        With ``method='newton'``, ``'x0'`` sets the initial guess of the
+        diode voltage, e.g. the solution of the previous time step from
+        ``optimizer_output``. ``'x0': 'batzelis'`` starts from an explicit
+        estimate based on :py:func:`batzelis`, which usually needs fewer
+        iterations than the default guess. For array inputs,
+        ``optimizer_output`` includes the number of iterations.
+
     Returns
     -------
     voltage : numeric
@@ -492,25 +508,20 @@ def bishop88_v_from_i(current, photocurrent, saturation_current,
         return bishop88(x, *a)[0] - i
 
     if method == 'brentq':
-        # brentq only works with scalar inputs, so we need a set up function
-        # and np.vectorize to repeatedly call the optimizer with the right
-        # arguments for possible array input
-        def vd_from_brent(voc, i, iph, isat, rs, rsh, gamma, d2mutau, NsVbi,
-                          breakdown_factor, breakdown_voltage, breakdown_exp):
-            return brentq(fi, 0.0, voc,
-                          args=(i, iph, isat, rs, rsh, gamma, d2mutau, NsVbi,
-                                breakdown_factor, breakdown_voltage,
-                                breakdown_exp),
-                          **method_kwargs)
-
-        vd_from_brent_vectorized = np.vectorize(vd_from_brent)
-        vd = vd_from_brent_vectorized(xp, current, *args)
+        vd = _brentq(fi, xp, (current, *args), method_kwargs)
     elif method == 'newton':
+        x0, method_kwargs = _newton_initial_guess(xp, args, method_kwargs,
+                                                  current=current)
         x0, (current, *args), method_kwargs = \
-            _prepare_newton_inputs(xp, (current, *args), method_kwargs)
-        vd = newton(func=lambda x, *a: fi(x, current, *a), x0=x0,
-                    fprime=lambda x, *a: bishop88(x, *a, gradients=True)[3],
-                    args=args, **method_kwargs)
+            _prepare_newton_inputs(x0, (current, *args), method_kwargs)
+        if _use_numba_newton(x0, method_kwargs):
+            vd = _newton_numba(_singlediode_numba.V_FROM_I, x0, current, args,
+                               method_kwargs)
+        else:
+            vd = _newton(
+                func=lambda x, *a: fi(x, current, *a), x0=x0,
+                fprime=lambda x, *a: bishop88(x, *a, gradients=True)[3],
+                args=args, method_kwargs=method_kwargs)
     elif method == 'chandrupatla':
         try:
             from scipy.optimize.elementwise import find_root
@@ -595,13 +606,22 @@ def bishop88_mpp(photocurrent, saturation_current, resistance_series,
     method_kwargs : dict, optional
         Keyword arguments passed to the root finder. For options, see:
 
-        * ``method='brentq'``: :py:func:`scipy:scipy.optimize.brentq`
+        * ``method='brentq'``: :py:func:`scipy:scipy.optimize.brentq`.
+          Array inputs are solved at once with a vectorized bracketed
+          method that accepts the same options.
         * ``method='newton'``: :py:func:`scipy:scipy.optimize.newton`
         * ``method='chandrupatla'``: :py:func:`scipy:scipy.optimize.elementwise.find_root`
 
         ``'full_output': True`` is allowed, and ``optimizer_output`` would be
         returned. See examples section.
 
+        With ``method='newton'``, ``'x0'`` sets the initial guess of the
+        diode voltage, e.g. the solution of the previous time step from
+        ``optimizer_output``. ``'x0': 'batzelis'`` starts from an explicit
+        estimate based on :py:func:`batzelis`, which usually needs fewer
+        iterations than the default guess. For array inputs,
+        ``optimizer_output`` includes the number of iterations.
+
     Returns
     -------
     tuple
@@ -660,24 +680,22 @@ def bishop88_mpp(photocurrent, saturation_current, resistance_series,
         return bishop88(x, *a, gradients=True)[6]
 
     if method == 'brentq':
-        # break out arguments for numpy.vectorize to handle broadcasting
-        vec_fun = np.vectorize(
-            lambda voc, iph, isat, rs, rsh, gamma, d2mutau, NsVbi, vbr_a, vbr,
-            vbr_exp: brentq(fmpp, 0.0, voc,
-                            args=(iph, isat, rs, rsh, gamma, d2mutau, NsVbi,
-                                  vbr_a, vbr, vbr_exp),
-                            **method_kwargs)
-        )
-        vd = vec_fun(xp, *args)
+        vd = _brentq(fmpp, xp, args, method_kwargs)
     elif method == 'newton':
         # make sure all args are numpy arrays if max size > 1
         # if voc_est is an array, then make a copy to use for initial guess, v0
 
+        x0, method_kwargs = _newton_initial_guess(xp, args, method_kwargs)
         x0, args, method_kwargs = \
-            _prepare_newton_inputs(xp, args, method_kwargs)
-        vd = newton(func=fmpp, x0=x0,
-                    fprime=lambda x, *a: bishop88(x, *a, gradients=True)[7],
-                    args=args, **method_kwargs)
+            _prepare_newton_inputs(x0, args, method_kwargs)
+        if _use_numba_newton(x0, method_kwargs):
+            vd = _newton_numba(_singlediode_numba.MPP, x0, 0., args,
+                               method_kwargs)
+        else:
+            vd = _newton(
+                func=fmpp, x0=x0,
+                fprime=lambda x, *a: bishop88(x, *a, gradients=True)[7],
+                args=args, method_kwargs=method_kwargs)
     elif method == 'chandrupatla':
         try:
             from scipy.optimize.elementwise import find_root
@@ -716,6 +734,69 @@ def bishop88_mpp(photocurrent, saturation_current, resistance_series,
         return bishop88(vd, *args)
 
 
+def _brentq(func, upper, args, method_kwargs):
+    """
+    Find the diode voltage between 0 and ``upper`` where ``func`` is zero.
+
+    Scalar inputs are solved with :py:func:`scipy.optimize.brentq`. Array
+    inputs are solved at once with a vectorized bracketed method that
+    accepts the same options as :py:func:`~scipy.optimize.brentq`, which is
+    much faster than calling :py:func:`~scipy.optimize.brentq` for each
+    element.
+
+    Parameters
+    ----------
+    func : function
+        Residual in the form ``func(x, *args)``.
+    upper : numeric
+        Upper end of the bracket. [V]
+    args : tuple
+        Additional arguments for ``func``.
+    method_kwargs : dict
+        Options for :py:func:`~scipy.optimize.brentq`.
+
+    Returns
+    -------
+    vd : numeric or tuple
+        Diode voltage. If ``method_kwargs`` contains ``'full_output': True``
+        and the inputs are arrays, a named tuple with the attributes
+        ``root``, the diode voltage, ``converged``, a boolean array that is
+        True where the solution converged, and ``iterations``, the number of
+        iterations of each element.
+    """
+    if np.ndim(upper) == 0 and not any(map(np.ndim, args)):
+        return brentq(func, 0.0, float(upper), args=args, **method_kwargs)
+    return _brentq_array(func, 0.0, upper, args=args, **method_kwargs)
+
+
+# attributes of scipy.optimize.RootResults, with an array for each
+_BrentqResult = namedtuple('result', ('root', 'converged', 'iterations'))
+
+
+def _brentq_array(func, lower, upper, args=(), xtol=2e-12,
+                  rtol=4 * np.finfo(float).eps, maxiter=100,
+                  full_output=False, disp=True):
+    # same options and errors as scipy.optimize.brentq, for arrays. Elements
+    # with NaN inputs are not solved and return NaN.
+    lower, upper, *args = np.broadcast_arrays(lower, upper,
+                                              *map(np.asarray, args))
+    f_lower = func(lower, *args)
+    f_upper = func(upper, *args)
+    with np.errstate(invalid='ignore'):
+        not_bracketed = f_lower * f_upper > 0
+    if np.any(not_bracketed):
+        raise ValueError("f(a) and f(b) must have different signs")
+
+    vd, converged, niter = _chandrupatla(func, lower, upper, args=args,
+                                         xtol=xtol, rtol=rtol,
+                                         maxiter=maxiter, full_output=True)
+    if disp and np.any(~converged & ~np.isnan(vd)):
+        raise RuntimeError(f"Failed to converge after {maxiter} iterations")
+    if full_output:
+        return _BrentqResult(vd, converged, niter)
+    return vd
+
+
 def _shape_of_max_size(*args):
     return max(((np.size(a), np.shape(a)) for a in args),
                key=lambda t: t[0])[1]
@@ -754,6 +835,125 @@ def _prepare_newton_inputs(x0, args, method_kwargs):
     return x0, args, method_kwargs
 
 
+def _newton_initial_guess(default, args, method_kwargs, current=None,
+                          voltage=None):
+    """
+    Get the initial guess of the diode voltage for newton.
+
+    Parameters
+    ----------
+    default : numeric
+        Initial guess used if ``method_kwargs`` does not contain ``'x0'``.
+    args : tuple
+        Arguments of :py:func:`bishop88` after the diode voltage.
+    method_kwargs : dict
+        Options for newton. ``'x0'`` may be numeric or ``'batzelis'``.
+    current, voltage : numeric, optional
+        Current or voltage to solve for. If neither is given, the initial
+        guess is for the maximum power point.
+
+    Returns
+    -------
+    x0 : numeric
+        Initial guess of the diode voltage. [V]
+    method_kwargs : dict
+        A copy of ``method_kwargs`` without ``'x0'``.
+    """
+    method_kwargs = method_kwargs.copy()
+    x0 = method_kwargs.pop('x0', None)
+    if x0 is None:
+        return default, method_kwargs
+    if isinstance(x0, str):
+        if x0.lower() != 'batzelis':
+            raise ValueError(
+                f"x0 must be numeric or 'batzelis', got '{x0}'")
+        x0 = _batzelis_diode_voltage(*args[:5], current=current,
+                                     voltage=voltage)
+        # no light, or the estimate is beyond the asymptote at NsVbi
+        NsVbi = args[6]
+        x0 = np.where(np.isfinite(x0) & (x0 < NsVbi), x0, default)[()]
+    return x0, method_kwargs
+
+
+def _batzelis_diode_voltage(photocurrent, saturation_current,
+                            resistance_series, resistance_shunt, nNsVth,
+                            current=None, voltage=None):
+    """
+    Explicit estimate of the diode voltage at a point on the IV curve.
+
+    At a given current, the diode voltage of an ideal diode (neglecting
+    the shunt current) is used. At a given voltage, the current is
+    interpolated along straight lines through the short circuit, maximum
+    power and open circuit points of :py:func:`batzelis`. Without current
+    or voltage, the estimate is the maximum power point of
+    :py:func:`batzelis`.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if current is not None:
+            return nNsVth * np.log1p((photocurrent - current) /
+                                     saturation_current)
+        est = batzelis(photocurrent, saturation_current, resistance_series,
+                       resistance_shunt, nNsVth)
+        i_sc, i_mp, v_mp, v_oc = (np.asarray(est[k]) for k in
+                                  ('i_sc', 'i_mp', 'v_mp', 'v_oc'))
+        if voltage is None:
+            return v_mp + resistance_series * i_mp
+        current = np.where(voltage <= v_mp,
+                           i_sc + (i_mp - i_sc) * voltage / v_mp,
+                           i_mp * (v_oc - voltage) / (v_oc - v_mp))
+        return voltage + resistance_series * current
+
+
+_NewtonResult = namedtuple('result',
+                           ('root', 'converged', 'zero_der', 'iterations'))
+
+
+def _newton(func, x0, fprime, args, method_kwargs):
+    """
+    Call :py:func:`scipy.optimize.newton` and count the iterations.
+
+    With ``full_output=True`` and array inputs, the
+    ``(root, converged, zero_der)`` output of newton is extended with the
+    number of iterations. All elements are iterated together, so this is
+    the number of iterations of the slowest element. For scalar inputs,
+    the output of newton already contains the number of iterations.
+    """
+    iterations = 0
+
+    def counted_fprime(x, *a):
+        nonlocal iterations
+        iterations += 1
+        return fprime(x, *a)
+
+    out = newton(func=func, x0=x0, fprime=counted_fprime, args=args,
+                 **method_kwargs)
+    if method_kwargs.get('full_output') and np.size(x0) > 1:
+        out = _NewtonResult(*out, iterations)
+    return out
+
+
+def _use_numba_newton(x0, method_kwargs):
+    # the compiled newton is used for the inputs that scipy's newton solves
+    # as arrays if pvlib was imported with PVLIB_USE_NUMBA, and if it
+    # supports the options of newton
+    return (_singlediode_numba.USE_NUMBA and np.size(x0) > 1
+            and set(method_kwargs) <= _singlediode_numba.NEWTON_KWARGS)
+
+
+def _newton_numba(mode, x0, target, args, method_kwargs):
+    """
+    Solve for the diode voltage with the compiled newton kernel.
+
+    The output is the same as for :py:func:`_newton` with array inputs, but
+    each element stops iterating when it has converged.
+    """
+    out = _singlediode_numba.bishop88_newton(mode, x0, target, args,
+                                             method_kwargs)
+    if method_kwargs.get('full_output'):
+        return _NewtonResult(*out)
+    return out[0]
+
+
 def _lambertw_v_from_i(current, photocurrent, saturation_current,
                        resistance_series, resistance_shunt, nNsVth):
     # Record if inputs were all scalar
@@ -761,6 +961,12 @@ def _lambertw_v_from_i(current, photocurrent, saturation_current,
                                (current, photocurrent, saturation_current,
                                 resistance_series, resistance_shunt, nNsVth)))
 
+    if _singlediode_numba.USE_NUMBA:
+        V = _singlediode_numba.lambertw_v_from_i(
+            current, photocurrent, saturation_current, resistance_series,
+            resistance_shunt, nNsVth)
+        return V.item() if output_is_scalar else V
+
     # This transforms Gsh=1/Rsh, including ideal Rsh=np.inf into Gsh=0., which
     #  is generally more numerically stable
     conductance_shunt = 1. / resistance_shunt
@@ -836,6 +1042,12 @@ def _lambertw_i_from_v(voltage, photocurrent, saturation_current,
                                (voltage, photocurrent, saturation_current,
                                 resistance_series, resistance_shunt, nNsVth)))
 
+    if _singlediode_numba.USE_NUMBA:
+        I = _singlediode_numba.lambertw_i_from_v(           # noqa: E741
+            voltage, photocurrent, saturation_current, resistance_series,
+            resistance_shunt, nNsVth)
+        return I.item() if output_is_scalar else I
+
     # This transforms Gsh=1/Rsh, including ideal Rsh=np.inf into Gsh=0., which
     #  is generally more numerically stable
     conductance_shunt = 1. / resistance_shunt
@@ -923,8 +1135,12 @@ def _lambertw(photocurrent, saturation_current, resistance_series,
         p_mp = -1.*res.f_x
     except ModuleNotFoundError:
         # switch to old golden section method
-        p_mp, v_mp = _golden_sect_DataFrame(params, 0., v_oc * 1.14,
-                                            _pwr_optfcn)
+        p_mp, v_mp = _golden_sect(_pwr_optfcn, 0., v_oc * 1.14,
+                                  args=(params['photocurrent'],
+                                        params['saturation_current'],
+                                        params['resistance_series'],
+                                        params['resistance_shunt'],
+                                        params['nNsVth']))
 
     i_mp = _lambertw_i_from_v(v_mp, **params)
 
@@ -956,17 +1172,13 @@ def _vmp_opt(v, iph, io, rs, rsh, nNsVth):
     return -v * current
 
 
-def _pwr_optfcn(df, loc):
+def _pwr_optfcn(v, iph, io, rs, rsh, nNsVth):
     '''
     Function to find power from ``i_from_v``.
     '''
+    current = _lambertw_i_from_v(v, iph, io, rs, rsh, nNsVth)
 
-    current = _lambertw_i_from_v(df[loc], df['photocurrent'],
-                                 df['saturation_current'],
-                                 df['resistance_series'],
-                                 df['resistance_shunt'], df['nNsVth'])
-
-    return current * df[loc]
+    return current * v
 
 
 def batzelis(photocurrent, saturation_current, resistance_series,
@@ -10,6 +10,8 @@ Calculate the solar position using a variety of methods/packages.
 
 import os
 import datetime as dt
+import hashlib
+from collections import OrderedDict
 try:
     from importlib import reload
 except ImportError:
@@ -20,7 +22,6 @@ except ImportError:
 
 import numpy as np
 import pandas as pd
-import scipy.optimize as so
 import warnings
 
 from pvlib import atmosphere, tools
@@ -63,6 +64,10 @@ def get_solarposition(time, latitude, longitude,
         described in [1], but also compiles the code first:
         :py:func:`spa_python`
 
+        'spa_interp' uses the NREL SPA algorithm described in [1], but
+        interpolates the observer-independent terms from an hourly grid:
+        :py:func:`spa_python_interp`
+
         'pyephem' uses the PyEphem package: :py:func:`pyephem`
 
         'ephemeris' uses the pvlib ephemeris code: :py:func:`ephemeris`
@@ -111,6 +116,9 @@ def get_solarposition(time, latitude, longitude,
         ephem_df = spa_python(time, latitude, longitude, altitude,
                               pressure, temperature,
                               how='numpy', **kwargs)
+    elif method == 'spa_interp':
+        ephem_df = spa_python_interp(time, latitude, longitude, altitude,
+                                     pressure, temperature, **kwargs)
     elif method == 'pyephem':
         ephem_df = pyephem(time, latitude, longitude,
                            altitude=altitude,
@@ -125,6 +133,165 @@ def get_solarposition(time, latitude, longitude,
     return ephem_df
 
 
+class SolarPositionCache:
+    """
+    Cache of solar position results.
+
+    Results of :py:func:`get_solarposition` are stored in memory with a
+    least recently used (LRU) eviction policy and, optionally, in ``.npz``
+    files in a directory so that they persist between sessions. Entries
+    are keyed by the location, the method, the other solar position
+    arguments and a fingerprint of the times.
+
+    Pass the cache to :py:class:`pvlib.location.Location` to have
+    :py:meth:`pvlib.location.Location.get_solarposition`, and therefore
+    :py:class:`pvlib.modelchain.ModelChain`, use it.
+
+    Parameters
+    ----------
+    maxsize : int, default 128
+        Maximum number of results kept in memory.
+    path : str or path-like, optional
+        Directory for the on-disk store. It is created if it does not
+        exist. If not given, results are only kept in memory.
+
+    Attributes
+    ----------
+    hits : int
+        Number of results returned from the cache.
+    misses : int
+        Number of results that had to be calculated.
+
+    See also
+    --------
+    get_solarposition
+    pvlib.location.Location.get_solarposition
+
+    Examples
+    --------
+    >>> cache = SolarPositionCache(maxsize=16)
+    >>> times = pd.date_range('2020-06-01', freq='1h', periods=24, tz='UTC')
+    >>> solpos = cache.get_solarposition(times, 32.2, -110.9)
+    >>> solpos = cache.get_solarposition(times, 32.2, -110.9)
+    >>> cache.hits, cache.misses
+    (1, 1)
+    """
+
+    def __init__(self, maxsize=128, path=None):
+        self.maxsize = maxsize
+        self.path = None if path is None else os.fspath(path)
+        if self.path is not None:
+            os.makedirs(self.path, exist_ok=True)
+        self._results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._results)
+
+    def __repr__(self):
+        return (f'SolarPositionCache(maxsize={self.maxsize}, '
+                f'path={self.path!r}, entries={len(self)}, '
+                f'hits={self.hits}, misses={self.misses})')
+
+    @staticmethod
+    def _fingerprint(value):
+        # hashable representation of a solar position argument
+        if isinstance(value, pd.DatetimeIndex):
+            # results only depend on the instants, not on the time zone
+            # or the resolution of the index
+            value = _datetime_to_unixtime(value)
+        if np.ndim(value) == 0:
+            return repr(value)
+        value = np.ascontiguousarray(value)
+        digest = hashlib.sha1(value.view(np.uint8)).hexdigest()
+        return f'{value.dtype.str}{value.shape}:{digest}'
+
+    def _key(self, time, latitude, longitude, altitude, method, kwargs):
+        parts = [self._fingerprint(time), repr(float(latitude)),
+                 repr(float(longitude)), self._fingerprint(altitude),
+                 method.lower()]
+        parts += [f'{k}={self._fingerprint(v)}'
+                  for k, v in sorted(kwargs.items())]
+        return hashlib.sha1('|'.join(parts).encode()).hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, key + '.npz')
+
+    def _load(self, key):
+        if self.path is None or not os.path.exists(self._file(key)):
+            return None
+        with np.load(self._file(key)) as data:
+            columns = data['columns']
+            return {str(c): data[f'column{i}'] for i, c in enumerate(columns)}
+
+    def _save(self, key, result):
+        arrays = {f'column{i}': result[c].to_numpy()
+                  for i, c in enumerate(result.columns)}
+        np.savez(self._file(key), columns=np.array(result.columns, dtype=str),
+                 **arrays)
+
+    def _store(self, key, values):
+        self._results[key] = values
+        self._results.move_to_end(key)
+        while len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    def get_solarposition(self, time, latitude, longitude, altitude=None,
+                          pressure=None, method='nrel_numpy',
+                          temperature=12.0, **kwargs):
+        """
+        Calculate the solar position with :py:func:`get_solarposition`,
+        returning a cached result if one is available.
+
+        Parameters are the same as for :py:func:`get_solarposition`.
+
+        Returns
+        -------
+        DataFrame
+            A new DataFrame indexed by ``time``; modifying it does not
+            modify the cache.
+        """
+        if isinstance(time, dt.datetime):
+            time = pd.DatetimeIndex([time, ])
+        kwargs = dict(kwargs, pressure=pressure, temperature=temperature)
+        key = self._key(time, latitude, longitude, altitude, method, kwargs)
+
+        values = self._results.get(key)
+        if values is None:
+            values = self._load(key)
+            if values is not None:
+                self._store(key, values)
+        else:
+            self._results.move_to_end(key)
+
+        if values is not None:
+            self.hits += 1
+            return pd.DataFrame({k: v.copy() for k, v in values.items()},
+                                index=time)
+
+        self.misses += 1
+        result = get_solarposition(time, latitude, longitude,
+                                   altitude=altitude, method=method,
+                                   **kwargs)
+        self._store(key, {c: result[c].to_numpy(copy=True)
+                          for c in result.columns})
+        if self.path is not None:
+            self._save(key, result)
+        return result
+
+    def clear(self):
+        """Remove all results from memory and from the on-disk store."""
+        self._results.clear()
+        if self.path is not None:
+            for name in os.listdir(self.path):
+                # only remove files written by the cache
+                key, ext = os.path.splitext(name)
+                if ext == '.npz' and len(key) == 40 and all(
+                        c in '0123456789abcdef' for c in key):
+                    os.remove(os.path.join(self.path, name))
+
+
 def spa_c(time, latitude, longitude, pressure=101325., altitude=0.,
           temperature=12., delta_t=67.0,
           raw_spa_output=False):
@@ -280,7 +447,8 @@ def _datetime_to_unixtime(dtindex):
 
 def spa_python(time, latitude, longitude,
                altitude=0., pressure=101325., temperature=12., delta_t=67.0,
-               atmos_refract=None, how='numpy', numthreads=4):
+               atmos_refract=None, how='numpy', numthreads=None,
+               spa_ephemeris=None):
     """
     Calculate the solar position using a python implementation of the
     NREL SPA algorithm.
@@ -321,8 +489,14 @@ def spa_python(time, latitude, longitude,
         Options are 'numpy' or 'numba'. If numba >= 0.17.0
         is installed, how='numba' will compile the spa functions
         to machine code and run them multithreaded.
-    numthreads : int, optional, default 4
-        Number of threads to use if how == 'numba'.
+    numthreads : int, optional
+        Number of threads to use if how == 'numba'. If None (default),
+        numba's global thread count is used, see
+        :py:func:`numba.set_num_threads`.
+    spa_ephemeris : SPAEphemeris, optional
+        Precomputed observer-independent terms for ``time``. If provided,
+        only the topocentric part of the SPA is calculated and ``delta_t``
+        is ignored.
 
     Returns
     -------
@@ -351,7 +525,7 @@ def spa_python(time, latitude, longitude,
 
     See also
     --------
-    pyephem, spa_c, ephemeris
+    pyephem, spa_c, ephemeris, SPAEphemeris
     """
 
     # Added by Tony Lorenzo (@alorenzo175), University of Arizona, 2015
@@ -373,13 +547,416 @@ def spa_python(time, latitude, longitude,
 
     spa = _spa_python_import(how)
 
+    if spa_ephemeris is not None:
+        time_terms = spa_ephemeris._time_terms_for(unixtime)
+        app_zenith, zenith, app_elevation, elevation, azimuth, eot = \
+            spa.observer_dependent(time_terms, lat, lon, elev, pressure,
+                                   temperature, atmos_refract,
+                                   numthreads)[:, 0]
+    else:
+        if delta_t is None:
+            delta_t = spa.calculate_deltat_unixtime(unixtime)
+
+        app_zenith, zenith, app_elevation, elevation, azimuth, eot = \
+            spa.solar_position(unixtime, lat, lon, elev, pressure,
+                               temperature, delta_t, atmos_refract,
+                               numthreads)
+
+    result = pd.DataFrame({'apparent_zenith': app_zenith, 'zenith': zenith,
+                           'apparent_elevation': app_elevation,
+                           'elevation': elevation, 'azimuth': azimuth,
+                           'equation_of_time': eot},
+                          index=time)
+
+    return result
+
+
+def spa_python_multisite(time, latitude, longitude, altitude=0.,
+                         pressure=101325., temperature=12., delta_t=67.0,
+                         atmos_refract=None, how='numpy', numthreads=None,
+                         spa_ephemeris=None):
+    """
+    Calculate the solar position for many sites at once using a python
+    implementation of the NREL SPA algorithm.
+
+    The terms of the NREL SPA algorithm [1]_, [2]_ that only depend on
+    time are calculated once per timestamp and broadcast across all sites,
+    so this is much faster than calling :py:func:`spa_python` in a loop
+    over sites.
+
+    Parameters
+    ----------
+    time : pandas.DatetimeIndex
+        Must be localized or UTC will be assumed.
+    latitude : float or array-like
+        Latitude of each site in decimal degrees. Positive north of
+        equator, negative to south.
+    longitude : float or array-like
+        Longitude of each site in decimal degrees. Positive east of prime
+        meridian, negative to west.
+    altitude : float or array-like, default 0.0
+        Distance of each site above sea level.
+    pressure : float or array-like, default 101325.0
+        avg. yearly air pressure at each site in Pascals.
+    temperature : float or array-like, default 12.0
+        avg. yearly air temperature at each site in degrees C.
+    delta_t : float or array, optional, default 67.0
+        Difference between terrestrial time and UT1.
+        If delta_t is None, uses spa.calculate_deltat
+        using time.year and time.month from pandas.DatetimeIndex.
+        For most simulations the default delta_t is sufficient.
+        The USNO has historical and forecasted delta_t [3]_.
+    atmos_refract : float, optional
+        The approximate atmospheric refraction (in degrees)
+        at sunrise and sunset.
+    how : str, optional, default 'numpy'
+        Options are 'numpy' or 'numba'. If numba >= 0.17.0
+        is installed, how='numba' will compile the spa functions
+        to machine code and run them multithreaded.
+    numthreads : int, optional
+        Number of threads to use if how == 'numba'. If None (default),
+        numba's global thread count is used, see
+        :py:func:`numba.set_num_threads`.
+    spa_ephemeris : SPAEphemeris, optional
+        Precomputed observer-independent terms for ``time``. If provided,
+        only the topocentric part of the SPA is calculated and ``delta_t``
+        is ignored.
+
+    Returns
+    -------
+    dict
+        Dictionary of arrays with shape (N, T), where N is the number of
+        sites and T is ``len(time)``, with the following keys:
+
+        - apparent_zenith (degrees),
+        - zenith (degrees),
+        - apparent_elevation (degrees),
+        - elevation (degrees),
+        - azimuth (degrees),
+        - equation_of_time (minutes).
+
+    References
+    ----------
+    .. [1] I. Reda and A. Andreas, Solar position algorithm for solar
+       radiation applications. Solar Energy, vol. 76, no. 5, pp. 577-589, 2004.
+       :doi:`10.1016/j.solener.2003.12.003`.
+
+    .. [2] I. Reda and A. Andreas, Corrigendum to Solar position algorithm for
+       solar radiation applications. Solar Energy, vol. 81, no. 6, p. 838,
+       2007. :doi:`10.1016/j.solener.2007.01.003`.
+
+    .. [3] `U.S. Naval Observatory, delta T
+       <https://maia.usno.navy.mil/products/deltaT>`_
+
+    See also
+    --------
+    spa_python, SPAEphemeris
+    """
+    pressure = np.asarray(pressure) / 100  # millibars for calculation
+
+    atmos_refract = atmos_refract or 0.5667
+
+    if not isinstance(time, pd.DatetimeIndex):
+        try:
+            time = pd.DatetimeIndex(time)
+        except (TypeError, ValueError):
+            time = pd.DatetimeIndex([time, ])
+
+    unixtime = _datetime_to_unixtime(time)
+
+    spa = _spa_python_import(how)
+
+    if spa_ephemeris is not None:
+        time_terms = spa_ephemeris._time_terms_for(unixtime)
+    else:
+        if delta_t is None:
+            delta_t = spa.calculate_deltat_unixtime(unixtime)
+        time_terms = spa.observer_independent(unixtime, delta_t, numthreads)
+
+    result = spa.observer_dependent(
+        time_terms, latitude, longitude, altitude, pressure, temperature,
+        atmos_refract, numthreads)
+
+    keys = ('apparent_zenith', 'zenith', 'apparent_elevation', 'elevation',
+            'azimuth', 'equation_of_time')
+    return dict(zip(keys, result))
+
+
+class SPAEphemeris:
+    """
+    Observer-independent terms of the NREL SPA algorithm for a set of times.
+
+    The heliocentric position of the earth, nutation, obliquity and
+    sidereal time do not depend on the observer and dominate the run time
+    of :py:func:`spa_python`. An ``SPAEphemeris`` calculates these terms
+    once so that they can be reused for any number of sites and runs, and
+    optionally saved to disk with :py:meth:`save`.
+
+    Parameters
+    ----------
+    time : pandas.DatetimeIndex
+        Must be localized or UTC will be assumed.
+    delta_t : float or array, optional, default 67.0
+        Difference between terrestrial time and UT1.
+        If delta_t is None, uses spa.calculate_deltat
+        using time.year and time.month from pandas.DatetimeIndex.
+    how : str, optional, default 'numpy'
+        Options are 'numpy' or 'numba'. If numba >= 0.17.0
+        is installed, how='numba' will compile the spa functions
+        to machine code and run them multithreaded.
+    numthreads : int, optional
+        Number of threads to use if how == 'numba'. If None (default),
+        numba's global thread count is used, see
+        :py:func:`numba.set_num_threads`.
+
+    Attributes
+    ----------
+    time : pandas.DatetimeIndex
+    apparent_sidereal_time : numpy.ndarray
+        Apparent sidereal time at Greenwich. [degrees]
+    right_ascension : numpy.ndarray
+        Geocentric sun right ascension. [degrees]
+    declination : numpy.ndarray
+        Geocentric sun declination. [degrees]
+    earth_radius_vector : numpy.ndarray
+        Earth-sun distance. [AU]
+    equation_of_time : numpy.ndarray
+        Equation of time. [minutes]
+
+    Examples
+    --------
+    >>> times = pd.date_range('2024-01-01', freq='1min', periods=1440,
+    ...                       tz='UTC')
+    >>> eph = SPAEphemeris(times)
+    >>> solpos = eph.get_solarposition(35.1, -106.6, altitude=1500)
+
+    See also
+    --------
+    spa_python, spa_python_multisite
+    """
+
+    _terms = ('apparent_sidereal_time', 'right_ascension', 'declination',
+              'earth_radius_vector', 'equation_of_time')
+
+    def __init__(self, time, delta_t=67.0, how='numpy', numthreads=None):
+        if not isinstance(time, pd.DatetimeIndex):
+            try:
+                time = pd.DatetimeIndex(time)
+            except (TypeError, ValueError):
+                time = pd.DatetimeIndex([time, ])
+
+        unixtime = _datetime_to_unixtime(time)
+
+        spa = _spa_python_import(how)
+
+        if delta_t is None:
+            delta_t = spa.calculate_deltat_unixtime(unixtime)
+
+        self._set_time_terms(
+            time, spa.observer_independent(unixtime, delta_t, numthreads))
+
+    def _set_time_terms(self, time, time_terms):
+        self.time = time
+        self._unixtime = _datetime_to_unixtime(time)
+        self._time_terms = time_terms
+        for name, values in zip(self._terms, time_terms):
+            setattr(self, name, values)
+
+    def __repr__(self):
+        return (f'SPAEphemeris: \n  {len(self.time)} times from '
+                f'{self.time.min()} to {self.time.max()}')
+
+    def _time_terms_for(self, unixtime):
+        if not np.array_equal(unixtime, self._unixtime):
+            raise ValueError('time does not match the times of the '
+                             'SPAEphemeris')
+        return self._time_terms
+
+    def get_solarposition(self, latitude, longitude, altitude=0.,
+                          pressure=101325., temperature=12.,
+                          atmos_refract=None, how='numpy', numthreads=None):
+        """
+        Calculate the solar position at a site using the precomputed terms.
+
+        Parameters
+        ----------
+        latitude : float
+            Latitude in decimal degrees. Positive north of equator, negative
+            to south.
+        longitude : float
+            Longitude in decimal degrees. Positive east of prime meridian,
+            negative to west.
+        altitude : float, default 0.0
+            Distance above sea level.
+        pressure : int or float, optional, default 101325.0
+            avg. yearly air pressure in Pascals.
+        temperature : int or float, optional, default 12.0
+            avg. yearly air temperature in degrees C.
+        atmos_refract : float, optional
+            The approximate atmospheric refraction (in degrees)
+            at sunrise and sunset.
+        how : str, optional, default 'numpy'
+            Options are 'numpy' or 'numba'.
+        numthreads : int, optional
+            Number of threads to use if how == 'numba'. If None (default),
+            numba's global thread count is used, see
+            :py:func:`numba.set_num_threads`.
+
+        Returns
+        -------
+        DataFrame
+            See :py:func:`spa_python`.
+        """
+        return spa_python(self.time, latitude, longitude, altitude=altitude,
+                          pressure=pressure, temperature=temperature,
+                          atmos_refract=atmos_refract, how=how,
+                          numthreads=numthreads, spa_ephemeris=self)
+
+    def save(self, path):
+        """
+        Save the ephemeris to a numpy ``.npz`` file.
+
+        Parameters
+        ----------
+        path : str or path-like
+            File to write. numpy appends ``.npz`` if it is missing.
+        """
+        time = self.time
+        tz = '' if time.tz is None else str(time.tz)
+        time_utc = tools._pandas_to_utc(time).tz_localize(None)
+        np.savez(path, time=time_utc.values, tz=np.array(tz),
+                 time_terms=self._time_terms)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load an ephemeris saved with :py:meth:`save`.
+
+        Parameters
+        ----------
+        path : str or path-like
+            ``.npz`` file to read.
+
+        Returns
+        -------
+        SPAEphemeris
+        """
+        with np.load(path) as data:
+            time = pd.DatetimeIndex(data['time'])
+            tz = str(data['tz'])
+            time_terms = data['time_terms']
+        if tz:
+            time = time.tz_localize('UTC').tz_convert(tz)
+        obj = cls.__new__(cls)
+        obj._set_time_terms(time, time_terms)
+        return obj
+
+
+def spa_python_interp(time, latitude, longitude,
+                      altitude=0., pressure=101325., temperature=12.,
+                      delta_t=67.0, atmos_refract=None, interp_freq='1h',
+                      how='numpy', numthreads=None):
+    """
+    Calculate an approximate solar position using the NREL SPA algorithm
+    with interpolated observer-independent terms.
+
+    The observer-independent terms of the NREL SPA algorithm [1]_, [2]_
+    (apparent sidereal time, geocentric sun right ascension and
+    declination, earth radius vector and equation of time) are evaluated
+    on a coarse time grid with spacing ``interp_freq`` and linearly
+    interpolated to ``time``. The topocentric terms are then calculated
+    exactly for each timestamp. For finely sampled times this is roughly
+    an order of magnitude faster than :py:func:`spa_python`.
+
+    With the default hourly grid, the differences from
+    :py:func:`spa_python` are less than 1e-5 degrees for zenith and
+    elevation, less than 1e-5 minutes for the equation of time, and less
+    than 1e-4 degrees for azimuth when the sun is more than 1 degree from
+    the zenith or nadir, where azimuth is ill-conditioned. These are well
+    below the uncertainty of the SPA itself (0.0003 degrees). The error
+    grows roughly with the square of ``interp_freq``. If the grid would
+    have more points than ``time``, e.g. for a few timestamps years apart,
+    the result is the same as :py:func:`spa_python`.
+
+    Parameters
+    ----------
+    time : pandas.DatetimeIndex
+        Must be localized or UTC will be assumed.
+    latitude : float
+        Latitude in decimal degrees. Positive north of equator, negative
+        to south.
+    longitude : float
+        Longitude in decimal degrees. Positive east of prime meridian,
+        negative to west.
+    altitude : float, default 0.0
+        Distance above sea level.
+    pressure : int or float, optional, default 101325.0
+        avg. yearly air pressure in Pascals.
+    temperature : int or float, optional, default 12.0
+        avg. yearly air temperature in degrees C.
+    delta_t : float or array, optional, default 67.0
+        Difference between terrestrial time and UT1.
+        If delta_t is None, uses spa.calculate_deltat
+        using time.year and time.month from pandas.DatetimeIndex.
+        For most simulations the default delta_t is sufficient.
+    atmos_refract : float, optional
+        The approximate atmospheric refraction (in degrees)
+        at sunrise and sunset.
+    interp_freq : str or pandas.Timedelta, default '1h'
+        Spacing of the grid on which the observer-independent terms are
+        evaluated.
+    how : str, optional, default 'numpy'
+        Options are 'numpy' or 'numba'. If numba >= 0.17.0
+        is installed, how='numba' will compile the spa functions
+        to machine code and run them multithreaded.
+    numthreads : int, optional
+        Number of threads to use if how == 'numba'. If None (default),
+        numba's global thread count is used, see
+        :py:func:`numba.set_num_threads`.
+
+    Returns
+    -------
+    DataFrame
+        The DataFrame will have the same columns as :py:func:`spa_python`.
+
+    References
+    ----------
+    .. [1] I. Reda and A. Andreas, Solar position algorithm for solar
+       radiation applications. Solar Energy, vol. 76, no. 5, pp. 577-589, 2004.
+       :doi:`10.1016/j.solener.2003.12.003`.
+
+    .. [2] I. Reda and A. Andreas, Corrigendum to Solar position algorithm for
+       solar radiation applications. Solar Energy, vol. 81, no. 6, p. 838,
+       2007. :doi:`10.1016/j.solener.2007.01.003`.
+
+    See also
+    --------
+    spa_python, SPAEphemeris
+    """
+    pressure = pressure / 100  # pressure must be in millibars for calculation
+
+    atmos_refract = atmos_refract or 0.5667
+
+    if not isinstance(time, pd.DatetimeIndex):
+        try:
+            time = pd.DatetimeIndex(time)
+        except (TypeError, ValueError):
+            time = pd.DatetimeIndex([time, ])
+
+    unixtime = _datetime_to_unixtime(time)
+
+    spa = _spa_python_import(how)
+
     if delta_t is None:
-        time_utc = tools._pandas_to_utc(time)
-        delta_t = spa.calculate_deltat(time_utc.year, time_utc.month)
+        delta_t = spa.calculate_deltat_unixtime(unixtime)
 
+    step = pd.Timedelta(interp_freq).total_seconds()
+    time_terms = spa.observer_independent_interp(unixtime, delta_t, step,
+                                                 numthreads)
     app_zenith, zenith, app_elevation, elevation, azimuth, eot = \
-        spa.solar_position(unixtime, lat, lon, elev, pressure, temperature,
-                           delta_t, atmos_refract, numthreads)
+        spa.observer_dependent(time_terms, latitude, longitude, altitude,
+                               pressure, temperature, atmos_refract,
+                               numthreads)[:, 0]
 
     result = pd.DataFrame({'apparent_zenith': app_zenith, 'zenith': zenith,
                            'apparent_elevation': app_elevation,
@@ -391,7 +968,7 @@ def spa_python(time, latitude, longitude,
 
 
 def sun_rise_set_transit_spa(times, latitude, longitude, how='numpy',
-                             delta_t=67.0, numthreads=4):
+                             delta_t=67.0, numthreads=None):
     """
     Calculate the sunrise, sunset, and sun transit times using the
     NREL SPA algorithm.
@@ -420,8 +997,10 @@ def sun_rise_set_transit_spa(times, latitude, longitude, how='numpy',
         If delta_t is None, uses spa.calculate_deltat
         using times.year and times.month from pandas.DatetimeIndex.
         For most simulations the default delta_t is sufficient.
-    numthreads : int, optional, default 4
-        Number of threads to use if how == 'numba'.
+    numthreads : int, optional
+        Number of threads to use if how == 'numba'. If None (default),
+        numba's global thread count is used, see
+        :py:func:`numba.set_num_threads`.
 
     Returns
     -------
@@ -453,7 +1032,7 @@ def sun_rise_set_transit_spa(times, latitude, longitude, how='numpy',
     spa = _spa_python_import(how)
 
     if delta_t is None:
-        delta_t = spa.calculate_deltat(times_utc.year, times_utc.month)
+        delta_t = spa.calculate_deltat_unixtime(unixtime)
 
     transit, sunrise, sunset = spa.transit_sunrise_sunset(
         unixtime, lat, lon, delta_t, numthreads)
@@ -471,6 +1050,89 @@ def sun_rise_set_transit_spa(times, latitude, longitude, how='numpy',
                                            'transit': transit})
 
 
+def _unixtime_to_datetime64(unixtime):
+    # convert float seconds since epoch to datetime64[ns], NaN becomes NaT
+    unixtime = np.asarray(unixtime)
+    nanoseconds = np.where(np.isnan(unixtime), np.iinfo(np.int64).min,
+                           np.round(unixtime * 1e9))
+    return nanoseconds.astype(np.int64).view('datetime64[ns]')
+
+
+def sun_rise_set_transit_spa_multisite(times, latitude, longitude,
+                                       how='numpy', delta_t=67.0,
+                                       numthreads=None):
+    """
+    Calculate the sunrise, sunset, and sun transit times for many sites
+    and days at once using the NREL SPA algorithm.
+
+    The details of the NREL SPA algorithm are described in [1]_. The solar
+    position terms only depend on the day and are calculated once for all
+    sites, and the results are returned as arrays rather than one
+    DataFrame per site.
+
+    Parameters
+    ----------
+    times : pandas.DatetimeIndex
+        Must be localized. The day of each timestamp in UTC is used.
+    latitude : float or array-like
+        Latitude of each site in degrees, positive north of equator,
+        negative to south
+    longitude : float or array-like
+        Longitude of each site in degrees, positive east of prime meridian,
+        negative to west
+    how : str, optional, default 'numpy'
+        Options are 'numpy' or 'numba'. If numba >= 0.17.0
+        is installed, how='numba' will compile the spa functions
+        to machine code and run them multithreaded.
+    delta_t : float or array, optional, default 67.0
+        Difference between terrestrial time and UT1.
+        If delta_t is None, uses spa.calculate_deltat
+        using times.year and times.month from pandas.DatetimeIndex.
+        For most simulations the default delta_t is sufficient.
+    numthreads : int, optional
+        Number of threads to use if how == 'numba'. If None (default),
+        numba's global thread count is used, see
+        :py:func:`numba.set_num_threads`.
+
+    Returns
+    -------
+    dict
+        Dictionary with keys 'sunrise', 'sunset', and 'transit'. Each value
+        is a ``numpy.datetime64[ns]`` array in UTC with shape (N, T), where
+        N is the number of sites and T is ``len(times)``. NaT indicates
+        that there is no sunrise or sunset on that day.
+
+    References
+    ----------
+    .. [1] Reda, I., Andreas, A., 2003. Solar position algorithm for solar
+       radiation applications. Technical report: NREL/TP-560-34302. Golden,
+       USA, http://www.nlr.gov.
+
+    See also
+    --------
+    sun_rise_set_transit_spa
+    """
+    # times must be localized
+    if not times.tz:
+        raise ValueError('times must be localized')
+
+    # must convert to midnight UTC on day of interest
+    times_utc = times.tz_convert('UTC')
+    unixtime = _datetime_to_unixtime(times_utc.normalize())
+
+    spa = _spa_python_import(how)
+
+    if delta_t is None:
+        delta_t = spa.calculate_deltat_unixtime(unixtime)
+
+    transit, sunrise, sunset = spa.transit_sunrise_sunset_multisite(
+        unixtime, latitude, longitude, delta_t, numthreads)
+
+    return {'sunrise': _unixtime_to_datetime64(sunrise),
+            'sunset': _unixtime_to_datetime64(sunset),
+            'transit': _unixtime_to_datetime64(transit)}
+
+
 def _ephem_convert_to_seconds_and_microseconds(date):
     # utility from unreleased PyEphem 3.6.7.1
     """Converts a PyEphem date into seconds"""
@@ -680,7 +1342,8 @@ def pyephem(time, latitude, longitude, altitude=0., pressure=101325.,
     return sun_coords
 
 
-def ephemeris(time, latitude, longitude, pressure=101325.0, temperature=12.0):
+def ephemeris(time, latitude, longitude, pressure=101325.0, temperature=12.0,
+              dtype=np.float64):
     """
     Python-native solar position calculator.
     The accuracy of this code is not guaranteed.
@@ -700,6 +1363,10 @@ def ephemeris(time, latitude, longitude, pressure=101325.0, temperature=12.0):
         Ambient pressure (Pascals)
     temperature : float or Series, default 12.0
         Ambient temperature (C)
+    dtype : numpy dtype, default numpy.float64
+        Floating point type of the results, e.g. ``numpy.float32`` to
+        halve the memory of large calculations. See
+        :py:func:`ephemeris_array`.
 
     Returns
     -------
@@ -726,8 +1393,62 @@ def ephemeris(time, latitude, longitude, pressure=101325.0, temperature=12.0):
 
     See also
     --------
-    pyephem, spa_c, spa_python
+    pyephem, spa_c, spa_python, ephemeris_array
+
+    """
+    unixtime = _datetime_to_unixtime(tools._pandas_to_utc(time))
+    result = ephemeris_array(unixtime, latitude, longitude,
+                             np.asarray(pressure), np.asarray(temperature),
+                             dtype=dtype)
+    return pd.DataFrame(result, index=time)
+
+
+def ephemeris_array(unixtime, latitude, longitude, pressure=101325.0,
+                    temperature=12.0, dtype=np.float64):
+    """
+    Python-native solar position calculator operating on numpy arrays.
+
+    This is the algorithm of :py:func:`ephemeris` without any pandas
+    objects, for use on large arrays of times and sites. The inputs are
+    broadcast together, so e.g. a ``(N, 1)`` array of latitudes and a
+    ``(T,)`` array of times give ``(N, T)`` results. The accuracy of this
+    code is not guaranteed.
+
+    Parameters
+    ----------
+    unixtime : array-like
+        Seconds since 1970-01-01 00:00 UTC.
+    latitude : float or array-like
+        Latitude in decimal degrees. Positive north of equator, negative
+        to south.
+    longitude : float or array-like
+        Longitude in decimal degrees. Positive east of prime meridian,
+        negative to west.
+    pressure : float or array-like, default 101325.0
+        Ambient pressure (Pascals)
+    temperature : float or array-like, default 12.0
+        Ambient temperature (C)
+    dtype : numpy dtype, default numpy.float64
+        Floating point type of the results. The terms that only depend on
+        time are always calculated in double precision; with
+        ``numpy.float32`` the site dependent terms are calculated in single
+        precision, with errors of order 1e-4 degrees.
+
+    Returns
+    -------
+    dict
+        Dictionary of arrays with keys 'apparent_elevation', 'elevation',
+        'azimuth', 'apparent_zenith', 'zenith' and 'solar_time', see
+        :py:func:`ephemeris`.
+
+    References
+    -----------
+    .. [1] Grover Hughes' class and related class materials on Engineering
+       Astronomy at Sandia National Laboratories, 1985.
 
+    See also
+    --------
+    ephemeris
     """
 
     # Added by Rob Andrews (@Calama-Consulting), Calama Consulting, 2014
@@ -747,27 +1468,24 @@ def ephemeris(time, latitude, longitude, pressure=101325.0, temperature=12.0):
     # correct convention (e.g. Albuquerque is at -106 longitude), but it needs
     # to be inverted for use in the code.
 
-    Latitude = latitude
-    Longitude = -1 * longitude
+    Latitude = np.asarray(latitude, dtype=dtype)
+    Longitude = -1 * np.asarray(longitude, dtype=np.float64)
 
     Abber = 20 / 3600.
     LatR = np.radians(Latitude)
 
     # the SPA algorithm needs time to be expressed in terms of
     # decimal UTC hours of the day of the year.
-
-    time_utc = tools._pandas_to_utc(time)
+    unixtime = np.asarray(unixtime, dtype=np.float64)
+    days = np.floor(unixtime / 86400)
 
     # strip out the day of the year and calculate the decimal hour
-    DayOfYear = time_utc.dayofyear
-    DecHours = (time_utc.hour + time_utc.minute/60. + time_utc.second/3600. +
-                time_utc.microsecond/3600.e6)
-
-    # np.array needed for pandas > 0.20
-    UnivDate = np.array(DayOfYear)
-    UnivHr = np.array(DecHours)
+    UnivHr = (unixtime - days * 86400) / 3600.
+    date = days.astype('datetime64[D]')
+    year = date.astype('datetime64[Y]')
+    UnivDate = (date - year).astype(np.float64) + 1
 
-    Yr = np.array(time_utc.year) - 1900
+    Yr = year.astype(np.float64) + 70
     YrBegin = 365 * Yr + np.floor((Yr - 1) / 4.) - 0.5
 
     Ezero = YrBegin + UnivDate
@@ -779,19 +1497,19 @@ def ephemeris(time, latitude, longitude, pressure=101325.0, temperature=12.0):
     GMST0 = 360 * (GMST0 - np.floor(GMST0))
     GMSTi = np.mod(GMST0 + 360 * (1.0027379093 * UnivHr / 24.), 360)
 
-    # Local apparent sidereal time
-    LocAST = np.mod((360 + GMSTi - Longitude), 360)
-
     EpochDate = Ezero + UnivHr / 24.
     T1 = EpochDate / 36525.
+    # powers of T1 are reused below, and np.power is slow for arrays
+    T1sq = T1 * T1
+    T1cu = T1sq * T1
 
     ObliquityR = np.radians(
-        23.452294 - 0.0130125 * T1 - 1.64e-06 * T1 ** 2 + 5.03e-07 * T1 ** 3)
-    MlPerigee = 281.22083 + 4.70684e-05 * EpochDate + 0.000453 * T1 ** 2 + (
-        3e-06 * T1 ** 3)
+        23.452294 - 0.0130125 * T1 - 1.64e-06 * T1sq + 5.03e-07 * T1cu)
+    MlPerigee = 281.22083 + 4.70684e-05 * EpochDate + 0.000453 * T1sq + (
+        3e-06 * T1cu)
     MeanAnom = np.mod((358.47583 + 0.985600267 * EpochDate - 0.00015 *
-                       T1 ** 2 - 3e-06 * T1 ** 3), 360)
-    Eccen = 0.01675104 - 4.18e-05 * T1 - 1.26e-07 * T1 ** 2
+                       T1sq - 3e-06 * T1cu), 360)
+    Eccen = 0.01675104 - 4.18e-05 * T1 - 1.26e-07 * T1sq
     EccenAnom = MeanAnom
     E = 0
 
@@ -809,25 +1527,34 @@ def ephemeris(time, latitude, longitude, pressure=101325.0, temperature=12.0):
     RtAscen = np.degrees(np.arctan2(np.cos(ObliquityR)*np.sin(EcLonR),
                                     np.cos(EcLonR)))
 
-    HrAngle = LocAST - RtAscen
-    HrAngleR = np.radians(HrAngle)
-    HrAngle = HrAngle - (360 * (abs(HrAngle) > 180))
+    # everything above only depends on time and is calculated in double
+    # precision, the site dependent terms below use dtype
 
-    SunAz = np.degrees(np.arctan2(-np.sin(HrAngleR),
-                                  np.cos(LatR)*np.tan(DecR) -
-                                  np.sin(LatR)*np.cos(HrAngleR)))
+    # Local apparent sidereal time
+    LocAST = np.mod((360 + GMSTi - Longitude), 360)
+
+    HrAngle = (LocAST - RtAscen).astype(dtype)
+    HrAngleR = np.radians(HrAngle)
+    HrAngle = np.where(abs(HrAngle) > 180, HrAngle - 360, HrAngle)
+    DecR = DecR.astype(dtype)
+
+    # np.asarray keeps 0-d arrays for scalar inputs, so that the masked
+    # assignments below work
+    SunAz = np.asarray(np.degrees(np.arctan2(-np.sin(HrAngleR),
+                                             np.cos(LatR)*np.tan(DecR) -
+                                             np.sin(LatR)*np.cos(HrAngleR))))
     SunAz[SunAz < 0] += 360
 
-    SunEl = np.degrees(np.arcsin(
+    SunEl = np.asarray(np.degrees(np.arcsin(
         np.cos(LatR) * np.cos(DecR) * np.cos(HrAngleR) +
-        np.sin(LatR) * np.sin(DecR)))
+        np.sin(LatR) * np.sin(DecR))))
 
     SolarTime = (180 + HrAngle) / 15.
 
     # Calculate refraction correction
     Elevation = SunEl
     TanEl = np.tan(np.radians(Elevation))
-    Refract = np.zeros(len(time_utc))
+    Refract = np.zeros_like(SunEl)
 
     mask = (Elevation > 5) & (Elevation <= 85)
     Refract[mask] = (
@@ -845,24 +1572,19 @@ def ephemeris(time, latitude, longitude, pressure=101325.0, temperature=12.0):
     mask = (Elevation > -1) & (Elevation <= -0.575)
     Refract[mask] = -20.774 / TanEl[mask]
 
-    Refract *= (283/(273. + temperature)) * (pressure/101325.) / 3600.
+    Refract = Refract * np.asarray(
+        (283/(273. + temperature)) * (pressure/101325.) / 3600., dtype=dtype)
 
     ApparentSunEl = SunEl + Refract
 
-    # make output DataFrame
-    result = pd.DataFrame(
-        {
-            "apparent_elevation": ApparentSunEl,
-            "elevation": SunEl,
-            "azimuth": SunAz,
-            "apparent_zenith": 90 - ApparentSunEl,
-            "zenith": 90 - SunEl,
-            "solar_time": SolarTime,
-        },
-        index=time
-    )
-
-    return result
+    return {
+        "apparent_elevation": ApparentSunEl,
+        "elevation": SunEl,
+        "azimuth": SunAz,
+        "apparent_zenith": 90 - ApparentSunEl,
+        "zenith": 90 - SunEl,
+        "solar_time": SolarTime,
+    }
 
 
 def calc_time(lower_bound, upper_bound, latitude, longitude, attribute, value,
@@ -916,6 +1638,10 @@ def calc_time(lower_bound, upper_bound, latitude, longitude, attribute, value,
     AttributeError
         If the given attribute is not an attribute of a
         PyEphem.Sun object.
+
+    See also
+    --------
+    sun_elevation_crossing_spa
     """
     obs, sun = _ephem_setup(latitude, longitude, altitude,
                             pressure, temperature, horizon)
@@ -928,12 +1654,135 @@ def calc_time(lower_bound, upper_bound, latitude, longitude, attribute, value,
     lb = datetime_to_djd(lower_bound)
     ub = datetime_to_djd(upper_bound)
 
+    import scipy.optimize as so
+
     djd_root = so.brentq(compute_attr, lb, ub,
                          (value, attribute), xtol=xtol)
 
     return djd_to_datetime(djd_root)
 
 
+def sun_elevation_crossing_spa(times, latitude, longitude, elevation,
+                               altitude=0., pressure=101325.,
+                               temperature=12., delta_t=67.0,
+                               atmos_refract=None, apparent=True,
+                               how='numpy', numthreads=None, xtol=1e-3):
+    """
+    Calculate the times when the sun crosses a given elevation for many
+    sites and days at once using the NREL SPA algorithm.
+
+    For each site and day, the rising crossing is searched for between
+    12 hours before and the sun transit, and the setting crossing between
+    the sun transit and 12 hours after. All crossings are solved together
+    with a vectorized bracketed root finder (Chandrupatla's method), which
+    is much faster than solving each crossing with :py:func:`calc_time`.
+
+    Parameters
+    ----------
+    times : pandas.DatetimeIndex
+        Must be localized. The day of each timestamp in UTC is used.
+    latitude : float or array-like
+        Latitude of each site in degrees, positive north of equator,
+        negative to south
+    longitude : float or array-like
+        Longitude of each site in degrees, positive east of prime meridian,
+        negative to west
+    elevation : float or array-like
+        Solar elevation angle to find the crossings of, in degrees. An
+        array must have one value per site.
+    altitude : float or array-like, default 0
+        Altitude of each site in meters.
+    pressure : float or array-like, default 101325
+        Air pressure at each site in Pascals.
+    temperature : float or array-like, default 12
+        Air temperature at each site in degrees C.
+    delta_t : float or array, optional, default 67.0
+        Difference between terrestrial time and UT1.
+        If delta_t is None, uses spa.calculate_deltat
+        using times.year and times.month from pandas.DatetimeIndex.
+        For most simulations the default delta_t is sufficient.
+    atmos_refract : float, optional
+        The approximate atmospheric refraction (in degrees)
+        at sunrise and sunset. If None, 0.5667 is used.
+    apparent : bool, default True
+        If True, find crossings of the apparent (refraction corrected)
+        elevation, otherwise of the true elevation.
+    how : str, optional, default 'numpy'
+        Options are 'numpy' or 'numba'. If numba >= 0.17.0
+        is installed, how='numba' will compile the spa functions
+        to machine code and run them multithreaded.
+    numthreads : int, optional
+        Number of threads to use if how == 'numba'. If None (default),
+        numba's global thread count is used, see
+        :py:func:`numba.set_num_threads`.
+    xtol : float, default 1e-3
+        Tolerance of the crossing times in seconds.
+
+    Returns
+    -------
+    dict
+        Dictionary with keys 'rising' and 'setting'. Each value is a
+        ``numpy.datetime64[ns]`` array in UTC with shape (N, T), where N is
+        the number of sites and T is ``len(times)``. NaT indicates that the
+        sun does not cross ``elevation`` on that day.
+
+    References
+    ----------
+    .. [1] Reda, I., Andreas, A., 2003. Solar position algorithm for solar
+       radiation applications. Technical report: NREL/TP-560-34302. Golden,
+       USA, http://www.nlr.gov.
+
+    .. [2] T. R. Chandrupatla, "A new hybrid quadratic/bisection algorithm
+       for finding the zero of a nonlinear function without using
+       derivatives", Advances in Engineering Software, vol. 28, no. 3,
+       pp. 145-149, 1997. :doi:`10.1016/S0965-9978(96)00051-8`
+
+    See also
+    --------
+    calc_time
+    sun_rise_set_transit_spa_multisite
+    """
+    # times must be localized
+    if not times.tz:
+        raise ValueError('times must be localized')
+
+    times_utc = times.tz_convert('UTC')
+    unixtime = _datetime_to_unixtime(times_utc.normalize())
+
+    spa = _spa_python_import(how)
+
+    if delta_t is None:
+        delta_t = spa.calculate_deltat_unixtime(unixtime)
+
+    transit, _, _ = spa.transit_sunrise_sunset_multisite(
+        unixtime, latitude, longitude, delta_t, numthreads)
+
+    # site parameters as (N, 1) columns, per day values as (1, T) rows
+    latitude, longitude, elevation, altitude, pressure, temperature = [
+        np.atleast_1d(a)[:, np.newaxis] for a in np.broadcast_arrays(
+            latitude, longitude, elevation, altitude, pressure, temperature)]
+    delta_t = np.atleast_1d(delta_t)[np.newaxis, :]
+    atmos_refract = atmos_refract or 0.5667
+    row = 2 if apparent else 3
+
+    def elevation_difference(t, lat, lon, alt, press, temp, dt, target):
+        return spa.solar_position_elementwise(
+            t, lat, lon, alt, press, temp, dt, atmos_refract,
+            numthreads)[row] - target
+
+    args = (latitude, longitude, altitude, pressure / 100, temperature,
+            delta_t, elevation)
+    half_day = 43200.
+    rising, _ = tools._chandrupatla(
+        elevation_difference, transit - half_day, transit, args, xtol=xtol)
+    setting, _ = tools._chandrupatla(
+        elevation_difference, transit, transit + half_day, args,
+        xtol=xtol)
+
+    return {'rising': _unixtime_to_datetime64(rising),
+            'setting': _unixtime_to_datetime64(setting)}
+
+
 def pyephem_earthsun_distance(time):
     """
     Calculates the distance from the earth to the sun using pyephem.
@@ -962,7 +1811,7 @@ def pyephem_earthsun_distance(time):
     return pd.Series(earthsun, index=time)
 
 
-def nrel_earthsun_distance(time, how='numpy', delta_t=67.0, numthreads=4):
+def nrel_earthsun_distance(time, how='numpy', delta_t=67.0, numthreads=None):
     """
     Calculates the distance from the earth to the sun using the
     NREL SPA algorithm.
@@ -985,8 +1834,10 @@ def nrel_earthsun_distance(time, how='numpy', delta_t=67.0, numthreads=4):
         using time.year and time.month from pandas.DatetimeIndex.
         For most simulations the default delta_t is sufficient.
 
-    numthreads : int, optional, default 4
-        Number of threads to use if how == 'numba'.
+    numthreads : int, optional
+        Number of threads to use if how == 'numba'. If None (default),
+        numba's global thread count is used, see
+        :py:func:`numba.set_num_threads`.
 
     Returns
     -------
@@ -1011,8 +1862,7 @@ def nrel_earthsun_distance(time, how='numpy', delta_t=67.0, numthreads=4):
     spa = _spa_python_import(how)
 
     if delta_t is None:
-        time_utc = tools._pandas_to_utc(time)
-        delta_t = spa.calculate_deltat(time_utc.year, time_utc.month)
+        delta_t = spa.calculate_deltat_unixtime(unixtime)
 
     dist = spa.earthsun_distance(unixtime, delta_t, numthreads)
 
@@ -1397,7 +2247,7 @@ def hour_angle(times, longitude, equation_of_time):
         raise ValueError('times must be localized')
 
     # hours - timezone = (times - normalized_times) - (naive_times - times)
-    tzs = np.array([ts.utcoffset().total_seconds() for ts in times]) / 3600
+    tzs = _utc_offset_hours(times)
 
     hrs_minus_tzs = _times_to_hours_after_local_midnight(times) - tzs
 
@@ -1411,11 +2261,18 @@ def _hour_angle_to_hours(times, hourangle, longitude, equation_of_time):
     if not times.tz:
         raise ValueError('times must be localized')
 
-    tzs = np.array([ts.utcoffset().total_seconds() for ts in times]) / 3600
+    tzs = _utc_offset_hours(times)
     hours = (hourangle - longitude - equation_of_time / 4.) / 15. + 12. + tzs
     return np.asarray(hours)
 
 
+def _utc_offset_hours(times):
+    """offset of localized times from UTC in hours as a numpy array"""
+    utc = times.tz_convert('UTC').tz_localize(None)
+    offset = times.tz_localize(None) - utc
+    return np.asarray(offset / pd.Timedelta('1h'))
+
+
 def _local_times_from_hours_since_midnight(times, hours):
     """
     converts hours since midnight from an array of floats to localized times
@@ -1515,3 +2372,74 @@ def sun_rise_set_transit_geometric(times, latitude, longitude, declination,
     sunset = _local_times_from_hours_since_midnight(times, sunset_hour)
     transit = _local_times_from_hours_since_midnight(times, transit_hour)
     return sunrise, sunset, transit
+
+
+def sun_rise_set_transit_geometric_multisite(times, latitude, longitude,
+                                             declination, equation_of_time):
+    """
+    Geometric calculation of solar sunrise, sunset, and transit for many
+    sites at once.
+
+    This is the batched equivalent of
+    :py:func:`sun_rise_set_transit_geometric`: all sites and days are
+    calculated in a single vectorized pass.
+
+    .. warning:: The geometric calculation assumes a circular earth orbit with
+        the sun as a point source at its center, and neglects the effect of
+        atmospheric refraction on zenith. The error depends on location and
+        time of year but is of order 10 minutes.
+
+    Parameters
+    ----------
+    times : pandas.DatetimeIndex
+        Corresponding timestamps, must be localized. Sunrise, sunset and
+        transit are calculated for the local day of each timestamp.
+    latitude : float or array-like
+        Latitude of each site in degrees, positive north of equator,
+        negative to south
+    longitude : float or array-like
+        Longitude of each site in degrees, positive east of prime meridian,
+        negative to west
+    declination : numeric
+        declination angle in radians at ``times``
+    equation_of_time : numeric
+        difference in time between solar time and mean solar time in minutes
+
+    Returns
+    -------
+    sunrise : numpy.ndarray
+        sunrise times as ``numpy.datetime64[ns]`` in UTC, shape (N, T)
+    sunset : numpy.ndarray
+        sunset times as ``numpy.datetime64[ns]`` in UTC, shape (N, T)
+    transit : numpy.ndarray
+        sun transit times as ``numpy.datetime64[ns]`` in UTC, shape (N, T)
+
+    See also
+    --------
+    sun_rise_set_transit_geometric
+    """
+
+    # times must be localized
+    if not times.tz:
+        raise ValueError('times must be localized')
+
+    latitude, longitude = np.broadcast_arrays(
+        *np.atleast_1d(latitude, longitude))
+    latitude = latitude[:, np.newaxis]
+    longitude = longitude[:, np.newaxis]
+    declination = np.asarray(declination)
+    equation_of_time = np.asarray(equation_of_time)
+
+    with np.errstate(invalid='ignore'):
+        sunset_angle = np.degrees(np.arccos(
+            -np.tan(declination) * np.tan(np.radians(latitude))))
+    # local midnight in UTC plus the hours until each event, where the
+    # hours are measured in local time
+    transit_hour = _hour_angle_to_hours(times, 0, longitude, equation_of_time)
+    midnight = _datetime_to_unixtime(times.normalize())
+    sunrise = _unixtime_to_datetime64(
+        midnight + (transit_hour - sunset_angle / 15.) * 3600)
+    sunset = _unixtime_to_datetime64(
+        midnight + (transit_hour + sunset_angle / 15.) * 3600)
+    transit = _unixtime_to_datetime64(midnight + transit_hour * 3600)
+    return sunrise, sunset, transit
@@ -6,8 +6,8 @@ numpy arrays or compiling the code to machine language with numba.
 # Contributors:
 # Created by Tony Lorenzo (@alorenzo175), Univ. of Arizona, 2015
 
+import contextlib
 import os
-import threading
 import warnings
 
 import numpy as np
@@ -21,20 +21,45 @@ def nocompile(*args, **kwargs):
 
 if os.getenv('PVLIB_USE_NUMBA', '0') != '0':
     try:
-        from numba import jit
+        import numba
+        from numba import jit, prange
     except ImportError:
         warnings.warn('Could not import numba, falling back to numpy ' +
                       'calculation')
         jcompile = nocompile
+        prange = range
         USE_NUMBA = False
     else:
-        jcompile = jit
+        def jcompile(*args, **kwargs):
+            # cache the compiled functions on disk so that worker processes
+            # do not pay the compilation cost on every import
+            kwargs.setdefault('cache', True)
+            return jit(*args, **kwargs)
         USE_NUMBA = True
 else:
     jcompile = nocompile
+    prange = range
     USE_NUMBA = False
 
 
+@contextlib.contextmanager
+def _numba_threads(numthreads):
+    """Temporarily set the number of threads used by the numba parallel
+    loops. If numthreads is None, numba's global setting is used, which can
+    be set with numba.set_num_threads or the NUMBA_NUM_THREADS environment
+    variable."""
+    if numthreads is None or not USE_NUMBA:
+        yield
+        return
+    previous = numba.get_num_threads()
+    numba.set_num_threads(
+        max(1, min(int(numthreads), numba.config.NUMBA_NUM_THREADS)))
+    try:
+        yield
+    finally:
+        numba.set_num_threads(previous)
+
+
 # heliocentric longitude coefficients
 L0 = np.array([
     [175347046.0, 0.0, 0.0],
@@ -461,6 +486,7 @@ def sum_mult_cos_add_mult(arr, x):
         s += arr[row, 0] * np.cos(arr[row, 1] + arr[row, 2] * x)
     return s
 
+
 @jcompile('float64(float64)', nopython=True)
 def heliocentric_longitude(jme):
     l0 = sum_mult_cos_add_mult(L0, jme)
@@ -475,6 +501,7 @@ def heliocentric_longitude(jme):
     l = np.rad2deg(l_rad)
     return l % 360
 
+
 @jcompile('float64(float64)', nopython=True)
 def heliocentric_latitude(jme):
     b0 = sum_mult_cos_add_mult(B0, jme)
@@ -838,9 +865,10 @@ def equation_of_time(sun_mean_longitude, geocentric_sun_right_ascension,
 
 
 @jcompile('void(float64[:], float64[:], float64[:], float64[:,:])',
-          nopython=True, nogil=True)
+          nopython=True, nogil=True, parallel=True)
 def solar_position_loop(unixtime, delta_t, loc_args, out):
-    """Loop through the time array and calculate the solar position"""
+    """Loop through the time array in parallel and calculate the solar
+    position"""
     lat = loc_args[0]
     lon = loc_args[1]
     elev = loc_args[2]
@@ -850,7 +878,7 @@ def solar_position_loop(unixtime, delta_t, loc_args, out):
     sst = loc_args[6]
     esd = loc_args[7]
 
-    for i in range(unixtime.shape[0]):
+    for i in prange(unixtime.shape[0]):
         utime = unixtime[i]
         dT = delta_t[i]
         jd = julian_day(utime)
@@ -916,15 +944,121 @@ def solar_position_loop(unixtime, delta_t, loc_args, out):
         out[5, i] = eot
 
 
+@jcompile('void(float64, float64, float64[:])', nopython=True)
+def observer_independent_terms(unixtime, delta_t, out):
+    """Calculate the solar position terms that only depend on time.
+
+    ``out`` receives the apparent sidereal time, geocentric sun right
+    ascension, geocentric sun declination, earth radius vector and the
+    equation of time, in that order. Works on scalars (numba) or on arrays
+    (numpy), in which case ``out`` has shape (5, len(unixtime))."""
+    jd = julian_day(unixtime)
+    jde = julian_ephemeris_day(jd, delta_t)
+    jc = julian_century(jd)
+    jce = julian_ephemeris_century(jde)
+    jme = julian_ephemeris_millennium(jce)
+    R = heliocentric_radius_vector(jme)
+    L = heliocentric_longitude(jme)
+    B = heliocentric_latitude(jme)
+    Theta = geocentric_longitude(L)
+    beta = geocentric_latitude(B)
+    x0 = mean_elongation(jce)
+    x1 = mean_anomaly_sun(jce)
+    x2 = mean_anomaly_moon(jce)
+    x3 = moon_argument_latitude(jce)
+    x4 = moon_ascending_longitude(jce)
+    # the last two rows of out are used as scratch space for the nutation
+    # terms so that the same code works for scalars and arrays
+    longitude_obliquity_nutation(jce, x0, x1, x2, x3, x4, out[3:5])
+    delta_psi = out[3] * 1.0
+    delta_epsilon = out[4] * 1.0
+    epsilon0 = mean_ecliptic_obliquity(jme)
+    epsilon = true_ecliptic_obliquity(epsilon0, delta_epsilon)
+    delta_tau = aberration_correction(R)
+    lamd = apparent_sun_longitude(Theta, delta_psi, delta_tau)
+    v0 = mean_sidereal_time(jd, jc)
+    v = apparent_sidereal_time(v0, delta_psi, epsilon)
+    alpha = geocentric_sun_right_ascension(lamd, epsilon, beta)
+    delta = geocentric_sun_declination(lamd, epsilon, beta)
+    m = sun_mean_longitude(jme)
+    eot = equation_of_time(m, alpha, delta_psi, epsilon)
+    out[0] = v
+    out[1] = alpha
+    out[2] = delta
+    out[3] = R
+    out[4] = eot
+
+
+@jcompile('void(float64, float64, float64, float64, float64, float64, '
+          'float64, float64, float64, float64, float64, float64[:])',
+          nopython=True)
+def observer_dependent_terms(v, alpha, delta, R, eot, lat, lon, elev,
+                             pressure, temp, atmos_refract, out):
+    """Calculate the topocentric solar position from the observer
+    independent terms.
+
+    ``out`` receives the apparent zenith, zenith, apparent elevation,
+    elevation, azimuth and equation of time, in that order. Works on
+    scalars (numba) or on broadcastable arrays (numpy)."""
+    H = local_hour_angle(v, lon, alpha)
+    xi = equatorial_horizontal_parallax(R)
+    u = uterm(lat)
+    x = xterm(u, lat, elev)
+    y = yterm(u, lat, elev)
+    delta_alpha = parallax_sun_right_ascension(x, xi, H, delta)
+    delta_prime = topocentric_sun_declination(delta, x, y, xi, delta_alpha, H)
+    H_prime = topocentric_local_hour_angle(H, delta_alpha)
+    e0 = topocentric_elevation_angle_without_atmosphere(lat, delta_prime,
+                                                        H_prime)
+    delta_e = atmospheric_refraction_correction(pressure, temp, e0,
+                                                atmos_refract)
+    e = topocentric_elevation_angle(e0, delta_e)
+    theta = topocentric_zenith_angle(e)
+    theta0 = topocentric_zenith_angle(e0)
+    gamma = topocentric_astronomers_azimuth(H_prime, delta_prime, lat)
+    phi = topocentric_azimuth_angle(gamma)
+    out[0] = theta
+    out[1] = theta0
+    out[2] = e
+    out[3] = e0
+    out[4] = phi
+    out[5] = eot
+
+
+@jcompile('void(float64[:], float64[:], float64[:,:])',
+          nopython=True, nogil=True, parallel=True)
+def observer_independent_loop(unixtime, delta_t, out):
+    """Loop through the time array in parallel and calculate the observer
+    independent terms"""
+    for i in prange(unixtime.shape[0]):
+        observer_independent_terms(unixtime[i], delta_t[i], out[:, i])
+
+
+@jcompile('void(float64[:,:], float64[:,:], float64[:,:,:])',
+          nopython=True, nogil=True, parallel=True)
+def multisite_loop(time_terms, site_args, out):
+    """Loop through the sites in parallel and times and calculate the solar
+    position"""
+    for j in prange(site_args.shape[0]):
+        for i in range(time_terms.shape[1]):
+            observer_dependent_terms(
+                time_terms[0, i], time_terms[1, i], time_terms[2, i],
+                time_terms[3, i], time_terms[4, i], site_args[j, 0],
+                site_args[j, 1], site_args[j, 2], site_args[j, 3],
+                site_args[j, 4], site_args[j, 5], out[:, j, i])
+
+
 def solar_position_numba(unixtime, lat, lon, elev, pressure, temp, delta_t,
-                         atmos_refract, numthreads, sst=False, esd=False):
+                         atmos_refract, numthreads=None, sst=False, esd=False):
     """Calculate the solar position using the numba compiled functions
-    and multiple threads. Very slow if functions are not numba compiled.
+    and a parallel loop. Very slow if functions are not numba compiled.
     """
-    # these args are the same for each thread
     loc_args = np.array([lat, lon, elev, pressure, temp,
                          atmos_refract, sst, esd], dtype=np.float64)
 
+    if unixtime.dtype != np.float64:
+        unixtime = unixtime.astype(np.float64)
+
     # turn delta_t into an array if it isn't already
     delta_t = np.full_like(unixtime, delta_t, dtype=np.float64)
 
@@ -938,36 +1072,13 @@ def solar_position_numba(unixtime, lat, lon, elev, pressure, temp, delta_t,
         dims = 6
     result = np.empty((dims, ulength), dtype=np.float64)
 
-    if unixtime.dtype != np.float64:
-        unixtime = unixtime.astype(np.float64)
-
-    if ulength < numthreads:
-        numthreads = ulength
-
-    if numthreads <= 1:
+    with _numba_threads(numthreads):
         solar_position_loop(unixtime, delta_t, loc_args, result)
-        return result
-
-    # split the input and output arrays into numthreads chunks
-    split0 = np.array_split(unixtime, numthreads)
-    split1 = np.array_split(delta_t, numthreads)
-    split2 = np.array_split(result, numthreads, axis=1)
-    chunks = [
-        [a0, a1, loc_args, a2]
-        for a0, a1, a2 in zip(split0, split1, split2)
-    ]
-    # Spawn one thread per chunk
-    threads = [threading.Thread(target=solar_position_loop, args=chunk)
-               for chunk in chunks]
-    for thread in threads:
-        thread.start()
-    for thread in threads:
-        thread.join()
     return result
 
 
 def solar_position_numpy(unixtime, lat, lon, elev, pressure, temp, delta_t,
-                         atmos_refract, numthreads, sst=False, esd=False):
+                         atmos_refract, numthreads=None, sst=False, esd=False):
     """Calculate the solar position assuming unixtime is a numpy array. Note
     this function will not work if the solar position functions were
     compiled with numba.
@@ -1027,7 +1138,7 @@ def solar_position_numpy(unixtime, lat, lon, elev, pressure, temp, delta_t,
 
 
 def solar_position(unixtime, lat, lon, elev, pressure, temp, delta_t,
-                   atmos_refract, numthreads=8, sst=False, esd=False):
+                   atmos_refract, numthreads=None, sst=False, esd=False):
 
     """
     Calculate the solar position using the
@@ -1060,9 +1171,10 @@ def solar_position(unixtime, lat, lon, elev, pressure, temp, delta_t,
     atmos_refract : float
         The approximate atmospheric refraction (in degrees)
         at sunrise and sunset.
-    numthreads: int, optional, default 8
+    numthreads : int, optional
         Number of threads to use for computation if numba>=0.17
-        is installed.
+        is installed. If None (default), numba's global thread count is
+        used, see :py:func:`numba.set_num_threads`.
     sst : bool, default False
         If True, return only data needed for sunrise, sunset, and transit
         calculations.
@@ -1105,7 +1217,327 @@ def solar_position(unixtime, lat, lon, elev, pressure, temp, delta_t,
     return result
 
 
-def transit_sunrise_sunset(dates, lat, lon, delta_t, numthreads):
+@jcompile('void(float64[:], float64[:], float64[:,:], float64[:,:])',
+          nopython=True, nogil=True, parallel=True)
+def elementwise_loop(unixtime, delta_t, site_args, out):
+    """Loop through the times in parallel and calculate the solar position
+    with the site parameters that go with each time"""
+    for i in prange(unixtime.shape[0]):
+        terms = np.empty(5)
+        observer_independent_terms(unixtime[i], delta_t[i], terms)
+        observer_dependent_terms(
+            terms[0], terms[1], terms[2], terms[3], terms[4],
+            site_args[i, 0], site_args[i, 1], site_args[i, 2],
+            site_args[i, 3], site_args[i, 4], site_args[i, 5], out[:, i])
+
+
+def observer_independent(unixtime, delta_t, numthreads=None):
+    """
+    Calculate the solar position terms that do not depend on the observer
+    location using the NREL SPA algorithm described in [1].
+
+    These terms are the expensive part of the SPA and can be calculated
+    once and reused for any number of sites with
+    :py:func:`observer_dependent`.
+
+    Parameters
+    ----------
+    unixtime : numpy array
+        Array of unix/epoch timestamps to calculate solar position for.
+        Unixtime is the number of seconds since Jan. 1, 1970 00:00:00 UTC.
+    delta_t : float or array
+        Difference between terrestrial time and UT1.
+    numthreads : int, optional
+        Number of threads to use for computation if numba>=0.17
+        is installed. If None (default), numba's global thread count is
+        used, see :py:func:`numba.set_num_threads`.
+
+    Returns
+    -------
+    Numpy Array with shape (5, len(unixtime)) and elements:
+        apparent sidereal time,
+        geocentric sun right ascension,
+        geocentric sun declination,
+        earth radius vector,
+        equation_of_time
+
+    References
+    ----------
+    [1] I. Reda and A. Andreas, Solar position algorithm for solar radiation
+    applications. Solar Energy, vol. 76, no. 5, pp. 577-589, 2004.
+    """
+    unixtime = np.asarray(unixtime, dtype=np.float64)
+    result = np.empty((5, unixtime.shape[0]), dtype=np.float64)
+    if not USE_NUMBA:
+        observer_independent_terms(unixtime, delta_t, result)
+        return result
+
+    delta_t = np.full_like(unixtime, delta_t, dtype=np.float64)
+    with _numba_threads(numthreads):
+        observer_independent_loop(unixtime, delta_t, result)
+    return result
+
+
+def observer_independent_interp(unixtime, delta_t, step=3600.,
+                                numthreads=None):
+    """
+    Approximate the observer independent terms of the SPA by evaluating
+    them on a coarse time grid and linearly interpolating to ``unixtime``.
+
+    The observer independent terms vary slowly (apart from the sidereal
+    time, which is interpolated after removing its mean daily rate), so
+    this is much faster than :py:func:`observer_independent` for finely
+    sampled times. See :py:func:`pvlib.solarposition.spa_python_interp`
+    for the resulting accuracy. If the grid would have more points than
+    ``unixtime``, e.g. for a few times years apart, the terms are
+    calculated exactly with :py:func:`observer_independent` instead.
+
+    Parameters
+    ----------
+    unixtime : numpy array
+        Array of unix/epoch timestamps to calculate solar position for.
+        Unixtime is the number of seconds since Jan. 1, 1970 00:00:00 UTC.
+    delta_t : float or array
+        Difference between terrestrial time and UT1. An array must have
+        the same length as ``unixtime``.
+    step : float, default 3600
+        Spacing of the coarse time grid in seconds.
+    numthreads : int, optional
+        Number of threads to use for computation if numba>=0.17
+        is installed. If None (default), numba's global thread count is
+        used, see :py:func:`numba.set_num_threads`.
+
+    Returns
+    -------
+    Numpy Array with shape (5, len(unixtime)), see
+    :py:func:`observer_independent`.
+    """
+    unixtime = np.asarray(unixtime, dtype=np.float64)
+    if unixtime.shape[0] == 0:
+        return np.empty((5, 0), dtype=np.float64)
+    start = np.floor(np.min(unixtime) / step) * step
+    stop = np.ceil(np.max(unixtime) / step) * step
+    if (stop - start) / step + 1 > unixtime.shape[0]:
+        # sparse times, interpolation would evaluate more points
+        return observer_independent(unixtime, delta_t, numthreads)
+    coarse = np.arange(start, stop + step, step)
+    if np.ndim(delta_t) > 0:
+        # np.interp needs increasing sample points
+        order = np.argsort(unixtime, kind='stable')
+        delta_t = np.interp(coarse, unixtime[order],
+                            np.asarray(delta_t, dtype=np.float64)[order])
+    terms = observer_independent(coarse, delta_t, numthreads)
+
+    # remove the mean sidereal rate so that the apparent sidereal time can
+    # be unwrapped and interpolated like the other terms
+    sidereal_rate = 360.98564736629 / 86400
+    terms[0] = np.unwrap(terms[0] - sidereal_rate * (coarse - start),
+                         period=360)
+    terms[1] = np.unwrap(terms[1], period=360)
+    result = np.empty((5, unixtime.shape[0]), dtype=np.float64)
+    for row in range(5):
+        result[row] = np.interp(unixtime, coarse, terms[row])
+    result[0] = (result[0] + sidereal_rate * (unixtime - start)) % 360
+    result[1] = result[1] % 360
+    return result
+
+
+def observer_dependent(time_terms, lat, lon, elev, pressure, temp,
+                       atmos_refract, numthreads=None):
+    """
+    Calculate the topocentric solar position for one or more sites from
+    the observer independent terms returned by :py:func:`observer_independent`.
+
+    Parameters
+    ----------
+    time_terms : numpy array
+        Array with shape (5, T) as returned by :py:func:`observer_independent`.
+    lat : float or array
+        Latitude of each site
+    lon : float or array
+        Longitude of each site
+    elev : float or array
+        Elevation of each site in meters
+    pressure : float or array
+        avg. yearly pressure at each site in millibars;
+        used for atmospheric correction
+    temp : float or array
+        avg. yearly temperature at each site in
+        degrees C; used for atmospheric correction
+    atmos_refract : float or array
+        The approximate atmospheric refraction (in degrees)
+        at sunrise and sunset.
+    numthreads : int, optional
+        Number of threads to use for computation if numba>=0.17
+        is installed. If None (default), numba's global thread count is
+        used, see :py:func:`numba.set_num_threads`.
+
+    Returns
+    -------
+    Numpy Array with shape (6, N, T), where N is the number of sites after
+    broadcasting the site parameters, and elements:
+        apparent zenith,
+        zenith,
+        apparent_elevation,
+        elevation,
+        azimuth,
+        equation_of_time
+    """
+    # (6, N) array of site parameters
+    site_args = np.array(np.broadcast_arrays(
+        *np.atleast_1d(lat, lon, elev, pressure, temp, atmos_refract)),
+        dtype=np.float64)
+    if site_args.ndim != 2:
+        raise ValueError('site parameters must be scalars or 1-D arrays')
+    nsites = site_args.shape[1]
+    ntimes = time_terms.shape[1]
+    result = np.empty((6, nsites, ntimes), dtype=np.float64)
+
+    if not USE_NUMBA:
+        observer_dependent_terms(
+            time_terms[0], time_terms[1], time_terms[2], time_terms[3],
+            time_terms[4], *site_args[:, :, np.newaxis], result)
+        return result
+
+    time_terms = np.ascontiguousarray(time_terms, dtype=np.float64)
+    site_args = np.ascontiguousarray(site_args.T)
+    with _numba_threads(numthreads):
+        multisite_loop(time_terms, site_args, result)
+    return result
+
+
+def solar_position_multisite(unixtime, lat, lon, elev, pressure, temp,
+                             delta_t, atmos_refract, numthreads=None):
+    """
+    Calculate the solar position for many sites at once using the
+    NREL SPA algorithm described in [1].
+
+    The terms that only depend on time (heliocentric position, nutation,
+    obliquity and sidereal time) are calculated once per timestamp and
+    broadcast across all sites.
+
+    Parameters
+    ----------
+    unixtime : numpy array
+        Array of unix/epoch timestamps to calculate solar position for.
+        Unixtime is the number of seconds since Jan. 1, 1970 00:00:00 UTC.
+    lat : float or array
+        Latitude of each site
+    lon : float or array
+        Longitude of each site
+    elev : float or array
+        Elevation of each site in meters
+    pressure : float or array
+        avg. yearly pressure at each site in millibars;
+        used for atmospheric correction
+    temp : float or array
+        avg. yearly temperature at each site in
+        degrees C; used for atmospheric correction
+    delta_t : float or array
+        Difference between terrestrial time and UT1.
+    atmos_refract : float or array
+        The approximate atmospheric refraction (in degrees)
+        at sunrise and sunset.
+    numthreads : int, optional
+        Number of threads to use for computation if numba>=0.17
+        is installed. If None (default), numba's global thread count is
+        used, see :py:func:`numba.set_num_threads`.
+
+    Returns
+    -------
+    Numpy Array with shape (6, N, T) and elements:
+        apparent zenith,
+        zenith,
+        apparent_elevation,
+        elevation,
+        azimuth,
+        equation_of_time
+
+    References
+    ----------
+    [1] I. Reda and A. Andreas, Solar position algorithm for solar radiation
+    applications. Solar Energy, vol. 76, no. 5, pp. 577-589, 2004.
+
+    [2] I. Reda and A. Andreas, Corrigendum to Solar position algorithm for
+    solar radiation applications. Solar Energy, vol. 81, no. 6, p. 838, 2007.
+    """
+    time_terms = observer_independent(unixtime, delta_t, numthreads)
+    return observer_dependent(time_terms, lat, lon, elev, pressure, temp,
+                              atmos_refract, numthreads)
+
+
+def solar_position_elementwise(unixtime, lat, lon, elev, pressure, temp,
+                               delta_t, atmos_refract, numthreads=None):
+    """
+    Calculate the solar position for pairs of times and sites using the
+    NREL SPA algorithm described in [1].
+
+    Unlike :py:func:`solar_position_multisite`, every timestamp is paired
+    with its own site parameters, which is useful when each site is
+    evaluated at different times, e.g. in a root finder.
+
+    Parameters
+    ----------
+    unixtime : numpy array
+        Array of unix/epoch timestamps to calculate solar position for.
+        Unixtime is the number of seconds since Jan. 1, 1970 00:00:00 UTC.
+    lat : float or array
+        Latitude for each timestamp
+    lon : float or array
+        Longitude for each timestamp
+    elev : float or array
+        Elevation for each timestamp in meters
+    pressure : float or array
+        avg. yearly pressure in millibars;
+        used for atmospheric correction
+    temp : float or array
+        avg. yearly temperature in degrees C;
+        used for atmospheric correction
+    delta_t : float or array
+        Difference between terrestrial time and UT1.
+    atmos_refract : float or array
+        The approximate atmospheric refraction (in degrees)
+        at sunrise and sunset.
+    numthreads : int, optional
+        Number of threads to use for computation if numba>=0.17
+        is installed. If None (default), numba's global thread count is
+        used, see :py:func:`numba.set_num_threads`.
+
+    Returns
+    -------
+    Numpy Array with shape (6,) + S, where S is the broadcast shape of
+    the inputs, and elements:
+        apparent zenith,
+        zenith,
+        apparent_elevation,
+        elevation,
+        azimuth,
+        equation_of_time
+
+    References
+    ----------
+    [1] I. Reda and A. Andreas, Solar position algorithm for solar radiation
+    applications. Solar Energy, vol. 76, no. 5, pp. 577-589, 2004.
+    """
+    args = np.broadcast_arrays(unixtime, delta_t, lat, lon, elev, pressure,
+                               temp, atmos_refract)
+    shape = args[0].shape
+    unixtime, delta_t, *site_args = [
+        np.ascontiguousarray(a, dtype=np.float64).ravel() for a in args]
+    result = np.empty((6, unixtime.shape[0]), dtype=np.float64)
+
+    if not USE_NUMBA:
+        time_terms = np.empty((5, unixtime.shape[0]), dtype=np.float64)
+        observer_independent_terms(unixtime, delta_t, time_terms)
+        observer_dependent_terms(*time_terms, *site_args, result)
+    else:
+        site_args = np.ascontiguousarray(np.array(site_args).T)
+        with _numba_threads(numthreads):
+            elementwise_loop(unixtime, delta_t, site_args, result)
+    return result.reshape((6,) + shape)
+
+
+def transit_sunrise_sunset(dates, lat, lon, delta_t, numthreads=None):
     """
     Calculate the sun transit, sunrise, and sunset
     for a set of dates at a given location.
@@ -1122,8 +1554,9 @@ def transit_sunrise_sunset(dates, lat, lon, delta_t, numthreads):
         Longitude of location
     delta_t : float or array
         Difference between terrestrial time and UT. USNO has tables.
-    numthreads : int
-        Number to threads to use for calculation (if using numba)
+    numthreads : int, optional
+        Number to threads to use for calculation (if using numba).
+        If None (default), numba's global thread count is used.
 
     Returns
     -------
@@ -1157,7 +1590,8 @@ def transit_sunrise_sunset(dates, lat, lon, delta_t, numthreads):
     cos_arg[abs(cos_arg) > 1] = np.nan
     H0 = np.degrees(np.arccos(cos_arg)) % 180
 
-    m = np.empty((3, len(utday)))
+    # lat and lon may have an extra leading axis for multiple sites
+    m = np.empty((3,) + np.broadcast(m0, H0).shape)
     m[0] = m0 % 1
     m[1] = (m[0] - H0 / 360)
     m[2] = (m[0] + H0 / 360)
@@ -1211,7 +1645,45 @@ def transit_sunrise_sunset(dates, lat, lon, delta_t, numthreads):
     return transit, sunrise, sunset
 
 
-def earthsun_distance(unixtime, delta_t, numthreads):
+def transit_sunrise_sunset_multisite(dates, lat, lon, delta_t,
+                                     numthreads=None):
+    """
+    Calculate the sun transit, sunrise, and sunset
+    for a set of dates at many locations at once.
+
+    The solar position terms only depend on the dates and are calculated
+    once for all sites.
+
+    Parameters
+    ----------
+    dates : array
+        Numpy array of ints/floats corresponding to the Unix time
+        for the dates of interest, must be midnight UTC (00:00+00:00)
+        on the day of interest.
+    lat : float or array
+        Latitude of each location
+    lon : float or array
+        Longitude of each location
+    delta_t : float or array
+        Difference between terrestrial time and UT. USNO has tables.
+    numthreads : int, optional
+        Number to threads to use for calculation (if using numba).
+        If None (default), numba's global thread count is used.
+
+    Returns
+    -------
+    tuple : (transit, sunrise, sunset) as Unix time arrays with shape
+    (N, len(dates)), where N is the number of locations.
+    """
+    lat, lon = np.broadcast_arrays(*np.atleast_1d(lat, lon))
+    if lat.ndim != 1:
+        raise ValueError('lat and lon must be scalars or 1-D arrays')
+    return transit_sunrise_sunset(np.asarray(dates, dtype=np.float64),
+                                  lat[:, np.newaxis], lon[:, np.newaxis],
+                                  delta_t, numthreads)
+
+
+def earthsun_distance(unixtime, delta_t, numthreads=None):
     """
     Calculates the distance from the earth to the sun using the
     NREL SPA algorithm described in [1].
@@ -1224,8 +1696,9 @@ def earthsun_distance(unixtime, delta_t, numthreads):
         A pandas.DatetimeIndex is easily converted using .view(np.int64)/10**9
     delta_t : float or array
         Difference between terrestrial time and UT. USNO has tables.
-    numthreads : int
-        Number to threads to use for calculation (if using numba)
+    numthreads : int, optional
+        Number to threads to use for calculation (if using numba).
+        If None (default), numba's global thread count is used.
 
     Returns
     -------
@@ -1250,8 +1723,37 @@ def calculate_deltat(year, month):
     and Universal Time (UT).
 
     Equations taken from http://eclipse.gsfc.nasa.gov/SEcat5/deltatpoly.html
+
+    Integer years from 1800 to 2199 are looked up in a precomputed monthly
+    table of the same equations, see :py:func:`calculate_deltat_unixtime`.
     """
+    table_index = _deltat_table_index(year, month)
+    if table_index is not None:
+        deltat = DELTAT_TABLE[1][table_index]
+        return deltat.item() if np.ndim(deltat) == 0 else deltat
+    return _calculate_deltat_polynomial(year, month)
+
 
+def _deltat_table_index(year, month):
+    # index of year and month in DELTAT_TABLE, or None if any of them is
+    # not an integer in the range of the table
+    try:
+        year = np.asarray(year)
+        month = np.asarray(month)
+    except (TypeError, ValueError):
+        return None
+    if not (np.issubdtype(year.dtype, np.integer)
+            and np.issubdtype(month.dtype, np.integer)):
+        return None
+    index = (year - _DELTAT_TABLE_START_YEAR) * 12 + (month - 1)
+    if np.any((index < 0) | (index >= len(DELTAT_TABLE[1]))
+              | (month < 1) | (month > 12)):
+        return None
+    return index
+
+
+def _calculate_deltat_polynomial(year, month):
+    """Evaluate the delta T polynomials for year and month."""
     plw = 'Deltat is unknown for years before -1999 and after 3000. ' \
           'Delta values will be calculated, but the calculations ' \
           'are not intended to be used for these years.'
@@ -1371,3 +1873,69 @@ def calculate_deltat(year, month):
         else deltat
 
     return deltat
+
+
+@jcompile('float64[:](float64[:], float64[:], float64[:])', nopython=True)
+def deltat_lookup(unixtime, table_time, table_deltat):
+    """Look up delta T for each unixtime in a table with the delta T
+    values ``table_deltat`` that start at the sorted times ``table_time``.
+    Times before the table get the first value and times after the table
+    the last value. Works with numpy and inside numba compiled code."""
+    i = np.searchsorted(table_time, unixtime, side='right') - 1
+    i = np.minimum(np.maximum(i, 0), table_time.shape[0] - 1)
+    return table_deltat[i]
+
+
+def calculate_deltat_unixtime(unixtime):
+    """Calculate the difference between Terrestrial Dynamical Time (TD)
+    and Universal Time (UT) for unix timestamps.
+
+    Gives the same values as :py:func:`calculate_deltat` for the UTC year
+    and month of each timestamp, but times from 1800 to 2199 are looked up
+    in :py:data:`DELTAT_TABLE` with a binary search, which is much faster
+    than evaluating the polynomials.
+
+    Parameters
+    ----------
+    unixtime : numeric
+        Seconds since 1970-01-01 00:00:00 UTC.
+
+    Returns
+    -------
+    numpy array of delta T in seconds, NaN where unixtime is NaN.
+    """
+    unixtime = np.asarray(unixtime, dtype=np.float64)
+    shape = unixtime.shape
+    unixtime = unixtime.ravel()
+    table_time, table_deltat = DELTAT_TABLE
+    deltat = deltat_lookup(unixtime, table_time, table_deltat)
+
+    # evaluate the polynomials outside of the table
+    outside = ((unixtime < table_time[0])
+               | (unixtime >= _DELTAT_TABLE_END_TIME))
+    if outside.any():
+        months = unixtime[outside].astype('datetime64[s]').astype(
+            'datetime64[M]').astype(np.int64)
+        deltat[outside] = _calculate_deltat_polynomial(
+            months // 12 + 1970, months % 12 + 1)
+    deltat[np.isnan(unixtime)] = np.nan
+    return deltat.reshape(shape)
+
+
+def _build_deltat_table(start_year, end_year):
+    months = np.arange((start_year - 1970) * 12, (end_year - 1970) * 12)
+    year = months // 12 + 1970
+    month = months % 12 + 1
+    table_time = months.astype('datetime64[M]').astype(
+        'datetime64[s]').astype(np.float64)
+    return table_time, _calculate_deltat_polynomial(year, month)
+
+
+# monthly delta T for integer years from _DELTAT_TABLE_START_YEAR up to
+# _DELTAT_TABLE_END_YEAR: (unixtime of the start of each month, delta T)
+_DELTAT_TABLE_START_YEAR = 1800
+_DELTAT_TABLE_END_YEAR = 2200
+DELTAT_TABLE = _build_deltat_table(_DELTAT_TABLE_START_YEAR,
+                                   _DELTAT_TABLE_END_YEAR)
+_DELTAT_TABLE_END_TIME = float(np.datetime64(
+    f'{_DELTAT_TABLE_END_YEAR}-01-01', 's').astype(np.int64))
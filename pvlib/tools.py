@@ -4,7 +4,6 @@ Collection of functions used in pvlib_python
 
 import contextlib
 import datetime as dt
-import warnings
 
 import numpy as np
 import pandas as pd
@@ -251,8 +250,7 @@ def _doy_to_datetimeindex(doy, epoch_year=2014):
     """
     doy = np.atleast_1d(doy).astype('float')
     epoch = pd.Timestamp('{}-12-31'.format(epoch_year - 1))
-    timestamps = [epoch + dt.timedelta(days=adoy) for adoy in doy]
-    return pd.DatetimeIndex(timestamps)
+    return pd.DatetimeIndex(epoch + pd.to_timedelta(doy, unit='D'))
 
 
 def _datetimelike_scalar_to_doy(time):
@@ -376,51 +374,275 @@ def _golden_sect_DataFrame(params, lower, upper, func, atol=1e-8):
     This function will find the points where the function is maximized.
     Returns nan where lower or upper is nan, or where func evaluates to nan.
 
+    This is a wrapper of :py:func:`_golden_sect` for functions of a dict.
+
     See also
     --------
-    pvlib.singlediode._pwr_optfcn
+    _golden_sect
+    """
+    keys = list(params)
+    loc = object()  # a key that is not in params
+
+    def dict_func(x, *values):
+        return func({**dict(zip(keys, values)), loc: x}, loc)
+
+    return _golden_sect(dict_func, lower, upper,
+                        args=tuple(params[k] for k in keys), atol=atol)
+
+
+def _golden_sect(func, lower, upper, args=(), atol=1e-8):
+    """
+    Vectorized golden section search for finding maximum of a function of a
+    single variable.
+
+    Each iteration evaluates ``func`` once, only at the elements that have
+    not yet converged.
+
+    Parameters
+    ----------
+    func : function
+        Function to be maximized, in the form ``result = func(x, *args)``.
+        ``x`` and each entry of ``args`` are 1-D arrays of the same length.
+
+    lower : numeric
+        Lower bound for the optimization.
+
+    upper : numeric
+        Upper bound for the optimization.
+
+    args : tuple of numeric, optional
+        Additional arguments for ``func``. Broadcast with ``lower`` and
+        ``upper``.
+
+    atol : float, default 1e-8
+        Absolute tolerance on the location of the maximum.
+
+    Returns
+    -------
+    numeric
+        function evaluated at the optimal points
+
+    numeric
+        optimal points
+
+    Notes
+    -----
+    Returns nan where lower or upper is nan, or where func evaluates to nan.
     """
     if np.any(upper - lower < 0.):
         raise ValueError('upper >= lower is required')
 
+    scalar_out = np.isscalar(lower) and np.isscalar(upper) and \
+        all(map(np.isscalar, args))
+    lower, upper, *args = np.broadcast_arrays(lower, upper, *args)
+    shape = lower.shape
+    a = np.array(lower, dtype=np.float64).ravel()
+    b = np.array(upper, dtype=np.float64).ravel()
+    args = [np.asarray(arg).ravel() for arg in args]
+
     phim1 = (np.sqrt(5) - 1) / 2
+    x = np.full(a.shape, np.nan)
+    idx = np.flatnonzero(~np.isnan(a) & ~np.isnan(b))
+    a, b = a[idx], b[idx]
+    active_args = [arg[idx] for arg in args]
+
+    # interior points c < d, and the function at these points
+    step = phim1 * (b - a)
+    c = b - step
+    d = a + step
+    fc = np.asarray(func(c, *active_args), dtype=np.float64)
+    fd = np.asarray(func(d, *active_args), dtype=np.float64)
+    # work buffers, reused in each iteration
+    right = np.empty(idx.shape)
+    tmp = np.empty(idx.shape)
+
+    while idx.size:
+        done = np.abs(d - c) < atol
+        if done.any():
+            x[idx[done]] = 0.5 * (c[done] + d[done])
+            keep = ~done
+            idx = idx[keep]
+            a, b, c, d, fc, fd = \
+                a[keep], b[keep], c[keep], d[keep], fc[keep], fd[keep]
+            right, tmp, step = right[keep], tmp[keep], step[keep]
+            active_args = [arg[keep] for arg in active_args]
+            if not idx.size:
+                break
+
+        # the maximum is in [c, b] where f(d) > f(c), otherwise in [a, d].
+        # one of the interior points is reused, the function is evaluated
+        # at the other one. The bounds are updated arithmetically with
+        # right equal to 1 or 0, which is faster than masked assignment
+        np.copyto(right, fd > fc)
+        # a = c if right else a
+        np.subtract(c, a, out=tmp)
+        tmp *= right
+        a += tmp
+        # b = b if right else d
+        np.subtract(b, d, out=tmp)
+        tmp *= right
+        np.add(d, tmp, out=b)
+        np.subtract(b, a, out=step)
+        step *= phim1
+        np.subtract(b, step, out=c)
+        np.add(a, step, out=d)
+        # the new point is d if right else c
+        np.subtract(d, c, out=tmp)
+        tmp *= right
+        tmp += c
+        fnew = np.asarray(func(tmp, *active_args), dtype=np.float64)
+        right_mask = right.astype(bool)
+        fc, fd = (np.where(right_mask, fd, fnew),
+                  np.where(right_mask, fnew, fc))
+
+    # best estimate of location of maximum
+    func_result = np.asarray(func(x, *args), dtype=np.float64)
+    x = np.where(np.isnan(func_result), np.nan, x)
+    if scalar_out:
+        return func_result.item(), x.item()
+    return func_result.reshape(shape), x.reshape(shape)
+
 
-    df = params.copy()  # shallow copy to avoid modifying caller's dict
-    df['VH'] = upper
-    df['VL'] = lower
+def _chandrupatla(func, lower, upper, args=(), xtol=1e-12, rtol=None,
+                  maxiter=100, full_output=False):
+    """
+    Vectorized Chandrupatla's method for finding a root of a function of
+    a single variable within a bracket.
 
-    converged = False
+    The method combines bisection with inverse quadratic interpolation
+    [1]_. Elements are solved simultaneously and each iteration only
+    evaluates ``func`` at the elements that have not yet converged.
 
-    while not converged:
+    Parameters
+    ----------
+    func : function
+        Function whose root is sought, in the form
+        ``result = func(x, *args)``. ``x`` and each entry of ``args`` are
+        1-D arrays of the same length.
 
-        phi = phim1 * (df['VH'] - df['VL'])
-        df['V1'] = df['VL'] + phi
-        df['V2'] = df['VH'] - phi
+    lower : numeric
+        Lower end of the bracket.
 
-        df['f1'] = func(df, 'V1')
-        df['f2'] = func(df, 'V2')
-        df['SW_Flag'] = df['f1'] > df['f2']
+    upper : numeric
+        Upper end of the bracket.
 
-        df['VL'] = df['V2']*df['SW_Flag'] + df['VL']*(~df['SW_Flag'])
-        df['VH'] = df['V1']*~df['SW_Flag'] + df['VH']*(df['SW_Flag'])
+    args : tuple of numeric, optional
+        Additional arguments for ``func``. Broadcast with ``lower`` and
+        ``upper``.
 
-        err = abs(df['V2'] - df['V1'])
+    xtol : float, default 1e-12
+        Absolute tolerance on the root.
 
-        # handle all NaN case gracefully
-        with warnings.catch_warnings():
-            warnings.filterwarnings(action='ignore',
-                                    message='All-NaN slice encountered')
-            converged = np.all(err[~np.isnan(err)] < atol)
+    rtol : float, optional
+        Relative tolerance on the root. The default of four times the
+        machine epsilon locates the root to within a few ulp of its value.
 
-    # best estimate of location of maximum
-    df['max'] = 0.5 * (df['V1'] + df['V2'])
-    func_result = func(df, 'max')
-    x = np.where(np.isnan(func_result), np.nan, df['max'])
-    if np.isscalar(df['max']):
-        # np.where always returns an ndarray, converting scalars to 0d-arrays
-        x = x.item()
-
-    return func_result, x
+    maxiter : int, default 100
+        Maximum number of iterations.
+
+    full_output : bool, default False
+        If True, also return the number of iterations of each element.
+
+    Returns
+    -------
+    x : numpy.ndarray
+        Root of ``func``. NaN where ``func`` does not change sign between
+        ``lower`` and ``upper`` or evaluates to NaN.
+
+    converged : numpy.ndarray
+        Boolean array, True where the root was found to within tolerance.
+
+    niter : numpy.ndarray
+        Number of iterations of each element. 0 where the root is on a
+        bound or is not bracketed. Only returned if ``full_output=True``.
+
+    References
+    ----------
+    .. [1] T. R. Chandrupatla, "A new hybrid quadratic/bisection algorithm
+       for finding the zero of a nonlinear function without using
+       derivatives", Advances in Engineering Software, vol. 28, no. 3,
+       pp. 145-149, 1997. :doi:`10.1016/S0965-9978(96)00051-8`
+
+    See also
+    --------
+    pvlib.solarposition.sun_elevation_crossing_spa
+    """
+    lower, upper, *args = np.broadcast_arrays(lower, upper, *args)
+    shape = lower.shape
+    x1 = np.array(lower, dtype=np.float64).ravel()
+    x2 = np.array(upper, dtype=np.float64).ravel()
+    args = [np.asarray(a).ravel() for a in args]
+    f1 = np.asarray(func(x1, *args), dtype=np.float64)
+    f2 = np.asarray(func(x2, *args), dtype=np.float64)
+
+    x = np.full(x1.shape, np.nan)
+    converged = np.zeros(x1.shape, dtype=bool)
+    niter = np.zeros(x1.shape, dtype=int)
+    for xb, fb in ((x2, f2), (x1, f1)):
+        on_bound = fb == 0
+        x[on_bound] = xb[on_bound]
+        converged[on_bound] = True
+
+    # only bracketed elements that are not solved yet take part
+    idx = np.flatnonzero((np.sign(f1) * np.sign(f2) < 0) & ~converged)
+    x1, x2, f1, f2 = x1[idx], x2[idx], f1[idx], f2[idx]
+    t = np.full(idx.shape, 0.5)
+    xm = x1
+    if rtol is None:
+        rtol = 4 * np.finfo(np.float64).eps
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(maxiter):
+            if idx.size == 0:
+                break
+            niter[idx] += 1
+            xt = x1 + t * (x2 - x1)
+            ft = np.asarray(func(xt, *[a[idx] for a in args]),
+                            dtype=np.float64)
+            same = np.sign(ft) == np.sign(f1)
+            x3 = np.where(same, x1, x2)
+            f3 = np.where(same, f1, f2)
+            x2 = np.where(same, x2, x1)
+            f2 = np.where(same, f2, f1)
+            x1, f1 = xt, ft
+
+            use1 = np.abs(f1) < np.abs(f2)
+            xm = np.where(use1, x1, x2)
+            fm = np.where(use1, f1, f2)
+            tol = (rtol * np.abs(xm) + xtol) / 2
+            tlim = tol / np.abs(x2 - x1)
+            done = (tlim > 0.5) | (fm == 0)
+            x[idx[done]] = xm[done]
+            converged[idx[done]] = True
+            # a NaN from func stops the iteration for that element
+            done |= np.isnan(ft)
+
+            keep = ~done
+            idx = idx[keep]
+            x1, x2, x3 = x1[keep], x2[keep], x3[keep]
+            f1, f2, f3 = f1[keep], f2[keep], f3[keep]
+            tlim, xm = tlim[keep], xm[keep]
+
+            # inverse quadratic interpolation where it is safe,
+            # bisection otherwise
+            xi = (x1 - x2) / (x3 - x2)
+            phi = (f1 - f2) / (f3 - f2)
+            iqi = (phi**2 < xi) & ((1 - phi)**2 < 1 - xi)
+            t = np.where(
+                iqi,
+                f1 / (f2 - f1) * f3 / (f2 - f3)
+                + (x3 - x1) / (x2 - x1) * f1 / (f3 - f1) * f2 / (f3 - f2),
+                0.5)
+            t = np.clip(t, tlim, 1 - tlim)
+
+        # best estimate for elements that did not converge
+        if idx.size:
+            x[idx] = xm
+
+    if full_output:
+        return x.reshape(shape), converged.reshape(shape), niter.reshape(shape)
+    else:
+        return x.reshape(shape), converged.reshape(shape)
 
 
 def _get_sample_intervals(times, win_length):
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+import pytest
+
+import pvlib
+
+
+def _modules_after_import(statement):
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    out = subprocess.run([sys.executable, '-c', code], check=True,
+                         capture_output=True, text=True).stdout
+    return set(out.split())
+
+
+def test_import_pvlib_is_lazy():
+    modules = _modules_after_import('import pvlib')
+    for heavy in ['scipy', 'h5py', 'requests', 'pvlib.iotools',
+                  'pvlib.irradiance']:
+        assert heavy not in modules
+
+
+def test_import_irradiance_is_light():
+    modules = _modules_after_import('import pvlib.irradiance')
+    for heavy in ['h5py', 'requests', 'pvlib.iotools', 'pvlib.pvsystem']:
+        assert heavy not in modules
+
+
+@pytest.mark.parametrize('module', pvlib._submodules)
+def test_submodule_attribute(module):
+    assert getattr(pvlib, module).__name__ == f'pvlib.{module}'
+    assert module in dir(pvlib)
+
+
+@pytest.mark.parametrize('module', pvlib._submodules)
+def test_submodule_import_standalone(module):
+    # every submodule can be imported first without circular import errors
+    modules = _modules_after_import(f'import pvlib.{module}')
+    assert f'pvlib.{module}' in modules
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match='has no attribute'):
+        pvlib.not_a_module
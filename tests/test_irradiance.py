@@ -116,6 +116,34 @@ def test_get_extra_radiation_nrel_numba(times):
                     [1322.332316, 1322.296282, 1322.261205, 1322.227091])
 
 
+@pytest.mark.parametrize('method', ['asce', 'spencer'])
+def test_get_extra_radiation_table(method):
+    # integer days of year are looked up in a table, other values use the
+    # series directly. both must agree
+    doy = np.arange(367)
+    expected = irradiance._earthsun_distance_factor_series(doy, method)
+    out = irradiance._earthsun_distance_factor(doy, method)
+    assert_allclose(out, expected, rtol=0, atol=0)
+    fractional = np.array([1.5, 100.25, 366.75])
+    assert_allclose(
+        irradiance._earthsun_distance_factor(fractional, method),
+        irradiance._earthsun_distance_factor_series(fractional, method))
+    out_of_range = np.array([-1, 400])
+    assert_allclose(
+        irradiance._earthsun_distance_factor(out_of_range, method),
+        irradiance._earthsun_distance_factor_series(out_of_range, method))
+    times = pd.date_range('2020-01-01', '2021-01-01', freq='6h')
+    out = irradiance.get_extra_radiation(times, method=method)
+    expected = 1366.1 * irradiance._earthsun_distance_factor_series(
+        times.dayofyear, method)
+    assert_series_equal(out, pd.Series(expected, index=times))
+
+
+def test_get_extra_radiation_list():
+    out = irradiance.get_extra_radiation([doy, doy], method='spencer')
+    assert_allclose(out, [value, value], atol=10)
+
+
 def test_get_extra_radiation_invalid():
     with pytest.raises(ValueError):
         irradiance.get_extra_radiation(300, method='invalid')
@@ -431,6 +459,41 @@ def test_perez_scalar():
     assert_allclose(out, 109.084332)
 
 
+def test_perez_sky_state(irrad_data, ephem_data, dni_et, relative_airmass):
+    dni = irrad_data['dni'].copy()
+    dni.iloc[2] = np.nan
+    args = (irrad_data['dhi'], dni, dni_et, ephem_data['apparent_zenith'],
+            relative_airmass)
+    state = irradiance.PerezSkyState(*args, model='sandiacomposite1988')
+    assert_allclose(state.ebin, [0, 6, 0, 6])
+    assert state.model == 'sandiacomposite1988'
+    assert np.isnan(state.F1.iloc[2]) and np.isnan(state.F2.iloc[2])
+    for surface_tilt, surface_azimuth in [(40, 180), (90, 90)]:
+        expected = irradiance.perez(
+            surface_tilt, surface_azimuth, irrad_data['dhi'], dni, dni_et,
+            ephem_data['apparent_zenith'], ephem_data['azimuth'],
+            relative_airmass, model='sandiacomposite1988',
+            return_components=True)
+        out = irradiance.perez(
+            surface_tilt, surface_azimuth, irrad_data['dhi'], dni, dni_et,
+            ephem_data['apparent_zenith'], ephem_data['azimuth'],
+            relative_airmass, return_components=True, sky_state=state)
+        assert_frame_equal(out, expected)
+
+
+def test__perez_coefficient_table():
+    F1c, F2c = irradiance._perez_coefficient_table('allsitescomposite1990')
+    assert F1c.shape == F2c.shape == (9, 3)
+    assert np.isnan(F1c[0]).all() and np.isnan(F2c[0]).all()
+    expected = irradiance._get_perez_coefficients('allsitescomposite1990')
+    assert_allclose(F1c[1:], expected[0])
+    assert_allclose(F2c[1:], expected[1])
+    assert not F1c.flags.writeable
+    # the parsed tables are cached
+    assert (irradiance._perez_coefficient_table('allsitescomposite1990')[0]
+            is F1c)
+
+
 def test_perez_driesse_scalar():
     # copied values from fixtures
     out = irradiance.perez_driesse(40, 180, 118.458, 939.954,
@@ -465,6 +528,49 @@ def test_get_sky_diffuse_missing_dni_extra():
             model='haydavies')
 
 
+@pytest.mark.parametrize('use_airmass', [True, False])
+def test_get_sky_diffuse_ensemble(irrad_data, ephem_data, dni_et,
+                                  relative_airmass, use_airmass):
+    airmass = relative_airmass if use_airmass else None
+    args = (40, 180, ephem_data['apparent_zenith'], ephem_data['azimuth'],
+            irrad_data['dni'], irrad_data['ghi'], irrad_data['dhi'])
+    out = irradiance.get_sky_diffuse_ensemble(*args, dni_extra=dni_et,
+                                              airmass=airmass)
+    models = ['isotropic', 'klucher', 'haydavies', 'reindl', 'king',
+              'perez', 'perez-driesse']
+    assert list(out.columns) == models
+    for model in models:
+        expected = irradiance.get_sky_diffuse(
+            *args, dni_extra=dni_et, airmass=airmass, model=model)
+        assert_series_equal(out[model], expected, check_names=False)
+
+
+def test_get_sky_diffuse_ensemble_arrays(irrad_data, ephem_data, dni_et):
+    surface_tilt = np.array([0., 20., 40., 90.])
+    args = (surface_tilt, 150, ephem_data['apparent_zenith'].values,
+            ephem_data['azimuth'].values, irrad_data['dni'].values,
+            irrad_data['ghi'].values, irrad_data['dhi'].values)
+    out = irradiance.get_sky_diffuse_ensemble(
+        *args, dni_extra=dni_et, airmass=2, models=['Perez', 'king'])
+    assert isinstance(out, dict)
+    assert list(out) == ['perez', 'king']
+    for model in out:
+        expected = irradiance.get_sky_diffuse(
+            *args, dni_extra=dni_et, airmass=2, model=model)
+        assert_allclose(out[model], expected)
+
+
+def test_get_sky_diffuse_ensemble_invalid():
+    with pytest.raises(ValueError, match='invalid model selection'):
+        irradiance.get_sky_diffuse_ensemble(
+            30, 180, 0, 180, 1000, 1100, 100, dni_extra=1360, airmass=1,
+            models=['isotropic', 'invalid'])
+    with pytest.raises(ValueError, match='dni_extra is required'):
+        irradiance.get_sky_diffuse_ensemble(
+            30, 180, 0, 180, 1000, 1100, 100, airmass=1,
+            models=['isotropic', 'reindl'])
+
+
 def test_get_sky_diffuse_missing_airmass(irrad_data, ephem_data, dni_et):
     # test assumes location is Tucson, AZ
     # calculated airmass should be the equivalent to fixture airmass
@@ -574,6 +680,65 @@ def test_get_total_irradiance_missing_airmass():
                                   'poa_ground_diffuse']
 
 
+@pytest.mark.parametrize('model', ['isotropic', 'klucher',
+                                   'haydavies', 'reindl', 'king',
+                                   'perez', 'perez-driesse'])
+def test_get_total_irradiance_multiorientation(
+        irrad_data, ephem_data, dni_et, relative_airmass, model):
+    surface_tilt = np.array([0, 32, 90, 32])
+    surface_azimuth = np.array([180, 180, 90, 270])
+    total = irradiance.get_total_irradiance_multiorientation(
+        surface_tilt, surface_azimuth,
+        ephem_data['apparent_zenith'], ephem_data['azimuth'],
+        dni=irrad_data['dni'], ghi=irrad_data['ghi'],
+        dhi=irrad_data['dhi'],
+        dni_extra=dni_et, airmass=relative_airmass,
+        model=model,
+        surface_type='urban')
+
+    assert list(total.keys()) == ['poa_global', 'poa_direct',
+                                  'poa_diffuse', 'poa_sky_diffuse',
+                                  'poa_ground_diffuse']
+    for i, (tilt, azimuth) in enumerate(zip(surface_tilt, surface_azimuth)):
+        expected = irradiance.get_total_irradiance(
+            tilt, azimuth,
+            ephem_data['apparent_zenith'], ephem_data['azimuth'],
+            dni=irrad_data['dni'], ghi=irrad_data['ghi'],
+            dhi=irrad_data['dhi'],
+            dni_extra=dni_et, airmass=relative_airmass,
+            model=model,
+            surface_type='urban')
+        for key, value in total.items():
+            assert value.shape == (4, len(ephem_data))
+            assert_allclose(value[i], expected[key], atol=1e-10)
+
+
+def test_get_total_irradiance_multiorientation_scalars():
+    total = irradiance.get_total_irradiance_multiorientation(
+        [32, 40], 180,
+        10, 180,
+        dni=1000, ghi=1100,
+        dhi=100,
+        dni_extra=1400,
+        model='perez')
+    for key, value in total.items():
+        expected = irradiance.get_total_irradiance(
+            [32, 40], 180, 10, 180, dni=1000, ghi=1100, dhi=100,
+            dni_extra=1400, model='perez')[key]
+        assert value.shape == (2, 1)
+        assert_allclose(value[:, 0], expected)
+
+
+def test_get_total_irradiance_multiorientation_errors():
+    with pytest.raises(ValueError, match='dni_extra is required'):
+        irradiance.get_total_irradiance_multiorientation(
+            32, 180, 10, 180, dni=1000, ghi=1100, dhi=100,
+            model='haydavies')
+    with pytest.raises(ValueError, match='1-D arrays'):
+        irradiance.get_total_irradiance_multiorientation(
+            np.ones((2, 2)), 180, 10, 180, dni=1000, ghi=1100, dhi=100)
+
+
 def test_poa_components(irrad_data, ephem_data, dni_et, relative_airmass):
     aoi = irradiance.aoi(40, 180, ephem_data['apparent_zenith'],
                          ephem_data['azimuth'])
@@ -750,6 +915,33 @@ def test_dirint_coeffs():
     assert coeffs[3, 2, 6, 3] == 1.032260
 
 
+def test__dirint_bins():
+    kt_prime = np.array([-0.1, 0, 0.24, 0.5, 0.8, 1, 1.1, np.nan])
+    zenith = np.array([-1, 0, 25, 50, 80, 95, np.inf, np.nan])
+    w = np.array([-2, -1, 0, 1, 2.5, 3, 10, np.nan])
+    delta_kt_prime = np.array([-1, 0, 0.015, 0.1, 0.3, 1, 1.5, np.nan])
+    kt_prime_bin, zenith_bin, w_bin, delta_kt_prime_bin = \
+        irradiance._dirint_bins(kt_prime, zenith, w, delta_kt_prime)
+    assert_allclose(kt_prime_bin, [0, 1, 2, 3, 6, 6, 0, 0])
+    assert_allclose(zenith_bin, [0, 1, 2, 3, 6, 6, 6, 0])
+    assert_allclose(w_bin, [0, 5, 1, 2, 3, 4, 4, 0])
+    assert_allclose(delta_kt_prime_bin, [7, 1, 2, 4, 6, 6, 0, 0])
+
+
+def test__dirint_coefficient_table():
+    table = irradiance._dirint_coefficient_table()
+    assert table.shape == (7, 7, 8, 6)
+    assert not table.flags.writeable
+    assert table is irradiance._dirint_coefficient_table()
+    assert_allclose(table[1:, 1:, 1:, 1:], irradiance._get_dirint_coeffs())
+    assert np.isnan(table[0]).all()
+    assert np.isnan(table[:, :, :, 0]).all()
+    coeffs = irradiance._dirint_coeffs(
+        np.array([0.5, np.nan]), np.array([30, 30]), np.array([-1, -1]),
+        np.array([-1, -1]))
+    assert_allclose(coeffs, [table[3, 2, 7, 5], np.nan])
+
+
 def test_dirint_min_cos_zenith_max_zenith():
     # map out behavior under difficult conditions with various
     # limiting kwargs settings
@@ -796,7 +988,7 @@ def test_ghi_from_poa_driesse(mocker):
         surface_tilt, surface_azimuth, zenith, azimuth,
         poa_global, dni_extra=1366.1)
 
-    expected = [22.089, 304.088, 931.143]
+    expected = [22.096, 304.080, 931.139]
     assert_allclose(expected, output, atol=0.001)
 
     # test series output
@@ -827,18 +1019,29 @@ def test_ghi_from_poa_driesse(mocker):
     # test xtol argument
     poa_global = pd.Series([20, 300, 1000], index=times)
     # test exception
-    xtol = -3.14159  # negative value raises exception in scipy.optimize.bisect
+    xtol = -3.14159  # negative value raises exception
     with pytest.raises(ValueError, match=rf"xtol too small \({xtol:g} <= 0\)"):
         output = irradiance.ghi_from_poa_driesse_2023(
             surface_tilt, surface_azimuth, zenith, azimuth,
             poa_global, dni_extra=1366.1, xtol=xtol)
     # test propagation
     xtol = 3.141592
-    bisect_spy = mocker.spy(irradiance, "bisect")
+    solver_spy = mocker.spy(irradiance.tools, "_chandrupatla")
     output = irradiance.ghi_from_poa_driesse_2023(
         surface_tilt, surface_azimuth, zenith, azimuth,
         poa_global, dni_extra=1366.1, xtol=xtol)
-    assert bisect_spy.call_args[1]["xtol"] == xtol
+    assert solver_spy.call_args[1]["xtol"] == xtol
+    # all elements are solved in one call
+    assert solver_spy.call_count == 1
+
+
+def test_ghi_from_poa_driesse_scalar():
+    ghi, conv, niter = irradiance.ghi_from_poa_driesse_2023(
+        30, 180, 45, 135, 300, dni_extra=1366.1, full_output=True)
+    assert_allclose(ghi, 304.080, atol=0.001)
+    assert conv
+    assert niter > 0
+    assert np.shape(ghi) == ()
 
 
 def test_gti_dirint():
@@ -897,7 +1100,7 @@ def test_gti_dirint():
     expected = pd.DataFrame(array(
         [[21.3592591,    0.,   21.3592591],
          [294.4985420,   66.25848451,  247.64671830],
-         [941.7943404,  727.50552952,  258.16276278]]),
+         [941.4018974,  726.37599416,  258.83173579]]),
         columns=expected_col_order, index=times)
 
     assert_frame_equal(output, expected)
@@ -919,11 +1122,21 @@ def test_gti_dirint():
     expected = pd.DataFrame(array(
         [[21.05796198,    0.,           21.05796198],
          [295.06070190,   38.20346345,  268.0467738],
-         [931.79627208,  689.81549269,  283.5817439]]),
+         [931.34858160,  688.49773784,  284.3723379]]),
         columns=expected_col_order, index=times)
 
     assert_frame_equal(output, expected)
 
+    # test full_output
+    output, converged, niter = irradiance.gti_dirint(
+        poa_global, aoi, zenith, azimuth, times, surface_tilt, surface_azimuth,
+        temp_dew=temp_dew, full_output=True)
+
+    assert_frame_equal(output, expected)
+    assert_series_equal(converged,
+                        pd.Series([False, True, True], index=times))
+    assert_series_equal(niter, pd.Series([6, 7, 6], index=times))
+
 
 def test_gti_dirint_data_error():
     times = pd.DatetimeIndex(
@@ -1177,6 +1390,40 @@ def test_aoi_and_aoi_projection(surface_tilt, surface_azimuth, solar_zenith,
         surface_tilt, surface_azimuth, solar_zenith, solar_azimuth)
     assert_allclose(aoi_projection, aoi_proj_expected, atol=1e-6)
 
+    solar_vector = irradiance.solar_unit_vector(solar_zenith, solar_azimuth)
+    aoi = irradiance.aoi(surface_tilt, surface_azimuth, solar_zenith,
+                         solar_azimuth, solar_vector=solar_vector)
+    assert_allclose(aoi, aoi_expected, atol=1e-5)
+
+    aoi_projection = irradiance.aoi_projection(
+        surface_tilt, surface_azimuth, solar_zenith, solar_azimuth,
+        solar_vector=solar_vector)
+    assert_allclose(aoi_projection, aoi_proj_expected, atol=1e-6)
+
+
+def test_solar_unit_vector_surface_normal():
+    east, north, up = irradiance.solar_unit_vector([0, 90, 90, 60],
+                                                   [0, 90, 180, 270])
+    assert_allclose(east, [0, 1, 0, -np.sqrt(3) / 2], atol=1e-12)
+    assert_allclose(north, [0, 0, -1, 0], atol=1e-12)
+    assert_allclose(up, [1, 0, 0, 0.5], atol=1e-12)
+    # the same convention applies to the surface normal
+    normal = irradiance.surface_normal([0, 90, 90, 60], [0, 90, 180, 270])
+    assert_allclose(normal, (east, north, up), atol=1e-12)
+
+
+def test_aoi_solar_vector_series():
+    index = pd.date_range('2020-06-01 06:00', freq='3h', periods=4)
+    solar_zenith = pd.Series([80., 40., 20., 50.], index=index)
+    solar_azimuth = pd.Series([70., 120., 180., 250.], index=index)
+    solar_vector = irradiance.solar_unit_vector(solar_zenith, solar_azimuth)
+    for surface_tilt, surface_azimuth in [(30, 180), (10, 90), (90, 270)]:
+        expected = irradiance.aoi(surface_tilt, surface_azimuth,
+                                  solar_zenith, solar_azimuth)
+        out = irradiance.aoi(surface_tilt, surface_azimuth, solar_zenith,
+                             solar_azimuth, solar_vector=solar_vector)
+        assert_series_equal(out, expected)
+
 
 def test_aoi_projection_precision():
     # GH 1185 -- test that aoi_projection does not exceed 1.0, and when
@@ -1454,3 +1701,161 @@ def test_diffuse_par_spitters():
         0.99591, 0.99576, 0.99472, 0.99270, 0.99283, 0.99406, 0.99581, 0.99591,
     ])  # fmt: skip
     assert_allclose(result, expected, atol=1e-5)
+
+
+@pytest.fixture
+def weather_chunks():
+    times = pd.date_range('20190620 05:00', freq='1h', periods=16,
+                          tz='Etc/GMT+7')
+    # approximate sun path from sunrise to after sunset
+    angle = np.linspace(0, 15 / 14 * np.pi, len(times))
+    zenith = 90 - 80 * np.sin(angle)
+    azimuth = np.linspace(60, 300, len(times))
+    ghi = 1000 * np.cos(np.radians(zenith)).clip(0)
+    ghi = ghi * (0.6 + 0.4 * np.sin(np.arange(len(times))))
+    weather = pd.DataFrame({'ghi': ghi, 'solar_zenith': zenith,
+                            'solar_azimuth': azimuth, 'temp_dew': 10.},
+                           index=times)
+    # an empty chunk and a chunk with a single row
+    chunks = [weather.iloc[:5], weather.iloc[5:5], weather.iloc[5:6],
+              weather.iloc[6:]]
+    return weather, chunks
+
+
+@pytest.mark.parametrize('model, kwargs', [
+    ('erbs', {}),
+    ('erbs_driesse', {}),
+    ('orgill_hollands', {}),
+    ('boland', {}),
+    ('louche', {}),
+    ('disc', {}),
+    ('dirint', {}),
+    ('dirint', {'use_delta_kt_prime': False}),
+])
+def test_iter_decomposition(weather_chunks, model, kwargs):
+    weather, chunks = weather_chunks
+    out = list(irradiance.iter_decomposition(iter(chunks), model, **kwargs))
+    # empty chunks are skipped
+    assert len(out) == 3
+    for result, chunk in zip(out, [chunks[0], chunks[2], chunks[3]]):
+        assert result.index.equals(chunk.index)
+    expected = irradiance._decompose(weather, model, **kwargs)
+    assert_frame_equal(pd.concat(out), expected)
+
+
+@pytest.mark.parametrize('model', ['erbs', 'erbs_driesse',
+                                   'orgill_hollands', 'boland', 'louche',
+                                   'disc', 'dirint'])
+def test_iter_decomposition_pressure(weather_chunks, model):
+    # pressure and temp_dew columns are only used by the models that accept
+    # them
+    weather, chunks = weather_chunks
+    pressure = 93193.
+    chunks = [c.assign(pressure=pressure) for c in chunks]
+    out = pd.concat(irradiance.iter_decomposition(chunks, model))
+    ghi, zenith, times = weather['ghi'], weather['solar_zenith'], \
+        weather.index
+    if model == 'disc':
+        dni = irradiance.disc(ghi, zenith, times, pressure=pressure)['dni']
+    elif model == 'dirint':
+        dni = irradiance.dirint(ghi, zenith, times, pressure=pressure,
+                                temp_dew=weather['temp_dew'])
+    else:
+        dni = getattr(irradiance, model)(ghi, zenith, times)['dni']
+    assert_series_equal(out['dni'], dni, check_names=False)
+    if model in ('disc', 'dirint'):
+        # the pressure column is used
+        default = irradiance._decompose(weather, model)
+        assert not np.allclose(out['dni'], default['dni'], equal_nan=True)
+
+
+def test_iter_decomposition_dirint(weather_chunks):
+    weather, chunks = weather_chunks
+    out = pd.concat(irradiance.iter_decomposition(chunks, 'dirint'))
+    expected = irradiance.dirint(weather['ghi'], weather['solar_zenith'],
+                                 weather.index, temp_dew=weather['temp_dew'])
+    assert_series_equal(out['dni'], expected, check_names=False)
+    # delta_kt_prime is not evaluated for each chunk independently
+    separate = pd.concat([
+        irradiance.dirint(c['ghi'], c['solar_zenith'], c.index,
+                          temp_dew=c['temp_dew'])
+        for c in chunks if len(c)])
+    assert not np.allclose(separate, expected, equal_nan=True)
+
+
+def test_iter_decomposition_invalid_model(weather_chunks):
+    _, chunks = weather_chunks
+    with pytest.raises(ValueError, match='invalid decomposition model'):
+        next(irradiance.iter_decomposition(chunks, 'foo'))
+
+
+def test_iter_total_irradiance(weather_chunks):
+    weather, chunks = weather_chunks
+    out = irradiance.iter_total_irradiance(
+        chunks, 30, 180, decomposition_model='dirint', model='perez')
+    out = pd.concat(out)
+    irrad = irradiance._decompose(weather, 'dirint')
+    poa = irradiance.get_total_irradiance(
+        30, 180, weather['solar_zenith'], weather['solar_azimuth'],
+        irrad['dni'], irrad['ghi'], irrad['dhi'],
+        dni_extra=irradiance.get_extra_radiation(weather.index),
+        model='perez')
+    expected = pd.concat([irrad, poa], axis=1)
+    assert_frame_equal(out, expected)
+
+
+def test_iter_total_irradiance_pressure(weather_chunks):
+    weather, chunks = weather_chunks
+    chunks = [c.assign(pressure=93193.) for c in chunks]
+    out = pd.concat(irradiance.iter_total_irradiance(chunks, 30, 180))
+    irrad = irradiance._decompose(weather, 'erbs')
+    poa = irradiance.get_total_irradiance(
+        30, 180, weather['solar_zenith'], weather['solar_azimuth'],
+        irrad['dni'], irrad['ghi'], irrad['dhi'])
+    assert_frame_equal(out, pd.concat([irrad, poa], axis=1))
+
+
+def test_decomposition_ensemble(irrad_data, ephem_data, times):
+    ghi = irrad_data['ghi']
+    zenith = ephem_data['zenith']
+    temp_dew = pd.Series([10., 12., 14., 12.], index=times)
+    out = irradiance.decomposition_ensemble(ghi, zenith, times,
+                                            pressure=93193.,
+                                            temp_dew=temp_dew)
+    expected = {
+        'erbs': irradiance.erbs(ghi, zenith, times),
+        'erbs_driesse': irradiance.erbs_driesse(ghi, zenith, times),
+        'orgill_hollands': irradiance.orgill_hollands(ghi, zenith, times),
+        'boland': irradiance.boland(ghi, zenith, times),
+        'louche': irradiance.louche(ghi, zenith, times),
+    }
+    expected['disc'] = {
+        'dni': irradiance.disc(ghi, zenith, times, pressure=93193.)['dni']}
+    expected['dirint'] = {
+        'dni': irradiance.dirint(ghi, zenith, times, pressure=93193.,
+                                 temp_dew=temp_dew)}
+    for model in ['disc', 'dirint']:
+        expected[model]['dhi'] = (
+            ghi - expected[model]['dni'] * np.cos(np.radians(zenith)))
+    assert list(out['dni'].columns) == list(expected)
+    for model, values in expected.items():
+        assert_allclose(out['dni', model], values['dni'])
+        assert_allclose(out['dhi', model], values['dhi'])
+
+
+def test_decomposition_ensemble_models(irrad_data, ephem_data, times):
+    ghi = irrad_data['ghi']
+    zenith = ephem_data['zenith']
+    out = irradiance.decomposition_ensemble(ghi, zenith, times,
+                                            models=['louche', 'erbs'],
+                                            max_zenith=80)
+    assert list(out.columns) == [('dni', 'louche'), ('dni', 'erbs'),
+                                 ('dhi', 'louche'), ('dhi', 'erbs')]
+    expected = irradiance.erbs(ghi, zenith, times, max_zenith=80)
+    assert_series_equal(out['dni', 'erbs'], expected['dni'],
+                        check_names=False)
+    expected = irradiance.louche(ghi, zenith, times, max_zenith=80)
+    assert_series_equal(out['dhi', 'louche'], expected['dhi'],
+                        check_names=False)
+    with pytest.raises(ValueError, match='invalid decomposition model'):
+        irradiance.decomposition_ensemble(ghi, zenith, times, models=['foo'])
@@ -294,6 +294,24 @@ def test_get_solarposition(expected_solpos, golden_mst):
     assert_frame_equal(expected_solpos, ephem_data[expected_solpos.columns])
 
 
+def test_get_solarposition_cache(golden_mst):
+    times = pd.date_range('2003-10-17', freq='1h', periods=24,
+                          tz=golden_mst.tz)
+    cache = pvlib.solarposition.SolarPositionCache()
+    location = Location(golden_mst.latitude, golden_mst.longitude,
+                        tz=golden_mst.tz, altitude=golden_mst.altitude,
+                        solar_position_cache=cache)
+    expected = golden_mst.get_solarposition(times, temperature=11)
+    first = location.get_solarposition(times, temperature=11)
+    second = location.get_solarposition(times, temperature=11)
+    assert_frame_equal(expected, first)
+    assert_frame_equal(expected, second)
+    assert (cache.hits, cache.misses) == (1, 1)
+    # a different temperature is a different result
+    location.get_solarposition(times, temperature=20)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
 def test_get_airmass(times):
     tus = Location(32.2, -111, 'US/Arizona', 700, 'Tucson')
     airmass = tus.get_airmass(times)
@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 
 from pvlib import iam, modelchain, pvsystem, temperature, inverter
+from pvlib import solarposition
 from pvlib.modelchain import ModelChain
 from pvlib.pvsystem import PVSystem
 from pvlib.location import Location
@@ -516,6 +517,19 @@ def test_prepare_inputs_albedo_in_weather(
     assert len(mc.results.albedo) == num_arrays
 
 
+def test_prepare_inputs_solar_position_cache(sapm_dc_snl_ac_system, location,
+                                             weather):
+    location.solar_position_cache = solarposition.SolarPositionCache()
+    mc = ModelChain(sapm_dc_snl_ac_system, location)
+    mc.prepare_inputs(weather)
+    expected = mc.results.solar_position
+    mc = ModelChain(sapm_dc_snl_ac_system, location, aoi_model='no_loss')
+    mc.prepare_inputs(weather)
+    assert_frame_equal(expected, mc.results.solar_position)
+    assert location.solar_position_cache.hits == 1
+    assert location.solar_position_cache.misses == 1
+
+
 def test_prepare_inputs_no_irradiance(sapm_dc_snl_ac_system, location):
     mc = ModelChain(sapm_dc_snl_ac_system, location)
     weather = pd.DataFrame()
@@ -1283,6 +1297,48 @@ def test_singlediode_dc_arrays(location, dc_model,
         assert isinstance(dc, (pd.Series, pd.DataFrame))
 
 
+def test_mpp_table_dc_model(location, cec_dc_snl_ac_system, weather):
+    system = cec_dc_snl_ac_system
+    expected = ModelChain(system, location, dc_model='cec',
+                          aoi_model='no_loss', spectral_model='no_loss')
+    expected.run_model(weather)
+    table = pvsystem.MaxPowerPointTable.from_module_parameters(
+        system.arrays[0].module_parameters, 'cec')
+    system.arrays[0].module_parameters['mpp_table'] = table
+    # the table is preferred when it is in the module parameters
+    mc = ModelChain(system, location, aoi_model='no_loss',
+                    spectral_model='no_loss')
+    assert mc.dc_model == mc.mpp_table
+    mc.run_model(weather)
+    assert isinstance(mc.results.dc, pd.DataFrame)
+    assert_frame_equal(mc.results.dc,
+                       expected.results.dc[['i_mp', 'v_mp', 'p_mp']],
+                       check_exact=False, atol=1e-4)
+    assert_series_equal(mc.results.ac, expected.results.ac,
+                        check_exact=False, atol=1e-3)
+
+
+def test_mpp_table_dc_model_arrays(location, cec_dc_snl_ac_arrays,
+                                   weather):
+    system = cec_dc_snl_ac_arrays
+    table = pvsystem.MaxPowerPointTable.from_module_parameters(
+        system.arrays[0].module_parameters, 'cec')
+    for array in system.arrays:
+        array.module_parameters = {'mpp_table': table}
+    mc = ModelChain(system, location, dc_model='mpp_table',
+                    aoi_model='no_loss', spectral_model='no_loss',
+                    temperature_model='sapm')
+    mc.run_model(weather)
+    assert isinstance(mc.results.dc, tuple)
+    assert len(mc.results.dc) == system.num_arrays
+    for dc in mc.results.dc:
+        assert isinstance(dc, pd.DataFrame)
+        assert not dc.isna().any().any()
+    with pytest.raises(ValueError, match='missing one or more required'):
+        ModelChain(system, location, dc_model='cec', aoi_model='no_loss',
+                   spectral_model='no_loss', temperature_model='sapm')
+
+
 @pytest.mark.parametrize('temp_model', [
     'sapm_temp', 'faiman_temp', 'pvsyst_temp', 'fuentes_temp',
     'noct_sam_temp'])
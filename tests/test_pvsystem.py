@@ -6,7 +6,8 @@ from numpy import nan, array
 import pandas as pd
 
 import pytest
-from .conftest import assert_series_equal, assert_frame_equal
+from .conftest import (assert_series_equal, assert_frame_equal,
+                       assert_index_equal)
 from numpy.testing import assert_allclose
 import unittest.mock as mock
 
@@ -1592,6 +1593,149 @@ def test_singlediode_array():
     assert_allclose(sd['i_mp'], expected, atol=1e-8)
 
 
+def test_singlediode_method_kwargs():
+    photocurrent = np.linspace(0, 10, 11)
+    args = (photocurrent, 1.943e-09, 0.094, 16, 0.473)
+    expected = pvsystem.singlediode(*args, method='lambertw')
+    out = pvsystem.singlediode(*args, method='newton',
+                               method_kwargs={'x0': 'batzelis', 'tol': 1e-10})
+    assert_frame_equal(out, expected, check_exact=False, atol=1e-8)
+    out = pvsystem.max_power_point(*args, method='newton',
+                                   method_kwargs={'x0': 'batzelis'})
+    assert_allclose(out['p_mp'], expected['p_mp'], atol=1e-6)
+    with pytest.raises(ValueError, match='full_output'):
+        pvsystem.singlediode(*args, method='newton',
+                             method_kwargs={'full_output': True})
+    with pytest.raises(ValueError, match='full_output'):
+        pvsystem.max_power_point(*args, method='newton',
+                                 method_kwargs={'full_output': True})
+    # one initial guess does not suit all points of the IV curve
+    with pytest.raises(ValueError, match="'x0' must be 'batzelis'"):
+        pvsystem.singlediode(*args, method='newton',
+                             method_kwargs={'x0': out['v_mp']})
+    with pytest.raises(ValueError, match="'x0' must be 'batzelis'"):
+        pvsystem.max_power_point(*args, method='newton',
+                                 method_kwargs={'x0': 8.})
+
+
+@pytest.mark.parametrize('model', ['cec', 'desoto', 'pvsyst'])
+@pytest.mark.parametrize('interpolation, atol', [('cubic', 1e-4),
+                                                 ('linear', 0.1)])
+def test_MaxPowerPointTable(cec_module_params, pvsyst_module_params, model,
+                            interpolation, atol):
+    module_parameters = (pvsyst_module_params if model == 'pvsyst'
+                         else cec_module_params)
+    table = pvsystem.MaxPowerPointTable.from_module_parameters(
+        module_parameters, model, interpolation=interpolation)
+    assert set(table.error) == {'i_mp', 'v_mp', 'p_mp'}
+    assert table.error['p_mp'] < atol
+
+    rng = np.random.default_rng(0)
+    effective_irradiance = rng.uniform(1, 1500, 1000)
+    temp_cell = rng.uniform(-40, 100, 1000)
+    system = pvsystem.PVSystem(module_parameters=module_parameters)
+    params = getattr(system, 'calcparams_' + model)(effective_irradiance,
+                                                    temp_cell)
+    expected = pvsystem.max_power_point(*params)
+    out = table.max_power_point(effective_irradiance, temp_cell)
+    for key in ['i_mp', 'v_mp', 'p_mp']:
+        # the error estimated at the centres of the grid cells is close to
+        # the maximum error
+        assert_allclose(out[key], expected[key], atol=1.5 * table.error[key])
+
+
+def test_MaxPowerPointTable_inputs(cec_module_params):
+    table = pvsystem.MaxPowerPointTable.from_module_parameters(
+        cec_module_params, 'cec', effective_irradiance=[100, 200, 500, 1000],
+        temp_cell=[0, 25, 50, 75], interpolation='linear')
+    expected = pvsystem.max_power_point(
+        *pvsystem.PVSystem(module_parameters=cec_module_params)
+        .calcparams_cec(500., 25.))
+    # grid points are exact
+    out = table.max_power_point(500., 25.)
+    assert isinstance(out, dict)
+    for key in ['i_mp', 'v_mp', 'p_mp']:
+        assert np.isscalar(out[key])
+        assert_allclose(out[key], expected[key])
+    # values outside of the grid are nan, arrays are broadcast
+    out = table.max_power_point(np.array([[50.], [500.], [np.nan]]),
+                                np.array([25., 100.]))
+    assert out['p_mp'].shape == (3, 2)
+    assert_allclose(out['p_mp'],
+                    [[np.nan, np.nan], [expected['p_mp'], np.nan],
+                     [np.nan, np.nan]])
+    index = pd.date_range('2019-01-01', freq='h', periods=2)
+    out = table.max_power_point(pd.Series([500., 2000.], index=index), 25.)
+    assert isinstance(out, pd.DataFrame)
+    assert_index_equal(out.index, index)
+    assert list(out.columns) == ['i_mp', 'v_mp', 'p_mp']
+    assert_allclose(out['p_mp'], [expected['p_mp'], np.nan])
+
+
+def test_MaxPowerPointTable_errors(cec_module_params):
+    with pytest.raises(ValueError, match='not a valid model'):
+        pvsystem.MaxPowerPointTable.from_module_parameters(
+            cec_module_params, 'sapm')
+    cec_module_params.pop('Adjust')
+    with pytest.raises(ValueError, match='missing parameters'):
+        pvsystem.MaxPowerPointTable.from_module_parameters(
+            cec_module_params, 'cec')
+    values = np.ones((4, 4))
+    with pytest.raises(ValueError, match='not a valid interpolation'):
+        pvsystem.MaxPowerPointTable(range(4), range(4), values, values,
+                                    values, interpolation='nearest')
+    with pytest.raises(ValueError, match='must have shape'):
+        pvsystem.MaxPowerPointTable(range(4), range(3), values, values,
+                                    values)
+    values[0, 0] = np.nan
+    with pytest.raises(ValueError, match='must not contain NaN'):
+        pvsystem.MaxPowerPointTable(range(4), range(4), values, values,
+                                    values)
+
+
+@pytest.mark.parametrize('interpolation', ['cubic', 'linear'])
+def test_MaxPowerPointTable_save_load(cec_module_params, tmp_path,
+                                      interpolation):
+    table = pvsystem.MaxPowerPointTable.from_module_parameters(
+        cec_module_params, 'cec', interpolation=interpolation)
+    table.save(tmp_path / 'table.npz')
+    loaded = pvsystem.MaxPowerPointTable.load(tmp_path / 'table.npz')
+    assert loaded.interpolation == interpolation
+    assert loaded.error == table.error
+    effective_irradiance = np.linspace(0, 1600, 17)
+    temp_cell = np.linspace(-50, 110, 17)
+    expected = table.max_power_point(effective_irradiance, temp_cell)
+    out = loaded.max_power_point(effective_irradiance, temp_cell)
+    for key in ['i_mp', 'v_mp', 'p_mp']:
+        assert_allclose(out[key], expected[key])
+    # tables without an error estimate
+    values = np.ones((4, 4))
+    pvsystem.MaxPowerPointTable(range(4), range(4), values, values,
+                                values).save(tmp_path / 'ones.npz')
+    assert pvsystem.MaxPowerPointTable.load(tmp_path / 'ones.npz').error \
+        is None
+
+
+def test_PVSystem_mpp_table(cec_module_params):
+    table = pvsystem.MaxPowerPointTable.from_module_parameters(
+        cec_module_params, 'cec')
+    module_parameters = {'mpp_table': table}
+    system = pvsystem.PVSystem(
+        arrays=[pvsystem.Array(pvsystem.FixedMount(0, 180),
+                               module_parameters=module_parameters),
+                pvsystem.Array(pvsystem.FixedMount(0, 180),
+                               module_parameters=module_parameters)]
+    )
+    out_one, out_two = system.mpp_table((500, 800), (25, 40))
+    for out, effective_irradiance, temp_cell in [(out_one, 500, 25),
+                                                 (out_two, 800, 40)]:
+        expected = table.max_power_point(effective_irradiance, temp_cell)
+        assert out == expected
+    with pytest.raises(ValueError,
+                       match="Length mismatch for per-array parameter"):
+        system.mpp_table(500, (25, 40))
+
+
 def test_singlediode_floats():
     out = pvsystem.singlediode(7., 6.e-7, .1, 20., .5, method='lambertw')
     expected = {'i_xx': 4.264060478,
@@ -1896,6 +2040,36 @@ def test_PVSystem_multiple_array_get_aoi():
     assert aoi_one > 0
 
 
+@pytest.mark.parametrize('mounts, ncalls', [
+    ([pvsystem.FixedMount(32, 135)], 0),
+    ([pvsystem.FixedMount(15, 135), pvsystem.FixedMount(32, 135)], 1),
+    ([pvsystem.FixedMount(32, 135), pvsystem.SingleAxisTrackerMount()], 0),
+    ([pvsystem.SingleAxisTrackerMount(), pvsystem.SingleAxisTrackerMount()],
+     0),
+])
+def test_PVSystem_get_aoi_solar_vector(mocker, mounts, ncalls):
+    # the sun position vector is only calculated when it is shared by
+    # several Arrays with a fixed orientation
+    system = pvsystem.PVSystem(arrays=[pvsystem.Array(m) for m in mounts])
+    zenith = pd.Series([30., 50.])
+    azimuth = pd.Series([225., 160.])
+    expected = [pvsystem.Array(m).get_aoi(zenith, azimuth) for m in mounts]
+    spy = mocker.spy(irradiance, 'solar_unit_vector')
+    aoi = system.get_aoi(zenith, azimuth)
+    assert spy.call_count == ncalls
+    aoi = aoi if isinstance(aoi, tuple) else (aoi,)
+    for result, result_expected in zip(aoi, expected):
+        assert_series_equal(result, result_expected)
+
+
+def test_Array_get_aoi_solar_vector():
+    array = pvsystem.Array(pvsystem.FixedMount(surface_tilt=32,
+                                               surface_azimuth=135))
+    solar_vector = irradiance.solar_unit_vector(30, 225)
+    aoi = array.get_aoi(30, 225, solar_vector=solar_vector)
+    assert np.round(aoi, 4) == 42.7408
+
+
 @pytest.fixture
 def solar_pos():
     times = pd.date_range(start='20160101 1200-0700',
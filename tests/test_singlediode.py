@@ -2,10 +2,14 @@
 testing single-diode methods using JW Bishop 1988
 """
 
+from importlib import reload
+import os
+import warnings
+
 import numpy as np
 import pandas as pd
 import scipy
-from pvlib import pvsystem
+from pvlib import pvsystem, singlediode, _singlediode_numba
 from pvlib.singlediode import (bishop88_mpp, estimate_voc, VOLTAGE_BUILTIN,
                                bishop88, bishop88_i_from_v, bishop88_v_from_i,
                                batzelis)
@@ -13,7 +17,7 @@ import pytest
 from numpy.testing import assert_array_equal
 from .conftest import TESTS_DATA_DIR
 
-from .conftest import chandrupatla, chandrupatla_available
+from .conftest import chandrupatla, chandrupatla_available, requires_numba
 
 POA = 888
 TCELL = 55
@@ -191,6 +195,26 @@ def test_singlediode_lambert_negative_voc(mocker):
     assert_array_equal(outs["v_oc"], [0, 0])
 
 
+def test_singlediode_lambertw_golden_sect(mocker, cec_module_spr_e20_327):
+    # the golden section search is used when scipy.optimize.elementwise
+    # is not available
+    spr_e20_327 = cec_module_spr_e20_327
+    x = pvsystem.calcparams_desoto(
+        effective_irradiance=np.array([0., 200., POA]),
+        temp_cell=np.array([25., 30., TCELL]),
+        alpha_sc=spr_e20_327['alpha_sc'], a_ref=spr_e20_327['a_ref'],
+        I_L_ref=spr_e20_327['I_L_ref'], I_o_ref=spr_e20_327['I_o_ref'],
+        R_sh_ref=spr_e20_327['R_sh_ref'], R_s=spr_e20_327['R_s'],
+        EgRef=1.121, dEgdT=-0.0002677)
+    expected = pvsystem.singlediode(*x, method='lambertw')
+    mocker.patch.dict('sys.modules', {'scipy.optimize.elementwise': None})
+    spy = mocker.spy(singlediode, '_golden_sect')
+    out = pvsystem.singlediode(*x, method='lambertw')
+    assert spy.call_count == 1
+    pd.testing.assert_frame_equal(out, expected, check_exact=False,
+                                  atol=1e-6)
+
+
 @pytest.mark.parametrize('method', ['lambertw', 'brentq', 'newton',
                                     chandrupatla])
 def test_v_from_i_i_from_v_precision(method, precise_iv_curves):
@@ -576,6 +600,141 @@ def test_bishop88_pdSeries_len_one(method, bishop88_arguments):
     bishop88_mpp(**bishop88_arguments, method=method)
 
 
+def test_bishop88_brentq_array(bishop88_arguments):
+    # array inputs are solved at once and agree with scalar brentq
+    args = {k: np.array([v, v, v]) for k, v in bishop88_arguments.items()}
+    args['photocurrent'] = args['photocurrent'] * np.array([0.2, 0.6, 1.])
+    kwargs = {'xtol': 1e-12}
+    current = np.array([0., 0.1, 0.5])
+    voltage = np.array([0., 30., 60.])
+    i_mp, v_mp, p_mp = bishop88_mpp(**args, method='brentq',
+                                    method_kwargs=kwargs)
+    v = bishop88_v_from_i(current, **args, method='brentq',
+                          method_kwargs=kwargs)
+    i = bishop88_i_from_v(voltage, **args, method='brentq',
+                          method_kwargs=kwargs)
+    for k in range(3):
+        scalar_args = {key: val[k] for key, val in args.items()}
+        mpp = bishop88_mpp(**scalar_args, method='brentq',
+                           method_kwargs=kwargs)
+        assert np.allclose((i_mp[k], v_mp[k], p_mp[k]), mpp, rtol=1e-10)
+        assert np.isclose(v[k], bishop88_v_from_i(
+            current[k], **scalar_args, method='brentq',
+            method_kwargs=kwargs), rtol=1e-10)
+        assert np.isclose(i[k], bishop88_i_from_v(
+            voltage[k], **scalar_args, method='brentq',
+            method_kwargs=kwargs), rtol=1e-10)
+
+
+def test_bishop88_brentq_array_nan(bishop88_arguments):
+    args = {k: np.array([v, v]) for k, v in bishop88_arguments.items()}
+    args['photocurrent'] = np.array([np.nan, args['photocurrent'][1]])
+    i_mp, v_mp, p_mp = bishop88_mpp(**args, method='brentq')
+    assert np.isnan(p_mp[0])
+    expected = bishop88_mpp(**{k: v[1] for k, v in args.items()},
+                            method='brentq')
+    assert np.allclose((i_mp[1], v_mp[1], p_mp[1]), expected)
+
+
+def test_bishop88_brentq_array_full_output(bishop88_arguments):
+    args = {k: np.array([v, v]) for k, v in bishop88_arguments.items()}
+    (i_mp, v_mp, p_mp), out = bishop88_mpp(
+        **args, method='brentq', method_kwargs={'full_output': True})
+    vd, converged, niter = out
+    assert vd.shape == (2,)
+    assert_array_equal(converged, [True, True])
+    assert np.all(niter > 0)
+    # same attributes as scipy's RootResults
+    assert_array_equal(out.root, vd)
+    assert out.converged is converged
+    assert out.iterations is niter
+
+
+def test_bishop88_brentq_array_errors(bishop88_arguments):
+    args = {k: np.array([v, v]) for k, v in bishop88_arguments.items()}
+    # not converged
+    with pytest.raises(RuntimeError, match='Failed to converge'):
+        bishop88_mpp(**args, method='brentq', method_kwargs={'maxiter': 2})
+    (_, _, p_mp), (_, converged, niter) = bishop88_mpp(
+        **args, method='brentq',
+        method_kwargs={'maxiter': 2, 'disp': False, 'full_output': True})
+    assert not converged.any()
+    assert_array_equal(niter, [2, 2])
+    # not bracketed, current larger than the short circuit current
+    with pytest.raises(ValueError, match='different signs'):
+        bishop88_v_from_i(args['photocurrent'] * 2, **args, method='brentq')
+
+
+@pytest.fixture
+def sde_params_array():
+    irrad = np.array([0., 10., 200., 500., 800., 1100.])
+    temp_cell = np.array([25., 0., 10., 40., 55., 70.])
+    return pvsystem.calcparams_cec(
+        irrad, temp_cell, alpha_sc=0.004539, a_ref=2.6373, I_L_ref=5.114,
+        I_o_ref=8.196e-10, R_sh_ref=381.68, R_s=1.065, Adjust=8.7,
+        EgRef=1.121, dEgdT=-0.0002677)
+
+
+def test_bishop88_newton_x0_batzelis(sde_params_array):
+    kwargs = {'full_output': True, 'tol': 1e-10}
+    warm = {**kwargs, 'x0': 'batzelis'}
+    mpp, out = bishop88_mpp(*sde_params_array, method='newton',
+                            method_kwargs=kwargs)
+    mpp_warm, out_warm = bishop88_mpp(*sde_params_array, method='newton',
+                                      method_kwargs=warm)
+    assert np.allclose(mpp, mpp_warm, rtol=1e-9, atol=1e-9)
+    assert out_warm.converged.all()
+    assert out_warm.iterations < out.iterations
+
+    current = np.array([0., 0., 0.5, 1., 3., 0.])
+    v, out = bishop88_v_from_i(current, *sde_params_array, method='newton',
+                               method_kwargs=kwargs)
+    v_warm, out_warm = bishop88_v_from_i(current, *sde_params_array,
+                                         method='newton', method_kwargs=warm)
+    assert np.allclose(v, v_warm, rtol=1e-9, atol=1e-9)
+    assert out_warm.iterations <= out.iterations
+
+    voltage = np.array([0., 5., 20., 30., 40., 45.])
+    i, out = bishop88_i_from_v(voltage, *sde_params_array, method='newton',
+                               method_kwargs=kwargs)
+    i_warm, out_warm = bishop88_i_from_v(voltage, *sde_params_array,
+                                         method='newton', method_kwargs=warm)
+    assert np.allclose(i, i_warm, rtol=1e-9, atol=1e-9)
+    assert out_warm.iterations <= out.iterations
+
+
+def test_bishop88_newton_x0_previous_solution(sde_params_array):
+    kwargs = {'full_output': True, 'tol': 1e-10}
+    mpp, out = bishop88_mpp(*sde_params_array, method='newton',
+                            method_kwargs=kwargs)
+    # start from the solution of a slightly different condition
+    params = (sde_params_array[0] * 1.001, *sde_params_array[1:])
+    expected = bishop88_mpp(*params, method='newton',
+                            method_kwargs={'tol': 1e-10})
+    mpp_warm, out_warm = bishop88_mpp(
+        *params, method='newton', method_kwargs={**kwargs, 'x0': out.root})
+    assert np.allclose(expected, mpp_warm, rtol=1e-9, atol=1e-9)
+    assert out_warm.iterations < out.iterations
+
+
+def test_bishop88_newton_x0_scalar():
+    args = {'photocurrent': 1., 'saturation_current': 9e-10, 'nNsVth': 4.,
+            'resistance_series': 4., 'resistance_shunt': 5000.0}
+    expected = bishop88_mpp(**args, method='newton')
+    (i_mp, v_mp, p_mp), out = bishop88_mpp(
+        **args, method='newton',
+        method_kwargs={'x0': 'batzelis', 'full_output': True})
+    assert np.allclose((i_mp, v_mp, p_mp), expected)
+    assert np.isscalar(out[0])
+    assert out[1].iterations > 0
+
+
+def test_bishop88_newton_x0_invalid(sde_params_array):
+    with pytest.raises(ValueError, match="x0 must be numeric or 'batzelis'"):
+        bishop88_mpp(*sde_params_array, method='newton',
+                     method_kwargs={'x0': 'voc'})
+
+
 def _sde_check_solution(i, v, il, io, rs, rsh, a, d2mutau=0., NsVbi=np.inf):
     vd = v + rs * i
     return il - io*np.expm1(vd/a) - vd/rsh - il*d2mutau/(NsVbi - vd) - i
@@ -606,6 +765,11 @@ def test_bishop88_init_cond(method):
     sde_params = pvsystem.calcparams_pvsyst(weather[:, 0], weather[:, 1], **p)
     # test _mpp
     result = bishop88_mpp(*sde_params, d2mutau=d2mutau, NsVbi=NsVbi)
+    if method == 'newton':
+        # the explicit initial guess converges to the same solution
+        result_x0 = bishop88_mpp(*sde_params, d2mutau=d2mutau, NsVbi=NsVbi,
+                                 method_kwargs={'x0': 'batzelis'})
+        assert np.allclose(result, result_x0)
     imp, vmp, pmp = result
     err = np.abs(_sde_check_solution(
         imp, vmp, sde_params[0], sde_params[1], sde_params[2], sde_params[3],
@@ -675,3 +839,174 @@ def test_batzelis_night():
                    nNsVth=1.7)
     for k, v in out.items():
         assert v > 0, k  # ensure all outputs >0 (not nan, etc)
+
+
+def _use_numba(monkeypatch):
+    # use the single diode kernels as if pvlib was imported with
+    # PVLIB_USE_NUMBA. Without numba, the kernels run as python loops.
+    monkeypatch.setattr(_singlediode_numba, 'USE_NUMBA', True)
+
+
+@pytest.mark.filterwarnings('ignore:overflow encountered',
+                            'ignore:invalid value encountered')
+@pytest.mark.parametrize('func', ['_lambertw_i_from_v', '_lambertw_v_from_i'])
+@pytest.mark.parametrize('case', ['cec', 'rs_zero', 'rsh_inf', 'overflow',
+                                  'invalid'])
+def test_lambertw_numba(sde_params_array, monkeypatch, func, case):
+    photocurrent, saturation_current, resistance_series, resistance_shunt, \
+        nNsVth = sde_params_array
+    args = {
+        'cec': sde_params_array,
+        # Rs = 0 and Rsh = inf have explicit solutions
+        'rs_zero': (photocurrent, saturation_current, 0., resistance_shunt,
+                    nNsVth),
+        'rsh_inf': (photocurrent, saturation_current, resistance_series,
+                    np.inf, nNsVth),
+        # the argument of lambertw overflows
+        'overflow': (photocurrent, saturation_current * 1e-30,
+                     resistance_series, resistance_shunt, nNsVth * 0.01),
+        'invalid': (photocurrent, saturation_current, -1., -1., np.nan),
+    }[case]
+    x = np.array([0., 1., 5., 20., 40., 60.])
+    func = getattr(singlediode, func)
+    expected = func(x, *args)
+    _use_numba(monkeypatch)
+    assert_array_equal(func(x, *args), expected)
+    # broadcasting and scalars
+    assert func(x[:, np.newaxis], *args).shape == (6, 6)
+    assert isinstance(func(0., 5., 1e-9, 1., 300., 2.), float)
+
+
+@pytest.mark.parametrize('d2mutau, NsVbi, breakdown_factor', [
+    (0., np.inf, 0.), (1.4, 268 * 0.9, 0.), (0., np.inf, 2e-3)])
+def test_bishop88_newton_numba(sde_params_array, monkeypatch, mocker,
+                               d2mutau, NsVbi, breakdown_factor):
+    kwargs = {'d2mutau': d2mutau, 'NsVbi': NsVbi,
+              'breakdown_factor': breakdown_factor, 'method': 'newton',
+              'method_kwargs': {'tol': 1e-10, 'full_output': True}}
+    voltage = np.array([-2., 5., 20., 30., 40., 45.])
+    current = np.array([0., 0., 0.5, 1., 3., 0.])
+    expected = (bishop88_mpp(*sde_params_array, **kwargs),
+                bishop88_i_from_v(voltage, *sde_params_array, **kwargs),
+                bishop88_v_from_i(current, *sde_params_array, **kwargs))
+    _use_numba(monkeypatch)
+    spy = mocker.spy(singlediode, 'newton')
+    out = (bishop88_mpp(*sde_params_array, **kwargs),
+           bishop88_i_from_v(voltage, *sde_params_array, **kwargs),
+           bishop88_v_from_i(current, *sde_params_array, **kwargs))
+    assert spy.call_count == 0  # scipy's newton is not called
+    for (result, output), (result_expected, output_expected) in zip(
+            out, expected):
+        np.testing.assert_allclose(result, result_expected, rtol=1e-10,
+                                   atol=1e-10)
+        np.testing.assert_allclose(output.root, output_expected.root,
+                                   rtol=1e-10, atol=1e-10)
+        assert output.converged.all()
+        assert not output.zero_der.any()
+        # elements stop iterating when they have converged
+        assert output.iterations <= output_expected.iterations
+
+
+def test_bishop88_newton_numba_options(sde_params_array, monkeypatch,
+                                       mocker):
+    _use_numba(monkeypatch)
+    spy = mocker.spy(singlediode, 'newton')
+    # scalars and unsupported options use scipy's newton
+    bishop88_mpp(1., 9e-10, 4., 5000., 4., method='newton')
+    bishop88_mpp(*sde_params_array, method='newton',
+                 method_kwargs={'x1': 30.})
+    assert spy.call_count == 2
+    # the initial guess is supported
+    mpp = bishop88_mpp(*sde_params_array, method='newton',
+                       method_kwargs={'x0': 'batzelis'})
+    assert spy.call_count == 2
+    np.testing.assert_allclose(mpp, bishop88_mpp(*sde_params_array,
+                                                 method='brentq'),
+                               atol=1e-6)
+    # convergence failures
+    args = (np.array([0., 5.]), 1e-9, 1., 300., 2.)
+    with pytest.raises(RuntimeError, match='all failed to converge after 1 '
+                                           'iterations'):
+        bishop88_mpp(np.array([5., 5.]), *args[1:], method='newton',
+                     method_kwargs={'maxiter': 1})
+    # no light converges immediately
+    with pytest.warns(RuntimeWarning, match='some failed to converge'):
+        bishop88_mpp(*args, method='newton', method_kwargs={'maxiter': 1})
+    # like scipy's newton for arrays, disp is ignored
+    with pytest.warns(RuntimeWarning, match='some failed to converge'):
+        _, out = bishop88_mpp(*args, method='newton',
+                              method_kwargs={'maxiter': 1, 'disp': False,
+                                             'full_output': True})
+    assert_array_equal(out.converged, [True, False])
+    assert out.iterations == 1
+
+
+@requires_numba
+def test_singlediode_numba_compiled(sde_params_array):
+    """Import the single diode kernels, compiling to numba"""
+    expected = pvsystem.singlediode(*sde_params_array, method='lambertw')
+    expected_mpp = bishop88_mpp(*sde_params_array, method='newton')
+    try:
+        os.environ['PVLIB_USE_NUMBA'] = '1'
+        reload(_singlediode_numba)
+        assert _singlediode_numba.USE_NUMBA
+        out = pvsystem.singlediode(*sde_params_array, method='lambertw')
+        pd.testing.assert_frame_equal(out, expected, check_exact=False,
+                                      rtol=1e-12, atol=1e-12)
+        mpp = bishop88_mpp(*sde_params_array, method='newton')
+        np.testing.assert_allclose(mpp, expected_mpp, rtol=1e-9, atol=1e-9)
+    finally:
+        del os.environ['PVLIB_USE_NUMBA']
+        reload(_singlediode_numba)
+
+
+@requires_numba
+@pytest.mark.parametrize('inputs', ['array', 'readonly', 'series',
+                                    'broadcast', 'scalar'])
+def test_singlediode_numba_compiled_inputs(sde_params_array, inputs):
+    args = {
+        'array': sde_params_array,
+        # broadcasting and pandas make readonly views of the inputs
+        'readonly': [np.broadcast_to(a, (6,)) for a in sde_params_array],
+        'series': [pd.Series(a) for a in sde_params_array],
+        'broadcast': (np.array([7., 6.]), 6e-7, 0.1, 20., 0.5),
+        'scalar': (7., 6e-7, 0.1, 20., 0.5),
+    }[inputs]
+
+    def solve():
+        with warnings.catch_warnings(record=True) as record:
+            warnings.simplefilter('always')
+            out = (
+                pvsystem.singlediode(*args, method='lambertw'),
+                pvsystem.i_from_v(10., *args, method='lambertw'),
+                pvsystem.v_from_i(1., *args, method='lambertw'),
+                bishop88_mpp(*args, method='newton'),
+                bishop88_i_from_v(10., *args, method='newton'),
+                bishop88_v_from_i(1., *args, method='newton'),
+            )
+        # the numpy functions also warn about invalid values
+        newton_warnings = [str(w.message) for w in record
+                           if 'encountered' not in str(w.message)]
+        return out, newton_warnings
+
+    expected, expected_warnings = solve()
+    try:
+        os.environ['PVLIB_USE_NUMBA'] = '1'
+        reload(_singlediode_numba)
+        assert _singlediode_numba.USE_NUMBA
+        out, out_warnings = solve()
+    finally:
+        del os.environ['PVLIB_USE_NUMBA']
+        reload(_singlediode_numba)
+    # the compiled kernels warn like scipy's newton
+    assert out_warnings == expected_warnings
+    if isinstance(expected[0], pd.DataFrame):
+        pd.testing.assert_frame_equal(out[0], expected[0], check_exact=False,
+                                      rtol=1e-12, atol=1e-12)
+    else:
+        for key in expected[0]:
+            np.testing.assert_allclose(out[0][key], expected[0][key],
+                                       rtol=1e-12, atol=1e-12)
+    for result, result_expected in zip(out[1:], expected[1:]):
+        np.testing.assert_allclose(result, result_expected, rtol=1e-9,
+                                   atol=1e-9)
@@ -6,7 +6,7 @@ import numpy as np
 import pandas as pd
 
 from .conftest import assert_frame_equal, assert_series_equal
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_array_equal
 import pytest
 import pytz
 
@@ -140,6 +140,126 @@ def test_spa_python_numpy_physical_dst(expected_solpos, golden):
     assert_frame_equal(expected_solpos, ephem_data[expected_solpos.columns])
 
 
+@pytest.mark.parametrize('how', [
+    'numpy', pytest.param('numba', marks=requires_numba)])
+@pytest.mark.parametrize('delta_t', [67.0, None])
+def test_spa_python_multisite(how, delta_t):
+    latitudes = np.array([32.2, 39.742476, -33.9])
+    longitudes = np.array([-111., -105.1786, 151.2])
+    altitudes = np.array([700., 1830.14, 20.])
+    with warnings.catch_warnings():
+        # don't warn on method reload
+        warnings.simplefilter("ignore")
+        result = solarposition.spa_python_multisite(
+            times_localized, latitudes, longitudes, altitude=altitudes,
+            temperature=11, delta_t=delta_t, how=how)
+        for j in range(3):
+            expected = solarposition.spa_python(
+                times_localized, latitudes[j], longitudes[j],
+                altitude=altitudes[j], temperature=11, delta_t=delta_t,
+                how=how)
+            for key in expected.columns:
+                assert result[key].shape == (3, len(times_localized))
+                assert_allclose(result[key][j], expected[key].values)
+
+
+@pytest.mark.parametrize('delta_t', [67.0, None])
+def test_spa_ephemeris(delta_t):
+    eph = solarposition.SPAEphemeris(times_localized, delta_t=delta_t)
+    assert_allclose(eph.earth_radius_vector,
+                    solarposition.nrel_earthsun_distance(
+                        times_localized, delta_t=delta_t).values)
+    result = eph.get_solarposition(tus.latitude, tus.longitude,
+                                   altitude=tus.altitude, temperature=11)
+    expected = solarposition.spa_python(
+        times_localized, tus.latitude, tus.longitude, altitude=tus.altitude,
+        temperature=11, delta_t=delta_t)
+    assert_frame_equal(result, expected)
+    result = solarposition.spa_python_multisite(
+        times_localized, [tus.latitude, 0.], [tus.longitude, 0.],
+        altitude=tus.altitude, temperature=11, spa_ephemeris=eph)
+    assert_allclose(result['azimuth'][0], expected['azimuth'].values)
+
+
+def test_spa_ephemeris_save_load(tmp_path):
+    eph = solarposition.SPAEphemeris(times_localized)
+    path = tmp_path / 'ephemeris.npz'
+    eph.save(path)
+    loaded = solarposition.SPAEphemeris.load(path)
+    pd.testing.assert_index_equal(loaded.time, times_localized)
+    assert_allclose(loaded.declination, eph.declination)
+    assert_frame_equal(loaded.get_solarposition(tus.latitude, tus.longitude),
+                       eph.get_solarposition(tus.latitude, tus.longitude))
+
+
+def test_spa_ephemeris_time_mismatch():
+    eph = solarposition.SPAEphemeris(times_localized)
+    with pytest.raises(ValueError, match='does not match'):
+        solarposition.spa_python(times_localized[1:], tus.latitude,
+                                 tus.longitude, spa_ephemeris=eph)
+
+
+@pytest.mark.parametrize('how', [
+    'numpy', pytest.param('numba', marks=requires_numba)])
+@pytest.mark.parametrize('latitude, longitude', [
+    (32.2, -111), (-23.4, 151.2), (0.5, 0), (66, 20)])
+def test_spa_python_interp(how, latitude, longitude):
+    times = pd.date_range('2020-12-20', '2021-01-10', freq='5min',
+                          tz='Etc/GMT+7')
+    with warnings.catch_warnings():
+        # don't warn on method reload
+        warnings.simplefilter("ignore")
+        result = solarposition.get_solarposition(
+            times, latitude, longitude, method='spa_interp', how=how)
+        expected = solarposition.spa_python(times, latitude, longitude,
+                                            how=how)
+    assert_allclose(result['zenith'], expected['zenith'], rtol=0, atol=1e-5)
+    assert_allclose(result['apparent_zenith'], expected['apparent_zenith'],
+                    rtol=0, atol=1e-5)
+    assert_allclose(result['equation_of_time'], expected['equation_of_time'],
+                    rtol=0, atol=1e-5)
+    # azimuth is ill-conditioned when the sun is close to zenith or nadir
+    mask = (expected['zenith'] > 1) & (expected['zenith'] < 179)
+    diff = (result['azimuth'] - expected['azimuth'] + 180) % 360 - 180
+    assert_allclose(diff[mask], 0, atol=1e-4)
+
+
+def test_spa_python_interp_delta_t():
+    times = pd.date_range('2020-01-01', freq='10min', periods=12, tz='UTC')
+    for delta_t in [None, np.full(len(times), 67.)]:
+        result = solarposition.spa_python_interp(times, 32.2, -111,
+                                                 delta_t=delta_t,
+                                                 interp_freq='30min')
+        expected = solarposition.spa_python(times, 32.2, -111,
+                                            delta_t=delta_t)
+        assert_allclose(result['zenith'], expected['zenith'], atol=1e-6)
+
+
+def test_spa_python_interp_unsorted():
+    times = pd.date_range('2020-01-01', freq='10min', periods=12, tz='UTC')
+    order = np.random.default_rng(0).permutation(len(times))
+    delta_t = np.linspace(60., 70., len(times))
+    expected = solarposition.spa_python_interp(times, 32.2, -111,
+                                               delta_t=delta_t,
+                                               interp_freq='30min')
+    result = solarposition.spa_python_interp(times[order], 32.2, -111,
+                                             delta_t=delta_t[order],
+                                             interp_freq='30min')
+    assert_frame_equal(result, expected.iloc[order])
+
+
+def test_spa_python_interp_sparse(mocker):
+    # a few times years apart are calculated exactly instead of on a grid
+    times = pd.DatetimeIndex(['2000-06-01 12:00', '2010-01-01 08:00',
+                              '2020-03-21 17:30'], tz='UTC')
+    spy = mocker.spy(spa, 'observer_independent')
+    result = solarposition.spa_python_interp(times, 32.2, -111)
+    assert_array_equal(spy.call_args[0][0],
+                       solarposition._datetime_to_unixtime(times))
+    expected = solarposition.spa_python(times, 32.2, -111)
+    assert_frame_equal(result, expected)
+
+
 @pytest.mark.parametrize('delta_t', [65.0, None, np.array([65, 65])])
 def test_sun_rise_set_transit_spa(expected_rise_set_spa, golden, delta_t):
     # solution from NLR SPA web calculator
@@ -184,6 +304,70 @@ def test_sun_rise_set_transit_spa(expected_rise_set_spa, golden, delta_t):
                        )
 
 
+@pytest.mark.parametrize('how', [
+    'numpy', pytest.param('numba', marks=requires_numba)])
+def test_sun_rise_set_transit_spa_multisite(how):
+    times = pd.date_range('2020-01-01', freq='7D', periods=53, tz='MST')
+    latitudes = np.array([39.742476, -35.0, 75.0])
+    longitudes = np.array([-105.1786, 0.0, 20.0])
+    with warnings.catch_warnings():
+        # don't warn on method reload
+        warnings.simplefilter("ignore")
+        result = solarposition.sun_rise_set_transit_spa_multisite(
+            times, latitudes, longitudes, how=how)
+        for j in range(3):
+            expected = solarposition.sun_rise_set_transit_spa(
+                times, latitudes[j], longitudes[j], how=how)
+            for key in ['sunrise', 'sunset', 'transit']:
+                assert result[key].shape == (3, len(times))
+                actual = pd.DatetimeIndex(result[key][j], tz='UTC')
+                diff = (actual - pd.DatetimeIndex(expected[key]))
+                assert (diff.isna() == actual.isna()).all()
+                assert (abs(diff[~diff.isna()]) < pd.Timedelta('1us')).all()
+    # polar night and midnight sun
+    assert np.isnat(result['sunrise'][2]).any()
+
+
+@pytest.mark.parametrize('how', [
+    'numpy', pytest.param('numba', marks=requires_numba)])
+def test_sun_elevation_crossing_spa(how):
+    times = pd.date_range('2020-01-01', freq='7D', periods=53, tz='MST')
+    latitudes = np.array([39.742476, -35.0, 75.0])
+    longitudes = np.array([-105.1786, 120.0, 20.0])
+    with warnings.catch_warnings():
+        # don't warn on method reload
+        warnings.simplefilter("ignore")
+        result = solarposition.sun_elevation_crossing_spa(
+            times, latitudes, longitudes, 15., temperature=11, how=how)
+        for j in range(3):
+            for key in ['rising', 'setting']:
+                assert result[key].shape == (3, len(times))
+                event = pd.DatetimeIndex(result[key][j], tz='UTC')
+                event = event[~event.isna()]
+                solpos = solarposition.spa_python(
+                    event, latitudes[j], longitudes[j], temperature=11,
+                    how=how)
+                assert_allclose(solpos['apparent_elevation'], 15., atol=1e-5)
+        # sunrise and sunset in the SPA sense
+        result = solarposition.sun_elevation_crossing_spa(
+            times, latitudes, longitudes, -0.8333, apparent=False, how=how)
+        expected = solarposition.sun_rise_set_transit_spa_multisite(
+            times, latitudes, longitudes, how=how)
+    for key, exp in [('rising', 'sunrise'), ('setting', 'sunset')]:
+        actual = pd.DatetimeIndex(result[key][:2].ravel(), tz='UTC')
+        exp = pd.DatetimeIndex(expected[exp][:2].ravel(), tz='UTC')
+        assert (abs(actual - exp) < pd.Timedelta('2min')).all()
+    # sun never reaches 15 degrees in the polar winter
+    assert np.isnat(result['rising'][2]).any()
+    assert not np.isnat(result['rising'][:2]).any()
+
+
+def test_sun_elevation_crossing_spa_tz_naive():
+    times = pd.date_range('2020-01-01', freq='D', periods=3)
+    with pytest.raises(ValueError, match='times must be localized'):
+        solarposition.sun_elevation_crossing_spa(times, 40., -105., 10.)
+
+
 @requires_ephem
 def test_sun_rise_set_transit_ephem(expected_rise_set_ephem, golden):
     # test for Golden, CO compare to USNO, using local midnight
@@ -414,6 +598,78 @@ def test_ephemeris_physical_no_tz(expected_solpos, golden_mst):
     assert_frame_equal(expected_solpos, ephem_data[expected_solpos.columns])
 
 
+def test_ephemeris_float32(golden_mst):
+    ephem_64 = solarposition.ephemeris(times_localized, golden_mst.latitude,
+                                       golden_mst.longitude)
+    ephem_32 = solarposition.ephemeris(times_localized, golden_mst.latitude,
+                                       golden_mst.longitude,
+                                       dtype=np.float32)
+    assert (ephem_32.dtypes == np.float32).all()
+    assert_frame_equal(ephem_64, ephem_32.astype(np.float64),
+                       check_exact=False, atol=1e-3, rtol=0)
+
+
+def test_ephemeris_array():
+    latitudes = np.array([32.2, 39.742476, -33.9])
+    longitudes = np.array([-111., -105.1786, 151.2])
+    unixtime = solarposition._datetime_to_unixtime(times_localized)
+    result = solarposition.ephemeris_array(
+        unixtime, latitudes[:, np.newaxis], longitudes[:, np.newaxis],
+        pressure=82000, temperature=11)
+    for j in range(3):
+        expected = solarposition.ephemeris(
+            times_localized, latitudes[j], longitudes[j], pressure=82000,
+            temperature=11)
+        for key in expected.columns:
+            assert result[key].shape == (3, len(times_localized))
+            assert_allclose(result[key][j], expected[key].values)
+    # scalar input
+    result = solarposition.ephemeris_array(unixtime[40], latitudes[0],
+                                           longitudes[0])
+    expected = solarposition.ephemeris(times_localized[40:41], latitudes[0],
+                                       longitudes[0])
+    for key in expected.columns:
+        assert_allclose(result[key], expected[key].iloc[0])
+
+
+def test_solar_position_cache(tmp_path):
+    cache = solarposition.SolarPositionCache(maxsize=2, path=tmp_path)
+    expected = solarposition.get_solarposition(times_localized, 32.2, -111)
+    result = cache.get_solarposition(times_localized, 32.2, -111)
+    assert_frame_equal(expected, result)
+    assert (cache.hits, cache.misses, len(cache)) == (0, 1, 1)
+
+    # modifying the returned DataFrame does not modify the cache
+    result['zenith'] = 0.
+    result = cache.get_solarposition(times_localized, 32.2, -111)
+    assert_frame_equal(expected, result)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # the same instants in another time zone share the cached result
+    times_utc = times_localized.tz_convert('UTC')
+    result = cache.get_solarposition(times_utc, 32.2, -111)
+    assert_frame_equal(expected.set_axis(times_utc), result)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # other arguments are part of the key, and the oldest entry is evicted
+    cache.get_solarposition(times_localized, 32.2, -111, method='ephemeris')
+    cache.get_solarposition(times_localized, 32.2, -111, temperature=30)
+    assert (cache.hits, cache.misses, len(cache)) == (2, 3, 2)
+    assert len(list(tmp_path.iterdir())) == 3
+
+    # evicted results are read back from disk, also by a new cache
+    cache = solarposition.SolarPositionCache(path=tmp_path)
+    result = cache.get_solarposition(times_localized, 32.2, -111)
+    assert_frame_equal(expected, result)
+    assert (cache.hits, cache.misses) == (1, 0)
+
+    other = tmp_path / 'other.npz'
+    other.touch()
+    cache.clear()
+    assert len(cache) == 0
+    assert list(tmp_path.iterdir()) == [other]
+
+
 def test_get_solarposition_error(golden):
     times = pd.date_range(datetime.datetime(2003, 10, 17, 13, 30, 30),
                           periods=1, freq='D', tz=golden.tz)
@@ -974,3 +1230,28 @@ def test_spa_python_numba_physical_dst(expected_solpos, golden):
                                               temperature=11, delta_t=67,
                                               atmos_refract=0.5667,
                                               how='numpy', numthreads=1)
+
+
+def test_sun_rise_set_transit_geometric_multisite():
+    times = pd.date_range('2020-01-01', freq='5D', periods=73,
+                          tz='US/Eastern')
+    latitudes = np.array([40.0, -20.0, 80.0])
+    longitudes = np.array([-75.0, -70.0, -80.0])
+    dayofyear = times.dayofyear
+    decl = solarposition.declination_spencer71(dayofyear)
+    eot = solarposition.equation_of_time_spencer71(dayofyear)
+    with pytest.raises(ValueError):
+        solarposition.sun_rise_set_transit_geometric_multisite(
+            times.tz_localize(None), latitudes, longitudes, decl, eot)
+    sr, ss, st = solarposition.sun_rise_set_transit_geometric_multisite(
+        times, latitudes, longitudes, decl, eot)
+    assert sr.shape == ss.shape == st.shape == (3, len(times))
+    for j in range(2):
+        expected = solarposition.sun_rise_set_transit_geometric(
+            times, latitudes[j], longitudes[j], decl, eot)
+        for actual, exp in zip((sr, ss, st), expected):
+            diff = pd.DatetimeIndex(actual[j], tz='UTC') - exp
+            assert (abs(diff) < pd.Timedelta('1us')).all()
+    # no sunrise during polar night or midnight sun
+    assert np.isnat(sr[2]).any()
+    assert not np.isnat(st[2]).any()
@@ -253,6 +253,52 @@ class SpaBase:
                             spa_out_0, 5)
         assert_almost_equal(np.array([[v, alpha, delta]]).T, spa_out_1, 5)
 
+    def test_observer_independent(self):
+        result = self.spa.observer_independent(unixtimes, delta_t, 1)
+        assert result.shape == (5, 1)
+        assert_almost_equal(np.array([[v, alpha, delta, R]]).T, result[:4], 5)
+
+    def test_solar_position_multisite(self):
+        times = np.array([unixtimes[0], unixtimes[0] + 3600,
+                          unixtimes[0] + 7200])
+        lats = np.array([lat, -33.9, 60.2])
+        lons = np.array([lon, 151.2, 24.9])
+        elevs = np.array([elev, 20., 50.])
+        result = self.spa.solar_position_multisite(
+            times, lats, lons, elevs, pressure, temp, delta_t, atmos_refract,
+            numthreads=2)
+        assert result.shape == (6, 3, 3)
+        assert_almost_equal(np.array([theta, theta0, e, e0, Phi]),
+                            result[:-1, 0, 0], 5)
+        for j in range(3):
+            expected = self.spa.solar_position(
+                times, lats[j], lons[j], elevs[j], pressure, temp, delta_t,
+                atmos_refract, numthreads=1)
+            assert_almost_equal(expected, result[:, j], 10)
+
+    def test_solar_position_elementwise(self):
+        times = np.array([unixtimes[0], unixtimes[0] + 3600,
+                          unixtimes[0] + 7200])
+        lats = np.array([lat, -33.9, 60.2])
+        lons = np.array([lon, 151.2, 24.9])
+        elevs = np.array([elev, 20., 50.])
+        result = self.spa.solar_position_elementwise(
+            times, lats, lons, elevs, pressure, temp, delta_t, atmos_refract,
+            numthreads=2)
+        assert result.shape == (6, 3)
+        assert_almost_equal(np.array([theta, theta0, e, e0, Phi]),
+                            result[:-1, 0], 5)
+        for j in range(3):
+            expected = self.spa.solar_position(
+                times[j:j+1], lats[j], lons[j], elevs[j], pressure, temp,
+                delta_t, atmos_refract, numthreads=1)
+            assert_almost_equal(expected[:, 0], result[:, j], 10)
+        # inputs are broadcast
+        result = self.spa.solar_position_elementwise(
+            times.reshape(3, 1), lats, lons, elevs, pressure, temp, delta_t,
+            atmos_refract)
+        assert result.shape == (6, 3, 3)
+
     def test_equation_of_time(self):
         eot = 14.64
         M = self.spa.sun_mean_longitude(JME)
@@ -338,6 +384,24 @@ class SpaBase:
         assert_almost_equal(sunrise/1e3, result[1]/1e3, 1)
         assert_almost_equal(sunset/1e3, result[2]/1e3, 1)
 
+    def test_transit_sunrise_sunset_multisite(self):
+        times = pd.date_range('2015-01-02', freq='30D', periods=13, tz='UTC')
+        times = _datetime_to_unixtime(times)
+        lats = np.array([39.0, -35.0, 39.917, 80.0])
+        lons = np.array([-105.0, 0.0, 116.383, 10.0])
+        result = self.spa.transit_sunrise_sunset_multisite(
+            times, lats, lons, 64.0, 1)
+        assert len(result) == 3
+        for j in range(4):
+            expected = self.spa.transit_sunrise_sunset(
+                times, lats[j], lons[j], 64.0, 1)
+            for r, e in zip(result, expected):
+                assert r.shape == (4, len(times))
+                assert_almost_equal(e, r[j], 6)
+        with pytest.raises(ValueError):
+            self.spa.transit_sunrise_sunset_multisite(
+                times, lats[:, None], lons[:, None], 64.0, 1)
+
     def test_earthsun_distance(self):
         result = self.spa.earthsun_distance(unixtimes, 64.0, 1)
         assert_almost_equal(R, result, 6)
@@ -355,6 +419,36 @@ class SpaBase:
         result_scalar = self.spa.calculate_deltat(year, month)
         assert_almost_equal(dt_actual, result_scalar)
 
+    def test_calculate_deltat_table(self):
+        years = np.repeat(np.arange(1790, 2211), 12)
+        months = np.tile(np.arange(1, 13), 2211 - 1790)
+        expected = self.spa._calculate_deltat_polynomial(years, months)
+        result = self.spa.calculate_deltat(years, months)
+        assert_almost_equal(expected, result, 9)
+
+    def test_calculate_deltat_unixtime(self):
+        times = pd.date_range('1700-01-01', '2262-01-01', freq='97D',
+                              tz='UTC')
+        unixtime = _datetime_to_unixtime(times)
+        expected = self.spa.calculate_deltat(np.asarray(times.year),
+                                             np.asarray(times.month))
+        result = self.spa.calculate_deltat_unixtime(unixtime)
+        assert_almost_equal(expected, result, 9)
+        # shape is preserved and NaN propagates
+        unixtime_2d = np.array([[unixtime[0], np.nan]])
+        result_2d = self.spa.calculate_deltat_unixtime(unixtime_2d)
+        assert result_2d.shape == (1, 2)
+        assert_almost_equal(expected[0], result_2d[0, 0], 9)
+        assert np.isnan(result_2d[0, 1])
+
+    def test_deltat_lookup(self):
+        table_time, table_deltat = self.spa.DELTAT_TABLE
+        unixtime = np.array([table_time[0] - 1., table_time[0],
+                             table_time[1] - 1., table_time[-1] + 1.])
+        result = self.spa.deltat_lookup(unixtime, table_time, table_deltat)
+        expected = table_deltat[[0, 0, 0, -1]]
+        assert_almost_equal(expected, result)
+
 
 class NumpySpaTest(unittest.TestCase, SpaBase):
     """Import spa without compiling to numba then run tests"""
@@ -415,6 +509,18 @@ class NumbaSpaTest(unittest.TestCase, SpaBase):
                 times, lat, lon, elev, pressure, temp, delta_t,
                 atmos_refract, numthreads=3, sst=True)[:3], 5)
 
+    def test_solar_position_global_numthreads(self):
+        import numba
+        default = numba.get_num_threads()
+        with self.spa._numba_threads(1):
+            assert numba.get_num_threads() == 1
+            result = self.spa.solar_position(
+                unixtimes, lat, lon, elev, pressure, temp, delta_t,
+                atmos_refract)
+        assert numba.get_num_threads() == default
+        assert_almost_equal(np.array([[theta, theta0, e, e0, Phi]]).T,
+                            result[:-1], 5)
+
 
 # Define extra test cases for issue #2077
 test_cases_issue_2207 = [
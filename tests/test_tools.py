@@ -99,6 +99,126 @@ def test__golden_sect_DataFrame_nans():
     assert np.allclose(x, expected, atol=1e-8, equal_nan=True)
 
 
+def _obj_test_golden_sect_array(x, c, n):
+    return x * (1. - c * x**n)
+
+
+def test__golden_sect():
+    c = np.array([1., 2., 1e6, 0.2, 1.])
+    n = np.array([1., 1., 6., 0.3, 1.])
+    lower = np.array([0., 0.001, 0., 0., 1.])
+    upper = np.array([1.1, 1.2, 1., 100., 1.])
+    expected = np.array([0.5, 0.25, 0.07230200263994839, 89.14332727531685,
+                         1.])
+    v, x = tools._golden_sect(_obj_test_golden_sect_array, lower, upper,
+                              args=(c, n))
+    assert_allclose(x, expected, atol=1e-8)
+    assert_allclose(v, _obj_test_golden_sect_array(x, c, n))
+    # scalars
+    v, x = tools._golden_sect(_obj_test_golden_sect_array, 0., 1.,
+                              args=(1., 1.))
+    assert np.isscalar(x)
+    assert np.isclose(x, 0.5, atol=1e-8)
+    assert np.isclose(v, 0.25)
+
+
+def test__golden_sect_nans():
+    c = np.array([1., np.nan, 1.])
+    lower = np.array([0., 0., np.nan])
+    upper = np.array([1.1, 1.2, 1.])
+    v, x = tools._golden_sect(_obj_test_golden_sect_array, lower, upper,
+                              args=(c, 1.))
+    assert_allclose(x, [0.5, np.nan, np.nan], atol=1e-8)
+    assert_allclose(v, [0.25, np.nan, np.nan])
+
+
+def test__golden_sect_evaluates_active_only():
+    # one new function evaluation per iteration, and only for the elements
+    # that have not converged
+    sizes = []
+
+    def func(x, c):
+        sizes.append(len(x))
+        return _obj_test_golden_sect_array(x, c, 1.)
+
+    lower = np.array([0., 0.])
+    upper = np.array([1., 1e-6])
+    v, x = tools._golden_sect(func, lower, upper, args=(np.ones(2),))
+    assert_allclose(x, [0.5, 1e-6], atol=5e-8)
+    # two initial evaluations, one per iteration and one for the result
+    assert sizes[:2] == [2, 2]
+    assert sizes[-1] == 2
+    assert sizes[-2] == 1
+    # the width shrinks by the golden ratio in each iteration
+    niter = len(sizes) - 3
+    assert niter == np.ceil(np.log(0.236 / 1e-8) / np.log(1.618))
+
+
+def _obj_test_chandrupatla(x, a, n):
+    return x**n - a
+
+
+@pytest.mark.parametrize('lower, upper, a, n, expected', [
+    (0., 2., 2., 2., np.sqrt(2.)),
+    (-5., 10., 27., 3., 3.),
+    (0., 100., 0.3, 0.2, 0.3**5),
+    (1., 3., 1., 2., 1.),  # root on a bound
+])
+def test__chandrupatla(lower, upper, a, n, expected):
+    x, converged = tools._chandrupatla(
+        _obj_test_chandrupatla, lower, upper, args=(a, n))
+    assert np.isclose(x, expected, rtol=0, atol=1e-12)
+    assert converged
+    assert np.shape(x) == ()
+
+
+def test__chandrupatla_vector():
+    a = np.array([[1., 8.], [2., np.nan]])
+    lower = np.array([0., 0.])
+    upper = np.array([[3., 3.], [1., 3.]])
+    x, converged = tools._chandrupatla(
+        _obj_test_chandrupatla, lower, upper, args=(a, 3.))
+    # root not bracketed and nan function values give nan
+    expected = np.array([[1., 2.], [np.nan, np.nan]])
+    assert_allclose(x, expected, atol=1e-12)
+    assert_allclose(converged, [[True, True], [False, False]])
+
+
+def test__chandrupatla_evaluates_active_only():
+    sizes = []
+
+    def func(x, a):
+        sizes.append(len(x))
+        return x - a
+
+    a = np.array([0.5, 0.25, 0.125, 1. / 3])
+    x, converged = tools._chandrupatla(func, 0., 1., args=(a,), xtol=1e-14)
+    assert_allclose(x, a, atol=1e-14)
+    assert converged.all()
+    # linear function converges in a few steps, with the dyadic roots
+    # converging first
+    assert sizes[:2] == [4, 4]
+    assert sizes[-1] < 4
+
+
+def test__chandrupatla_full_output():
+    a = np.array([2., 1., 8.])
+    upper = np.array([2., 1., 1.])
+    x, converged, niter = tools._chandrupatla(
+        _obj_test_chandrupatla, 0., upper, args=(a, 2.), full_output=True)
+    assert_allclose(x, [np.sqrt(2.), 1., np.nan], atol=1e-12)
+    assert_allclose(converged, [True, True, False])
+    # root on a bound and root not bracketed take no iterations
+    assert niter[0] > 0
+    assert_allclose(niter[1:], [0, 0])
+
+
+def test__chandrupatla_maxiter():
+    x, converged = tools._chandrupatla(np.cos, 0., 3., maxiter=2)
+    assert not converged
+    assert 0. < x < 3.
+
+
 def test_degrees_to_index_1():
     """Test that _degrees_to_index raises an error when something other than
     'latitude' or 'longitude' is passed."""
@@ -259,6 +379,13 @@ def test_djd_to_datetime():
     assert tools.djd_to_datetime(djd) == expected
 
 
+def test__doy_to_datetimeindex():
+    out = tools._doy_to_datetimeindex([1, 32.5, 366], epoch_year=2020)
+    expected = pd.DatetimeIndex(['2020-01-01', '2020-02-01 12:00',
+                                 '2020-12-31'])
+    pd.testing.assert_index_equal(out, expected)
+
+
 def test__file_context_manager():
     with tempfile.TemporaryDirectory() as td:
         # make a test file